@@ -6,18 +6,19 @@ except ImportError:
     __version__ = ''
 
 
-# Top-level API as exposed to users.
-from jdaviz.configs.cubeviz import Cubeviz  # noqa: F401
-from jdaviz.configs.imviz import Imviz  # noqa: F401
-from jdaviz.configs.mosviz import Mosviz  # noqa: F401
-from jdaviz.configs.rampviz import Rampviz  # noqa: F401
-from jdaviz.configs.specviz import Specviz  # noqa: F401
-from jdaviz.configs.specviz2d import Specviz2d  # noqa: F401
-from jdaviz.configs.deconfigged import App  # noqa: F401
-
-from jdaviz.utils import enable_hot_reloading  # noqa: F401
-from jdaviz.core.launcher import open  # noqa: F401
-
+import importlib
+
+# Top-level API as exposed to users.  These are only imported when first accessed (see
+# __getattr__ below) so that importing jdaviz does not import every configuration.
+_lazy_imports = {'Cubeviz': 'jdaviz.configs.cubeviz',
+                 'Imviz': 'jdaviz.configs.imviz',
+                 'Mosviz': 'jdaviz.configs.mosviz',
+                 'Rampviz': 'jdaviz.configs.rampviz',
+                 'Specviz': 'jdaviz.configs.specviz',
+                 'Specviz2d': 'jdaviz.configs.specviz2d',
+                 'App': 'jdaviz.configs.deconfigged',
+                 'enable_hot_reloading': 'jdaviz.utils',
+                 'open': 'jdaviz.core.launcher'}
 
 _expose = ['show', 'load', 'batch_load',
            'toggle_api_hints',
@@ -26,7 +27,8 @@ _expose = ['show', 'load', 'batch_load',
            'viewers',
            'new_viewers',
            'datasets',
-           'data_labels']
+           'data_labels',
+           'timing']
 _incl = ['enable_hot_reloading', '__version__', 'gca', 'get_all_apps', 'new_app']
 _temporary_incl = ['open', 'Cubeviz', 'Imviz', 'Mosviz', 'Rampviz', 'Specviz', 'Specviz2d']
 __all__ = _expose + _incl + _temporary_incl
@@ -109,6 +111,7 @@ def new_app(replace=False, set_as_current=True):
     # instance.  After the other configs pass their deprecation period, we should try to
     # rename the internal Application instance and/or merge functionality in with the
     # App class to avoid confusion.
+    from jdaviz.configs.deconfigged import App
     ca = App(api_hints_obj='jd')
     for hook in _new_app_hooks:
         hook(ca)
@@ -175,6 +178,10 @@ def __dir__():
 def __getattr__(name):
     if name in _expose:
         return getattr(gca(), name)
+    if name in _lazy_imports:
+        value = getattr(importlib.import_module(_lazy_imports[name]), name)
+        globals()[name] = value
+        return value
     if name in globals():
         return globals()[name]
     raise AttributeError()
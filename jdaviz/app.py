@@ -4,6 +4,8 @@ import pathlib
 import re
 import uuid
 import warnings
+import weakref
+from contextlib import contextmanager
 import ipyvue
 from astropy import units as u
 from astropy.nddata import NDData, NDDataArray
@@ -13,22 +15,25 @@ from echo import (CallbackProperty, DictCallbackProperty,
                   ListCallbackProperty, delay_callback)
 import numpy as np
 from glue.config import data_translator, settings as glue_settings
-from glue.core import HubListener
+from glue.core import BaseData, HubListener
+from glue.core.component_id import ComponentID
 from glue.core.link_helpers import LinkSame, LinkSameWithUnits
 from glue.core.message import (DataCollectionAddMessage,
                                DataCollectionDeleteMessage,
+                               NumericalDataChangedMessage,
                                SubsetCreateMessage,
                                SubsetUpdateMessage,
                                SubsetDeleteMessage)
-from glue.core.roi import CircularROI, CircularAnnulusROI, EllipticalROI, RectangularROI
+from glue.core.roi import CircularROI, CircularAnnulusROI, EllipticalROI, RectangularROI, Roi
 from glue.core.state_objects import State
 from glue.core.subset import (RangeSubsetState, RoiSubsetState,
-                              CompositeSubsetState, InvertState)
+                              CompositeSubsetState, InvertState, SubsetState)
 from glue.core.units import unit_converter
 from glue_astronomy.spectral_coordinates import SpectralCoordinates
 from glue_astronomy.translators.regions import roi_subset_state_to_region
 from glue_jupyter.app import JupyterApplication
 from glue_jupyter.common.toolbar_vuetify import read_icon
+from glue_jupyter.utils import get_ioloop
 from echo.vue import autoconnect_callbacks_to_vue
 from ipypopout import PopoutButton
 from ipyvuetify import VuetifyTemplate, theme as vuetify_theme
@@ -45,13 +50,15 @@ from jdaviz.core.events import (LoadDataMessage, NewViewerMessage, AddDataMessag
                                 SubsetRenameMessage, AddDataToViewerMessage,
                                 RemoveDataFromViewerMessage, ViewerAddedMessage,
                                 ViewerRemovedMessage, ViewerRenamedMessage, ChangeRefDataMessage,
-                                IconsUpdatedMessage, LayersFinalizedMessage)
+                                IconsUpdatedMessage, LayersFinalizedMessage,
+                                COALESCIBLE_MESSAGES)
 from jdaviz.core.loaders.resolvers.file.file import PresetFileResolver
 from jdaviz.core.loaders.resolvers.object.object import PresetObjectResolver
 from jdaviz.core.loaders.resolvers.url.url import PresetURLResolver
 from jdaviz.core.registries import (tool_registry, tray_registry,
                                     viewer_registry, viewer_creator_registry,
                                     data_parser_registry, loader_resolver_registry)
+from jdaviz.core.timing import TimingRecorder
 from jdaviz.core.tools import ICON_DIR
 from jdaviz.utils import (SnackbarQueue, alpha_index, alpha_index_to_int, data_has_valid_wcs,
                           layer_is_table_data, MultiMaskSubsetState,
@@ -63,7 +70,8 @@ from jdaviz.core.unit_conversion_utils import (is_unit_per_solid_angle,
                                                flux_unit_conversion,
                                                spectral_unit_conversion,
                                                supported_sq_angle_units,
-                                               viewer_flux_conversion_equivalencies)
+                                               viewer_flux_conversion_equivalencies,
+                                               _flux_conversion_plan)
 
 __all__ = ['PrivateApplication', 'ALL_JDAVIZ_CONFIGS', 'UnitConverterWithSpectral']
 
@@ -74,12 +82,41 @@ warnings.filterwarnings('ignore', message="The unit 'Angstrom' has been deprecat
                         "in the VOUnit standard")
 
 CONTAINER_TYPES = dict(row='gl-row', col='gl-col', stack='gl-stack')
+# seconds without a new trigger before live-updating plugin results are recomputed
+LIVE_RESULTS_DELAY = 0.2
 EXT_TYPES = dict(flux=['flux', 'sci'],
                  uncert=['ivar', 'err', 'var', 'uncert'],
                  mask=['mask', 'dq'])
 ALL_JDAVIZ_CONFIGS = ['cubeviz', 'specviz', 'specviz2d', 'mosviz', 'imviz']
 
 
+def _subset_state_key(state, depth=0):
+    """
+    Value-based key of a (possibly compound) subset state, used to detect whether a subset
+    actually changed.  ROIs can be modified in place, so the identity of the state is not
+    enough.  Anything that cannot be compared by value results in a key that never matches.
+    """
+    if state is None or isinstance(state, (str, bool, int, float, np.number)):
+        return state
+    if isinstance(state, ComponentID):
+        return ('cid', state.label, id(state))
+    if isinstance(state, np.ndarray):
+        return ('array', state.shape, state.tobytes())
+    if isinstance(state, (list, tuple)):
+        return tuple(_subset_state_key(item, depth + 1) for item in state)
+    if isinstance(state, (SubsetState, Roi)) and depth < 10:
+        return (state.__class__.__name__,) + tuple((k, _subset_state_key(v, depth + 1))
+                                                   for k, v in sorted(vars(state).items()))
+    return object()
+
+
+def _live_inputs_match(inputs, other):
+    # data entries are compared by identity (results replace, rather than modify, data), and
+    # in-place changes of their values by the version following each of them in the inputs
+    return len(inputs) == len(other) and all(a is b or (not isinstance(a, BaseData) and a == b)
+                                             for a, b in zip(inputs, other))
+
+
 @unit_converter('custom-jdaviz')
 class UnitConverterWithSpectral:
     def equivalent_units(self, data, cid, units):
@@ -126,6 +163,12 @@ class UnitConverterWithSpectral:
             # handle surface brightness units in image-like data
             return (values * u.Unit(original_units)).to_value(target_units)
         elif cid.label in ("flux"):
+            if (not target_units or original_units == target_units or
+                    _flux_conversion_plan(original_units,
+                                          target_units).kind != 'equivalencies'):
+                # no equivalencies are needed, so skip translating the data to a Spectrum
+                return flux_unit_conversion(values, original_units, target_units,
+                                            with_unit=False)
             try:
                 spec = data.get_object(cls=Spectrum)
             except RuntimeError:
@@ -449,6 +492,13 @@ class PrivateApplication(VuetifyTemplate, HubListener):
         #  can reference their state easily since glue does not store viewers
         self._viewer_store = {}
 
+        # Files already read (see jdaviz.core.loaders.preload), by filepath, for the
+        #  parsers to use instead of reading them again
+        self._preloaded_files = {}
+
+        # Opt-in recording of timing spans, exposed as the timing attribute of the helper
+        self._timing = TimingRecorder(self)
+
         # Flag to indicate a data rename operation is in progress
         # Handlers can check this to skip processing during renames
         self._renaming_data = False
@@ -466,6 +516,25 @@ class PrivateApplication(VuetifyTemplate, HubListener):
         # Convenient reference of all existing subset names
         self._reserved_labels = set([])
 
+        # Live-updating plugin results waiting to be recomputed (label: trigger generation)
+        # and the inputs each result was last computed from (label: key of inputs),
+        # see _schedule_live_plugin_results
+        self._live_results_pending = {}
+        self._live_results_generation = 0
+        self._live_results_inputs = {}
+        # number of in-place changes of the values of each data entry (data: version), which
+        # identify the state of the data the live-updating results depend on
+        self._data_versions = weakref.WeakKeyDictionary()
+
+        # Layer selects (the layer lists of data menus) waiting to rebuild their items once
+        # the current bulk operation or event-loop tick ends, see _delay_layer_select_update
+        self._pending_layer_select_updates = {}
+        self._layer_select_updates_delayed = 0
+
+        # Messages held back until the end of batch_messages (key: message)
+        self._batched_messages = {}
+        self._message_batch_depth = 0
+
         # Parse the yaml configuration file used to compose the front-end UI
         self.load_configuration(configuration)
 
@@ -502,6 +571,10 @@ class PrivateApplication(VuetifyTemplate, HubListener):
         self.hub.subscribe(self, DataCollectionDeleteMessage,
                            handler=self._on_data_deleted)
 
+        # Subscribe to the event fired when the values of data are changed in place
+        self.hub.subscribe(self, NumericalDataChangedMessage,
+                           handler=self._on_numerical_data_changed)
+
         self.hub.subscribe(self, AddDataToViewerMessage,
                            handler=lambda msg: self.add_data_to_viewer(
                                msg.viewer_reference, msg.data_label))
@@ -575,40 +648,207 @@ class PrivateApplication(VuetifyTemplate, HubListener):
                     continue
             yield (data, plugin_inputs)
 
-    def _update_live_plugin_results(self, trigger_data_lbl=None, trigger_subset=None):
-        for data, plugin_inputs in self._iter_live_plugin_results(trigger_data_lbl, trigger_subset):
-            # update and overwrite data
-            # make a new instance of the plugin to avoid changing any UI settings
-            plg = self._jdaviz_helper.plugins.get(data.meta.get('plugin'))._obj.new()
-            if not plg.supports_auto_update:
-                raise NotImplementedError(f"{data.meta.get('plugin')} does not support live-updates")  # noqa
-            plg.user_api.from_dict(plugin_inputs)
-            # keep auto-updating, even if the option is hidden from the user API
-            # (can remove this line if auto_update is exposed to the user API in the future)
-            plg.add_results.auto_update_result = True
+    def _live_plugin_results_inputs(self, plugin_inputs):
+        # key of everything a live-updating result depends on: the plugin inputs themselves and
+        # the current state of each subscribed data entry and subset
+        subscriptions = plugin_inputs.get('_subscriptions', {})
+        inputs = [repr({k: v for k, v in plugin_inputs.items() if k != '_subscriptions'})]
+        for attr in subscriptions.get('data', []):
+            label = plugin_inputs.get(attr)
+            data = (self.data_collection[label]
+                    if label in self.data_collection.labels else None)
+            inputs += [data, self._data_versions.get(data, 0) if data is not None else None]
+        for attr in subscriptions.get('subset', []):
+            label = plugin_inputs.get(attr)
+            subset_group = next((sg for sg in self.data_collection.subset_groups
+                                 if sg.label == label), None)
+            inputs.append(_subset_state_key(subset_group.subset_state)
+                          if subset_group is not None else None)
+        return inputs
+
+    def _update_live_plugin_result(self, data, plugin_inputs):
+        # update and overwrite data
+        inputs = self._live_plugin_results_inputs(plugin_inputs)
+        # make a new instance of the plugin to avoid changing any UI settings
+        plg = self._jdaviz_helper.plugins.get(data.meta.get('plugin'))._obj.new()
+        if not plg.supports_auto_update:
+            raise NotImplementedError(f"{data.meta.get('plugin')} does not support live-updates")  # noqa
+        plg.user_api.from_dict(plugin_inputs)
+        # keep auto-updating, even if the option is hidden from the user API
+        # (can remove this line if auto_update is exposed to the user API in the future)
+        plg.add_results.auto_update_result = True
+        try:
+            plg()
+        except Exception as e:
+            self.hub.broadcast(SnackbarMessage(
+                f"Auto-update for {plugin_inputs['add_results']['label']} failed: {e}",
+                sender=self, color="error"))
+        else:
+            # only a successful update is skipped the next time if its inputs are unchanged
+            self._live_results_inputs[data.label] = inputs
+
+    def _schedule_live_plugin_results(self, trigger_data_lbl=None, trigger_subset=None):
+        """
+        Queue the live-updating plugin results affected by the trigger to be recomputed once
+        no new triggers have been received for ``LIVE_RESULTS_DELAY`` seconds.  Bursts of
+        triggers (while dragging a subset, for example) are coalesced into a single update per
+        result, and results whose inputs did not actually change are not recomputed.
+        """
+        for data, _ in self._iter_live_plugin_results(trigger_data_lbl, trigger_subset):
+            self._live_results_generation += 1
+            self._live_results_pending[data.label] = self._live_results_generation
+
+        if not len(self._live_results_pending):
+            return
+
+        ioloop = get_ioloop()
+        if ioloop is None:  # not running in a kernel (i.e. tests or scripts)
+            self._process_live_plugin_results()
+            return
+
+        generation = self._live_results_generation
+        ioloop.call_soon_threadsafe(
+            lambda: ioloop.call_later(LIVE_RESULTS_DELAY,
+                                      lambda: self._process_live_plugin_results(generation)))
+
+    @contextmanager
+    def batch_messages(self):
+        """
+        Context manager to coalesce the messages broadcast on the hub within a block.
+
+        Messages of the types in `~jdaviz.core.events.COALESCIBLE_MESSAGES` (display
+        unit changes, visible layers of viewers, icons, subset updates and others which
+        describe the current state of something) are held back, and only the last one for
+        each key (e.g. the axis of a display unit change) is delivered once the (outermost)
+        block exits, except for updates of subsets deleted within the block.  All other
+        messages are delivered immediately, as usual.  The layer
+        lists of the data menus are also only updated once the block exits.
+        """
+        with self._delay_layer_select_updates():
+            self._message_batch_depth += 1
+            self._update_hub_broadcast()
             try:
-                plg()
-            except Exception as e:
-                self.hub.broadcast(SnackbarMessage(
-                    f"Auto-update for {plugin_inputs['add_results']['label']} failed: {e}",
-                    sender=self, color="error"))
+                yield
+            finally:
+                self._message_batch_depth -= 1
+                if not self._message_batch_depth:
+                    self._update_hub_broadcast()
+                    messages = list(self._batched_messages.values())
+                    self._batched_messages = {}
+                    for message in messages:
+                        self.hub.broadcast(message)
+
+    def _update_hub_broadcast(self):
+        # the broadcast method of the hub is only replaced (by _broadcast) while messages are
+        # batched or timed, so that broadcasting has no overhead at all otherwise
+        hub = self.hub
+        if self._message_batch_depth or self._timing.enabled:
+            hub.broadcast = self._broadcast
+        elif 'broadcast' in hub.__dict__:
+            del hub.broadcast
+
+    def _broadcast(self, message):
+        if self._message_batch_depth:
+            if isinstance(message, SubsetDeleteMessage):
+                # updates of a subset deleted within the batch are not delivered
+                self._batched_messages = {
+                    key: msg for key, msg in self._batched_messages.items()
+                    if not (key[0] is SubsetUpdateMessage and msg.subset is message.subset)}
+            coalesce_key = COALESCIBLE_MESSAGES.get(type(message))
+            if coalesce_key is not None:
+                key = (type(message), coalesce_key(message))
+                # delivered in the order of the last message for each key
+                self._batched_messages.pop(key, None)
+                self._batched_messages[key] = message
+                return
+        with self._timing.span(type(message).__name__, 'hub'):
+            type(self.hub).broadcast(self.hub, message)
+
+    @contextmanager
+    def _delay_layer_select_updates(self):
+        """
+        Delay rebuilding the items of layer selects which coalesce their updates (the layer
+        lists of data menus) until the end of the block, so that each is rebuilt once no matter
+        how many layers are added, removed or changed within it.
+        """
+        self._layer_select_updates_delayed += 1
+        try:
+            yield
+        finally:
+            self._layer_select_updates_delayed -= 1
+            if not self._layer_select_updates_delayed:
+                self._flush_layer_select_updates()
+
+    def _delay_layer_select_update(self, layer_select):
+        """
+        Queue rebuilding the items of ``layer_select`` until the end of the current
+        ``_delay_layer_select_updates`` block or, when running in a kernel, of the current
+        event-loop tick.  Returns whether the update was delayed (otherwise the items should
+        be rebuilt immediately).
+        """
+        ioloop = None
+        if not self._layer_select_updates_delayed:
+            ioloop = get_ioloop()
+            if ioloop is None:  # not running in a kernel (i.e. tests or scripts)
+                return False
+        schedule = ioloop is not None and not len(self._pending_layer_select_updates)
+        layer_select._update_pending = True
+        self._pending_layer_select_updates[id(layer_select)] = layer_select
+        if schedule:
+            ioloop.call_soon_threadsafe(self._flush_layer_select_updates)
+        return True
+
+    def _flush_layer_select_updates(self):
+        while len(self._pending_layer_select_updates):
+            layer_select = self._pending_layer_select_updates.pop(
+                next(iter(self._pending_layer_select_updates)))
+            layer_select._flush_pending_update()
+
+    def _process_live_plugin_results(self, generation=None):
+        if generation is not None and generation != self._live_results_generation:
+            # a newer trigger was received since this update was queued, which will
+            # handle all pending results once it is due
+            return
+
+        while len(self._live_results_pending):
+            label = next(iter(self._live_results_pending))
+            self._live_results_pending.pop(label)
+            if label not in self.data_collection.labels:
+                continue
+            data = self.data_collection[label]
+            plugin_inputs = data.meta.get('_update_live_plugin_results', None)
+            if plugin_inputs is None:
+                continue
+            prev_inputs = self._live_results_inputs.get(label)
+            if (prev_inputs is not None
+                    and _live_inputs_match(prev_inputs,
+                                           self._live_plugin_results_inputs(plugin_inputs))):
+                # nothing this result depends on has changed since it was last computed
+                continue
+            self._update_live_plugin_result(data, plugin_inputs)
 
     def _remove_live_plugin_results(self, trigger_data_lbl=None, trigger_subset=None):
         for data, plugin_inputs in self._iter_live_plugin_results(trigger_data_lbl, trigger_subset):
             self.hub.broadcast(SnackbarMessage(
                 f"Removing {data.label} due to deletion of {trigger_subset.label if trigger_subset is not None else trigger_data_lbl}",  # noqa
                 sender=self, color="warning"))
+            self._live_results_inputs.pop(data.label, None)
             self.data_item_remove(data.label)
 
     def _on_add_data_message(self, msg):
         self._on_layers_changed(msg)
-        self._update_live_plugin_results(trigger_data_lbl=msg.data.label)
+        self._schedule_live_plugin_results(trigger_data_lbl=msg.data.label)
+
+    def _on_numerical_data_changed(self, msg):
+        self._data_versions[msg.data] = self._data_versions.get(msg.data, 0) + 1
+        self._clear_object_cache(msg.data.label)
+        self._schedule_live_plugin_results(trigger_data_lbl=msg.data.label)
 
     def _on_subset_update_message(self, msg):
         # NOTE: print statements in here will require the viewer output_widget
         self._clear_object_cache(msg.subset.label)
         if msg.attribute == 'subset_state':
-            self._update_live_plugin_results(trigger_subset=msg.subset)
+            self._schedule_live_plugin_results(trigger_subset=msg.subset)
 
     def _on_subset_delete_message(self, msg):
         self._remove_live_plugin_results(trigger_subset=msg.subset)
@@ -3206,6 +3446,12 @@ class PrivateApplication(VuetifyTemplate, HubListener):
 
         self._clear_object_cache(msg.data.label)
 
+        # the inputs stored for live-updating results hold on to the data they depend on
+        self._live_results_inputs = {label: inputs
+                                     for label, inputs in self._live_results_inputs.items()
+                                     if label != msg.data.label
+                                     and not any(inp is msg.data for inp in inputs)}
+
         self._update_existing_data_in_dc(msg, data_added=False)
 
     def _create_data_item(self, data):
@@ -0,0 +1,3 @@
+# These components are used by (and use) the configurations, so importing them first
+# needs the configurations to be imported, see jdaviz/core/__init__.py
+import jdaviz.core  # noqa
@@ -1,8 +1,12 @@
 import numpy as np
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 import multiprocessing as mp
 import sys
 import os
+import threading
 
 try:
     from strauss.sonification import Sonification
@@ -64,10 +68,183 @@ def sonify_spectrum(spec, duration, overlap=0.05, system='mono', srate=44100, fm
     return soni.loop_channels['0'].values
 
 
+class AudioLRUCache:
+    """
+    Least-recently-used cache of audio buffers, bounded by the total memory of the
+    buffers it holds rather than by the number of entries.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Maximum total size (in bytes) of the cached buffers.  The least recently used
+        buffers are dropped when this is exceeded.
+    """
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._buffers = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._buffers
+
+    def __len__(self):
+        with self._lock:
+            return len(self._buffers)
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._buffers:
+                return default
+            self._buffers.move_to_end(key)
+            return self._buffers[key]
+
+    def put(self, key, buffer):
+        with self._lock:
+            if key in self._buffers:
+                self.nbytes -= self._buffers.pop(key).nbytes
+            self._buffers[key] = buffer
+            self.nbytes += buffer.nbytes
+            while self.nbytes > self.max_bytes and len(self._buffers) > 1:
+                _, dropped = self._buffers.popitem(last=False)
+                self.nbytes -= dropped.nbytes
+
+    def clear(self):
+        with self._lock:
+            self._buffers.clear()
+            self.nbytes = 0
+
+
+class LazySpaxelSounds(Mapping):
+    """
+    Read-only mapping of (x, y) spaxel coordinates to the sound of that spaxel, synthesizing
+    each sound the first time it is requested.  This is used in place of a dictionary of all
+    the pre-computed sounds in the data lookup of the Sonify Data plugin when sonifying lazily.
+
+    Parameters
+    ----------
+    listener : `CubeListenerData`
+        The (lazy) listener responsible for synthesizing the sounds.
+    """
+    def __init__(self, listener):
+        self.listener = listener
+        self._precompute_generation = 0
+        # a single worker, so that at most one neighborhood is synthesized at a time and
+        # requests superseded before they start return immediately
+        self._precompute_executor = ThreadPoolExecutor(max_workers=1,
+                                                       thread_name_prefix='sonify-precompute')
+
+    @property
+    def shape(self):
+        # shape of the coordinate grid, in the same (swapped, if spectral_axis_index=0) order
+        # as the keys of the eager data lookup
+        spatial_shape = [self.listener.cube.shape[i] for i in self.listener.spatial_inds]
+        if self.listener.spectral_axis_index == 0:
+            return spatial_shape[1], spatial_shape[0]
+        return tuple(spatial_shape)
+
+    def __contains__(self, key):
+        try:
+            x, y = key
+        except (TypeError, ValueError):
+            return False
+        return 0 <= x < self.shape[0] and 0 <= y < self.shape[1]
+
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        return self.listener.get_spaxel_signal(*key)
+
+    def __iter__(self):
+        return ((x, y) for x in range(self.shape[0]) for y in range(self.shape[1]))
+
+    def __len__(self):
+        return self.shape[0] * self.shape[1]
+
+    def precompute_around(self, key, radius=2):
+        """
+        Synthesize (in a background thread) the sounds of the spaxels within ``radius``
+        of ``key``, nearest first.  Any previous request that has not completed is abandoned.
+
+        Returns
+        -------
+        future : `~concurrent.futures.Future`
+            Future completing once the request is done (or abandoned).
+        """
+        self._precompute_generation += 1
+        generation = self._precompute_generation
+        x0, y0 = key
+        neighbors = sorted(((x, y)
+                            for x in range(x0 - radius, x0 + radius + 1)
+                            for y in range(y0 - radius, y0 + radius + 1)
+                            if (x, y) != (x0, y0) and (x, y) in self),
+                           key=lambda xy: (xy[0] - x0) ** 2 + (xy[1] - y0) ** 2)
+
+        def worker():
+            for neighbor in neighbors:
+                if generation != self._precompute_generation:
+                    # cursor has moved on
+                    return
+                self.listener.get_spaxel_signal(*neighbor)
+
+        return self._precompute_executor.submit(worker)
+
+
+class CombinedSonifiedGrid(Mapping):
+    """
+    Read-only mapping of (x, y) coordinates to the volume-weighted sum of the sounds of
+    all audible sonified layers in a viewer.  Combined sounds are computed on access
+    (and kept in a memory-bounded cache) so that the cost does not scale with the number of
+    spaxels when only a few are hovered.
+
+    Parameters
+    ----------
+    lookups : dict
+        Mapping of layer label to the (eager or lazy) mapping of coordinates to sounds.
+    volumes : dict
+        Mapping of layer label to volume (in percent).
+    max_bytes : int
+        Maximum memory of the cache of combined sounds.
+    """
+    def __init__(self, lookups, volumes, max_bytes=64 * 1024**2):
+        self.lookups = lookups
+        self.volumes = volumes
+        self._cache = AudioLRUCache(max_bytes)
+
+    def __contains__(self, key):
+        return any(key in lookup for lookup in self.lookups.values())
+
+    def __getitem__(self, key):
+        combined = self._cache.get(key)
+        if combined is not None:
+            return combined
+        # TODO: is there a better way to combine sounds or normalize them?
+        # TODO: apply 1/N or 1/N**0.5 normalisation per layer for N layers?
+        for label, lookup in self.lookups.items():
+            if key not in lookup:
+                continue
+            sound = (lookup[key] * (int(self.volumes[label]) / 100)).astype(int)
+            combined = sound if combined is None else combined + sound
+        if combined is None:
+            raise KeyError(key)
+        self._cache.put(key, combined)
+        return combined
+
+    def __iter__(self):
+        keys = {}
+        for lookup in self.lookups.values():
+            keys.update(dict.fromkeys(lookup))
+        return iter(keys)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
 class CubeListenerData:
     def __init__(self, cube, wlens, samplerate=44100, duration=1, overlap=0.05, buffsize=1024,
                  bdepth=16, wl_unit=None, audfrqmin=50, audfrqmax=1500, eln=False, vol=None,
-                 spectral_axis_index=2, n_cpu=None):
+                 spectral_axis_index=2, n_cpu=None, lazy=False, max_cache_bytes=256 * 1024**2):
         self.siglen = int(samplerate*(duration-overlap))
         self.cube = cube
         self.dur = duration
@@ -109,6 +286,20 @@ class CubeListenerData:
         self.cursig = np.zeros(self.siglen, dtype='int16')
         self.newsig = np.zeros(self.siglen, dtype='int16')
 
+        # in lazy mode, the sound of each spaxel is only synthesized when first requested
+        # (see get_spaxel_signal) and kept in a memory-bounded cache instead of sigcube
+        self.lazy = lazy
+        self.lo2hi = self.wlens.argsort()[::-1]
+        # per-spaxel amplitude scaling, in the same coordinates as the spatial axes of cube
+        self.spaxel_scale = None
+        if lazy:
+            self.sigcache = AudioLRUCache(max_cache_bytes)
+            # spaxels are synthesized one at a time, so that a spaxel requested from the
+            # viewer while the same one is being precomputed is only synthesized once
+            self._synth_lock = threading.Lock()
+            self.sigcube = None
+            return
+
         # ensure sigcube isn't too big before we initialise it
         slices = [slice(None),]*3
         slices[spectral_axis_index] = 0
@@ -126,12 +317,58 @@ class CubeListenerData:
         wsrt = np.sort([w1, w2])
         self.wl_bounds = tuple(wsrt)
 
+    def get_spaxel_signal(self, x, y):
+        """
+        Return the (int16) sound of a single spaxel, synthesizing it if it is not already
+        cached.  The coordinates follow the same convention as the keys of the data lookup
+        in the Sonify Data plugin.
+        """
+        if not self.lazy:
+            if self.spectral_axis_index in [2, -1]:
+                return self.sigcube[x, y, :]
+            return self.sigcube[:, y, x]
+
+        sig = self.sigcache.get((x, y))
+        if sig is not None:
+            return sig
+
+        with self._synth_lock:
+            sig = self.sigcache.get((x, y))
+            if sig is None:
+                sig = self._synthesize_spaxel_signal(x, y)
+                self.sigcache.put((x, y), sig)
+        return sig
+
+    def _synthesize_spaxel_signal(self, x, y):
+        if self.spectral_axis_index in [2, -1]:
+            flux = self.cube[x, y, self.lo2hi]
+            spatial_ind = (x, y)
+        else:
+            flux = self.cube[self.lo2hi, y, x]
+            spatial_ind = (y, x)
+
+        if flux.any():
+            sig = sonify_spectrum(flux, self.dur, srate=self.srate, fmin=self.audfrqmin,
+                                  fmax=self.audfrqmax, eln=self.eln)
+            sig = (sig*self.maxval).astype('int16')
+            if self.spaxel_scale is not None:
+                sig = (sig * self.spaxel_scale[spatial_ind]).astype('int16')
+        else:
+            sig = np.zeros(self.siglen, dtype='int16')
+        return sig
+
     def sonify_cube(self):
         """
         Iterate through the cube, convert each spectrum to a signal, and store
         in class attributes
         """
-        lo2hi = self.wlens.argsort()[::-1]
+        if self.lazy:
+            # sounds are synthesized on demand, only initialize the current signal
+            self.cursig[:] = self.get_spaxel_signal(0, 0)[:self.siglen]
+            self.newsig[:] = self.cursig[:]
+            return
+
+        lo2hi = self.lo2hi
 
         spaxels = generate_spaxel_list(self.cube, self.spectral_axis_index)
 
@@ -166,7 +403,7 @@ class CubeListenerData:
         cur = self.cursig
         new = self.newsig
         sdx = int(time.outputBufferDacTime*self.srate)
-        dxs = np.arange(sdx, sdx+frames).astype(int) % self.sigcube.shape[self.spectral_axis_index]
+        dxs = np.arange(sdx, sdx+frames).astype(int) % self.siglen
         if self.cbuff:
             outdata[:, 0] = (cur[dxs] * self.ofade).astype('int16')
             outdata[:, 0] += (new[dxs] * self.ifade).astype('int16')
@@ -1,12 +1,13 @@
 import threading
 import time
 import warnings
+from collections import deque
 from functools import cached_property
 
 import numpy as np
 from astropy import units as u
 from astropy.units import UnitsWarning
-from traitlets import Bool, Int, Unicode, observe
+from traitlets import Bool, Float, Int, Unicode, observe
 
 from jdaviz.configs.cubeviz.plugins.viewers import (
     WithSliceIndicator, WithSliceSelection,
@@ -30,6 +31,19 @@ from jdaviz.core.user_api import PluginUserApi
 __all__ = ['BaseSlicePlugin', 'SpectralSlice', 'RampSlice']
 
 
+def _nearest_sorted_index(sorted_values, value):
+    # equivalent to np.argmin(abs(sorted_values - value)) for sorted input
+    # (including returning the first index for ties), but with a binary search
+    ind = np.searchsorted(sorted_values, value)
+    if ind <= 0:
+        return 0
+    if ind >= len(sorted_values):
+        return len(sorted_values) - 1
+    if value - sorted_values[ind - 1] <= sorted_values[ind] - value:
+        return ind - 1
+    return ind
+
+
 class BaseSlicePlugin(PluginTemplateMixin, ViewerSelectMixin):
     """
     See the :ref:`Slice Plugin Documentation <slice>` for more details.
@@ -68,6 +82,7 @@ class BaseSlicePlugin(PluginTemplateMixin, ViewerSelectMixin):
 
     is_playing = Bool(False).tag(sync=True)
     play_interval = Int(200).tag(sync=True)  # milliseconds
+    play_fps = Float(0).tag(sync=True)  # achieved frame rate of the player
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -81,7 +96,8 @@ class BaseSlicePlugin(PluginTemplateMixin, ViewerSelectMixin):
 
         self._cached_properties = ['valid_selection_values', 'valid_selection_values_sorted',
                                    'valid_indicator_values', 'valid_indicator_values_sorted',
-                                   'valid_values', 'valid_values_sorted']
+                                   'valid_values', 'valid_values_sorted',
+                                   '_slice_lookup']
 
         self._indicator_initialized = False
         self._player = None
@@ -229,6 +245,7 @@ class BaseSlicePlugin(PluginTemplateMixin, ViewerSelectMixin):
         viewer = self._app.get_viewer(msg.viewer_id)
         self._connect_viewer(viewer)
         self._check_if_cube_viewer_exists()
+        self._clear_cache('_slice_lookup')
 
     def _on_viewer_removed(self, msg):
         self._check_if_cube_viewer_exists()
@@ -309,6 +326,24 @@ class BaseSlicePlugin(PluginTemplateMixin, ViewerSelectMixin):
     def valid_values_sorted(self):
         return self.valid_selection_values_sorted if self.cube_viewer_exists else self.valid_indicator_values_sorted  # noqa
 
+    @cached_property
+    def _slice_lookup(self):
+        # sorted slice values (and the mapping back to slice indices) for each slice selection
+        # viewer, so that changing the slice is a binary search instead of re-deriving the
+        # slice values of the viewer and taking the argmin on every step
+        lookup = {}
+        for viewer in self.slice_selection_viewers:
+            slice_values = np.asarray(viewer.slice_values, dtype=float)
+            order = np.argsort(slice_values, kind='stable')
+            lookup[viewer.reference_id] = (slice_values[order], order)
+        return lookup
+
+    def _slice_index_for_value(self, viewer, value):
+        sorted_values, order = self._slice_lookup[viewer.reference_id]
+        if not len(sorted_values):
+            return None
+        return int(order[_nearest_sorted_index(sorted_values, value)])
+
     @observe('value')
     def _on_value_updated(self, event):
         # convert to float (JS handles stripping any invalid characters)
@@ -319,9 +354,9 @@ class BaseSlicePlugin(PluginTemplateMixin, ViewerSelectMixin):
                 return
             return
         if self.snap_to_slice and not self.value_editing:
-            valid_values = self.valid_selection_values
+            valid_values = self.valid_selection_values_sorted
             if len(valid_values):
-                closest_ind = np.argmin(abs(valid_values - self.value))
+                closest_ind = _nearest_sorted_index(valid_values, self.value)
                 closest_value = valid_values[closest_ind]
                 if self.value != closest_value:
                     # cast to float in case closest_value is an integer (which would otherwise
@@ -332,7 +367,12 @@ class BaseSlicePlugin(PluginTemplateMixin, ViewerSelectMixin):
         for viewer in self.slice_indicator_viewers:
             viewer._set_slice_indicator_value(self.value)
         for viewer in self.slice_selection_viewers:
-            viewer.slice_value = self.value
+            if viewer.reference_id not in self._slice_lookup:  # pragma: no cover
+                # viewer added since the lookup was last built
+                self._clear_cache('_slice_lookup')
+            slice_ind = self._slice_index_for_value(viewer, self.value)
+            if slice_ind is not None:
+                viewer.slice = slice_ind
 
         self.hub.broadcast(SliceValueUpdatedMessage(value=self.value,
                                                     value_unit=self.value_unit,
@@ -364,12 +404,9 @@ class BaseSlicePlugin(PluginTemplateMixin, ViewerSelectMixin):
         valid_values = self.valid_values_sorted
         if not len(valid_values):
             return
-        current_ind = np.argmin(abs(valid_values - self.value))
-        if current_ind == 0:
-            # wrap
-            self.value = float(valid_values[len(valid_values) - 1])
-        else:
-            self.value = float(valid_values[current_ind - 1])
+        current_ind = _nearest_sorted_index(valid_values, self.value)
+        # wraps to the end when current_ind is 0
+        self.value = float(valid_values[current_ind - 1])
 
     def vue_play_next(self, *args):
         if self.is_playing:
@@ -377,12 +414,9 @@ class BaseSlicePlugin(PluginTemplateMixin, ViewerSelectMixin):
         valid_values = self.valid_values_sorted
         if not len(valid_values):
             return
-        current_ind = np.argmin(abs(valid_values - self.value))
-        if len(valid_values) <= current_ind + 1:
-            # wrap
-            self.value = float(valid_values[0])
-        else:
-            self.value = float(valid_values[current_ind + 1])
+        current_ind = _nearest_sorted_index(valid_values, self.value)
+        # wraps to the beginning when at the end
+        self.value = float(valid_values[(current_ind + 1) % len(valid_values)])
 
     def _player_worker(self):
         ts = float(self.play_interval) * 1e-3  # ms to s
@@ -390,16 +424,18 @@ class BaseSlicePlugin(PluginTemplateMixin, ViewerSelectMixin):
         if not len(valid_values):
             self.is_playing = False
             return
+        current_ind = _nearest_sorted_index(valid_values, self.value)
+        frame_times = deque(maxlen=10)
         while self.is_playing:
-            # recompute current_ind in case user has moved slider
-            # could optimize this by only recomputing after a select slice message
-            # (will only make a difference if argmin becomes approaches play_interval)
-            current_ind = np.argmin(abs(valid_values - self.value))
-            if len(valid_values) <= current_ind + 1:
-                # wrap
-                self.value = float(valid_values[0])
-            else:
-                self.value = float(valid_values[current_ind + 1])
+            if self.value != valid_values[current_ind]:
+                # user has moved the slider during playback
+                current_ind = _nearest_sorted_index(valid_values, self.value)
+            current_ind = (current_ind + 1) % len(valid_values)
+            self.value = float(valid_values[current_ind])
+
+            frame_times.append(time.perf_counter())
+            if len(frame_times) > 1:
+                self.play_fps = (len(frame_times) - 1) / (frame_times[-1] - frame_times[0])
             time.sleep(ts)
 
     def vue_play_start_stop(self, *args):
@@ -418,6 +454,7 @@ class BaseSlicePlugin(PluginTemplateMixin, ViewerSelectMixin):
 
         # Start
         self.is_playing = True
+        self.play_fps = 0
         self._player = threading.Thread(target=self._player_worker)
         self._player.start()
 
@@ -1,7 +1,10 @@
+import time
 import warnings
+
+import numpy as np
 import pytest
 
-from jdaviz.configs.cubeviz.plugins.slice.slice import SpectralSlice
+from jdaviz.configs.cubeviz.plugins.slice.slice import SpectralSlice, _nearest_sorted_index
 
 
 def test_slice(deconfigged_helper, spectrum1d_cube):
@@ -99,6 +102,32 @@ def test_slice(deconfigged_helper, spectrum1d_cube):
     # NOTE: Hard to check sl.slice here because it is non-deterministic.
 
 
+@pytest.mark.parametrize('value', [-5, 0, 0.5, 1, 2.2, 2.5, 7.4, 9, 20])
+def test_nearest_sorted_index(value):
+    sorted_values = np.array([0, 1, 2, 3, 7, 8, 9], dtype=float)
+    assert _nearest_sorted_index(sorted_values, value) == np.argmin(abs(sorted_values - value))
+
+
+def test_player_fps(deconfigged_helper, spectrum1d_cube_larger):
+    deconfigged_helper.load(spectrum1d_cube_larger, data_label='test', format='3D Spectrum')
+    sl = deconfigged_helper.plugins['Spectral Slice']._obj
+    fv = deconfigged_helper._app.get_viewer('3D Spectrum')
+    slice_values = sl.valid_values_sorted
+
+    # slice selection goes through the precomputed lookup
+    sl.value = slice_values[3]
+    assert fv.slice == 3
+
+    sl.play_interval = 10
+    sl.vue_play_start_stop()  # Start
+    try:
+        time.sleep(0.5)
+        assert sl.play_fps > 0
+    finally:
+        sl.vue_play_start_stop()  # Stop
+    assert not sl.is_playing
+
+
 def test_indicator_settings(deconfigged_helper, spectrum1d_cube):
     deconfigged_helper.load(spectrum1d_cube, data_label='test', format='3D Spectrum')
     app = deconfigged_helper._app
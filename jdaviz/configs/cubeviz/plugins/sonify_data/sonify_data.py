@@ -14,7 +14,8 @@ from jdaviz.core.template_mixin import (PluginTemplateMixin, DatasetSelectMixin,
                                         AddResultsMixin)
 from jdaviz.core.user_api import PluginUserApi
 from jdaviz.core.events import SnackbarMessage, AddDataMessage
-from jdaviz.configs.cubeviz.plugins.cube_listener import CubeListenerData, INT_MAX
+from jdaviz.configs.cubeviz.plugins.cube_listener import (CubeListenerData, LazySpaxelSounds,
+                                                          INT_MAX)
 from jdaviz.core.sonified_layers import SonifiedLayerState
 
 __all__ = ['SonifyData']
@@ -53,6 +54,8 @@ class SonifyData(PluginTemplateMixin, DatasetSelectMixin, SpectralSubsetSelectMi
     # Removing UI option to vary these for now
     sample_rate = 44100  # IntHandleEmpty(44100).tag(sync=True)
     buffer_size = 2048  # IntHandleEmpty(2048).tag(sync=True)
+    # maximum memory used by the cache of synthesized sounds when sonifying lazily
+    lazy_cache_bytes = 256 * 1024**2
     assidx = FloatHandleEmpty(2.5).tag(sync=True)
     ssvidx = FloatHandleEmpty(0.65).tag(sync=True)
     eln = Bool(True).tag(sync=True)
@@ -62,6 +65,7 @@ class SonifyData(PluginTemplateMixin, DatasetSelectMixin, SpectralSubsetSelectMi
     pccut = IntHandleEmpty(20).tag(sync=True)
     volume = IntHandleEmpty(100).tag(sync=True)
     stream_active = Bool(True).tag(sync=True)
+    lazy_mode = Bool(False).tag(sync=True)
     has_strauss = Bool(_has_strauss).tag(sync=True)
 
     # TODO: can we referesh the list, so sounddevices are up-to-date when dropdown clicked?
@@ -250,12 +254,19 @@ class SonifyData(PluginTemplateMixin, DatasetSelectMixin, SpectralSubsetSelectMi
                                               wl_unit=self.sonification_wl_unit,
                                               audfrqmin=audfrqmin, audfrqmax=audfrqmax,
                                               eln=eln, vol=self.volume,
-                                              spectral_axis_index=spectrum.spectral_axis_index)
-
+                                              spectral_axis_index=spectrum.spectral_axis_index,
+                                              lazy=self.lazy_mode,
+                                              max_cache_bytes=self.lazy_cache_bytes)
+
+        spaxel_scale = pow(whitelight / whitelight.max(), ssvidx)
+        if self.lazy_mode:
+            # applied to each spaxel as it is synthesized
+            self.sonified_cube.spaxel_scale = np.squeeze(spaxel_scale,
+                                                         axis=spectrum.spectral_axis_index)
         self.sonified_cube.sonify_cube()
-        self.sonified_cube.sigcube = (
-                self.sonified_cube.sigcube * pow(whitelight / whitelight.max(),
-                                                 ssvidx)).astype('int16')
+        if not self.lazy_mode:
+            self.sonified_cube.sigcube = (self.sonified_cube.sigcube
+                                          * spaxel_scale).astype('int16')
         self.stream = sd.OutputStream(samplerate=sample_rate, blocksize=buffer_size, device=device,
                                       channels=1, dtype='int16', latency='low',
                                       callback=self.sonified_cube.player_callback)
@@ -263,12 +274,15 @@ class SonifyData(PluginTemplateMixin, DatasetSelectMixin, SpectralSubsetSelectMi
 
         spatial_inds = [0, 1, 2]
         spatial_inds.remove(spectrum.spectral_axis_index)
-        x_size = self.sonified_cube.sigcube.shape[spatial_inds[0]]
-        y_size = self.sonified_cube.sigcube.shape[spatial_inds[1]]
+        x_size = self.sonified_cube.cube.shape[spatial_inds[0]]
+        y_size = self.sonified_cube.cube.shape[spatial_inds[1]]
 
         # Create a new entry for the sonified layer in data_lookup. The value is a dictionary
         # containing (x_size * y_size) keys with values being arrays that represent sounds
-        if spectrum.spectral_axis_index == 2:
+        # (or, when sonifying lazily, a mapping which synthesizes those sounds on demand)
+        if self.lazy_mode:
+            self.data_lookup[results_label] = LazySpaxelSounds(self.sonified_cube)
+        elif spectrum.spectral_axis_index == 2:
             self.data_lookup[results_label] = {(x, y): self.sonified_cube.sigcube[x, y, :]
                                                for x in range(0, x_size)
                                                for y in range(0, y_size)}
@@ -302,6 +316,11 @@ class SonifyData(PluginTemplateMixin, DatasetSelectMixin, SpectralSubsetSelectMi
         # use cached version of combined sonified grid
         compsig = viewer.combined_sonified_grid[int(coord[0]), int(coord[1])]
 
+        # warm up the sounds of the neighboring spaxels of any lazily sonified layers
+        for lookup in viewer.combined_sonified_grid.lookups.values():
+            if isinstance(lookup, LazySpaxelSounds):
+                lookup.precompute_around((int(coord[0]), int(coord[1])))
+
         # Adjust volume to remove clipping
         if vollim == 'sig':
             # sigmoidal volume limiting
@@ -1,5 +1,8 @@
 import os
+import tracemalloc
+
 import astropy.units as u
+import numpy as np
 from numpy.testing import assert_allclose
 import pytest
 from specutils import SpectralRegion
@@ -62,3 +65,104 @@ def test_sonify_data_disabled(cubeviz_helper, spectrum1d_cube_larger):
     assert sonify_plg.disabled_msg
     with pytest.raises(ValueError, match='Unable to sonify cube'):
         sonify_plg.vue_sonify_cube()
+
+
+def rms(sig):
+    return np.sqrt(np.mean(sig.astype(float)**2))
+
+
+@pytest.mark.parametrize('spectral_axis_index', [0, 2])
+def test_lazy_sonification_matches_eager(spectral_axis_index):
+    from jdaviz.configs.cubeviz.plugins.cube_listener import (CubeListenerData,
+                                                              LazySpaxelSounds,
+                                                              CombinedSonifiedGrid)
+    rng = np.random.default_rng(42)
+    shape = [3, 4]
+    shape.insert(spectral_axis_index, 50)
+    cube = rng.uniform(0, 1, size=shape)
+    # silence spaxel (0, 1)
+    if spectral_axis_index == 2:
+        cube[0, 1, :] = 0
+    else:
+        cube[:, 1, 0] = 0
+    wlens = np.linspace(1, 2, 50)
+    kwargs = dict(duration=0.8, spectral_axis_index=spectral_axis_index, n_cpu=1)
+
+    eager = CubeListenerData(cube, wlens, **kwargs)
+    eager.sonify_cube()
+
+    # cache only big enough for two spaxels
+    siglen_bytes = eager.siglen * 2
+    lazy = CubeListenerData(cube, wlens, lazy=True, max_cache_bytes=2 * siglen_bytes, **kwargs)
+    assert lazy.sigcube is None
+    lazy.sonify_cube()
+    # synthesis uses random phases, so compare loudness rather than samples
+    assert_allclose(rms(lazy.cursig), rms(eager.cursig), rtol=0.3)
+
+    sounds = LazySpaxelSounds(lazy)
+    assert len(sounds) == 12
+    assert (3, 2) in sounds if spectral_axis_index == 0 else (2, 3) in sounds
+    assert (4, 4) not in sounds
+    for key in sounds:
+        assert_allclose(rms(sounds[key]), rms(eager.get_spaxel_signal(*key)), rtol=0.3)
+    # all-zero spectrum is silent
+    assert not sounds[(0, 1)].any()
+    assert len(lazy.sigcache) == 2
+    assert lazy.sigcache.nbytes <= 2 * siglen_bytes
+
+    grid = CombinedSonifiedGrid({'a': sounds, 'b': sounds}, {'a': 100, 'b': 50})
+    assert (0, 0) in grid
+    assert_allclose(grid[(0, 0)], (sounds[(0, 0)] * 1.5).astype(int), atol=1)
+
+
+def test_lazy_sonification_peak_memory():
+    from jdaviz.configs.cubeviz.plugins.cube_listener import CubeListenerData, LazySpaxelSounds
+
+    cube = np.random.default_rng(42).uniform(0, 1, size=(6, 6, 50))
+    wlens = np.linspace(1, 2, 50)
+    siglen_bytes = CubeListenerData(cube, wlens, duration=0.8, lazy=True).siglen * 2
+    lazy = CubeListenerData(cube, wlens, duration=0.8, lazy=True, n_cpu=1,
+                            max_cache_bytes=4 * siglen_bytes)
+    sounds = LazySpaxelSounds(lazy)
+    keys = list(sounds)
+
+    tracemalloc.start()
+    try:
+        # fill the cache
+        for key in keys[:4]:
+            sounds[key]
+        filled, filled_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        # the memory used does not grow when sonifying (many) more spaxels
+        for key in keys[4:]:
+            sounds[key]
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(lazy.sigcache) == 4
+    assert lazy.sigcache.nbytes <= 4 * siglen_bytes
+    # keeping all the sounds would take another 32 spaxels worth of memory (the margin
+    # here allows for variations in the temporary memory used while synthesizing)
+    assert current - filled < 4 * siglen_bytes
+    assert peak - filled_peak < 4 * siglen_bytes
+
+
+def test_lazy_sonification_precompute():
+    from jdaviz.configs.cubeviz.plugins.cube_listener import CubeListenerData, LazySpaxelSounds
+
+    cube = np.random.default_rng(42).uniform(0, 1, size=(6, 6, 50))
+    lazy = CubeListenerData(cube, np.linspace(1, 2, 50), duration=0.8, lazy=True, n_cpu=1)
+    sounds = LazySpaxelSounds(lazy)
+
+    # a request superseded by the next one is abandoned (after the spaxel being synthesized,
+    # held here until both requests are made), and the requests are processed one at a time
+    # by a single worker
+    with lazy._synth_lock:
+        superseded = sounds.precompute_around((0, 0), radius=1)
+        future = sounds.precompute_around((5, 5), radius=1)
+    future.result(timeout=60)
+    assert superseded.done()
+    assert len(sounds._precompute_executor._threads) == 1
+    assert all(key in lazy.sigcache for key in [(4, 4), (4, 5), (5, 4)])
+    assert (1, 1) not in lazy.sigcache
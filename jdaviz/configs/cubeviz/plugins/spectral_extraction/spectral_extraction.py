@@ -1,10 +1,13 @@
+import asyncio
 from functools import cached_property
+import threading
 
 import numpy as np
 import astropy
 from astropy import units as u
 from astropy.coordinates import SpectralCoord
 from astropy.nddata import NDDataArray, StdDevUncertainty
+from glue.core.message import DataCollectionDeleteMessage
 from traitlets import Any, Bool, Dict, Float, List, Unicode, observe
 
 from jdaviz.configs.cubeviz.plugins.viewers import CubevizImageView
@@ -128,6 +131,9 @@ class SpectralExtraction3D(PluginTemplateMixin, ApertureSubsetSelectMixin,
     aperture_method_items = List().tag(sync=True)
     aperture_method_selected = Unicode('Center').tag(sync=True)
 
+    # labels of the datasets with an automatic extraction running in the background
+    auto_extract_pending = List([]).tag(sync=True)
+
     conflicting_aperture_and_function = Bool(False).tag(sync=True)
     conflicting_aperture_error_message = Unicode('Aperture method Exact cannot be selected along'
                                                  ' with Min or Max.').tag(sync=True)
@@ -141,6 +147,9 @@ class SpectralExtraction3D(PluginTemplateMixin, ApertureSubsetSelectMixin,
             self.docs_link = f'https://jdaviz.readthedocs.io/en/{self.vdocs}/plugins/3d_spectral_extraction.html'  # noqa
 
         self.extracted_spec = None
+        # dataset label: (thread, cancelled event) of automatic extractions running in
+        # the background, see _extract_in_background
+        self._background_extractions = {}
 
         self.dataset.filters = ['is_flux_cube']
 
@@ -207,6 +216,8 @@ class SpectralExtraction3D(PluginTemplateMixin, ApertureSubsetSelectMixin,
                                    handler=self._on_slice_changed)
         self.hub.subscribe(self, GlobalDisplayUnitChanged,
                            handler=self._on_global_display_unit_changed)
+        self.hub.subscribe(self, DataCollectionDeleteMessage,
+                           handler=lambda msg: self._cancel_background_extraction(msg.data.label))
 
         self._update_disabled_msg()
 
@@ -334,6 +345,12 @@ class SpectralExtraction3D(PluginTemplateMixin, ApertureSubsetSelectMixin,
                                  auto_update=False, add_data=False):
         # create a new instance of the 3D Spectral Extraction plugin (to not
         # affect the instance in the tray) and extract the entire cube with defaults.
+        plg = self._new_extraction_instance(dataset=dataset, function=function,
+                                            subset_lbl=subset_lbl, auto_update=auto_update)
+        return plg(add_data=add_data)
+
+    def _new_extraction_instance(self, dataset=None, function='Sum', subset_lbl=None,
+                                 auto_update=False):
         plg = self.new()
         plg.dataset.selected = self.dataset.selected if dataset is None else dataset
         if subset_lbl is not None:
@@ -345,7 +362,97 @@ class SpectralExtraction3D(PluginTemplateMixin, ApertureSubsetSelectMixin,
         # for now it will select the first valid viewer to send results.
         plg.add_results.viewer.select_default()
         # all other settings remain at their plugin defaults
-        return plg(add_data=add_data)
+        return plg
+
+    def _extract_in_background(self, dataset, callback, function='Sum'):
+        """
+        Extract the entire cube of ``dataset`` (see ``_extract_in_new_instance``), with
+        the collapse of the cube running in a background thread.  Once done,
+        ``callback(result, exception)`` is called with either the extracted spectrum or
+        the exception raised by the extraction.
+
+        The plugin instance and its inputs are set up (and the result converted and passed
+        to ``callback``) on the running event loop (e.g. in a notebook), so that only the
+        collapse of the arrays runs in the background thread.  Without a running event
+        loop, the result could not be handed back, so the extraction runs synchronously.
+
+        The extraction is cancelled (and ``callback`` never called) if ``dataset`` is
+        removed from the data collection or if another extraction of ``dataset`` is
+        started before this one completes, so that only a single result is added.
+
+        Returns
+        -------
+        thread : `threading.Thread` or `None`
+            The thread running the collapse, or `None` if the extraction ran synchronously.
+        """
+        self._cancel_background_extraction(dataset)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is None:
+            try:
+                result = self._extract_in_new_instance(dataset=dataset, function=function,
+                                                       auto_update=False, add_data=False)
+            except Exception as e:
+                callback(None, e)
+            else:
+                callback(result, None)
+            return None
+
+        plg = self._new_extraction_instance(dataset=dataset, function=function)
+        cube = plg.cube
+        weight_mask = plg.aperture_weight_mask
+        nddata, wcs = plg._aperture_nddata(cube, plg.uncert_cube, plg.mask_cube,
+                                           plg.aperture, weight_mask)
+        spatial_axes = plg.spatial_axes
+        pixar_sr = cube.meta.get('PIXAR_SR', 1.0)
+        cancelled = threading.Event()
+
+        def finish(collapsed_nddata, exception):
+            # runs on the event loop, as does _cancel_background_extraction, so the entry
+            # is only removed if it was not cancelled or superseded in the meantime
+            _, current = self._background_extractions.get(dataset, (None, None))
+            if current is not cancelled or dataset not in self._app.data_collection:
+                return
+            del self._background_extractions[dataset]
+            self.auto_extract_pending = sorted(self._background_extractions)
+            if exception is not None:
+                callback(None, exception)
+                return
+            try:
+                spec = plg._return_extracted(cube, wcs, collapsed_nddata)
+                spec.meta['_pixel_scale_factor'] = pixar_sr
+            except Exception as e:
+                callback(None, e)
+            else:
+                callback(spec, None)
+
+        def worker():
+            collapsed_nddata, exception = None, None
+            try:
+                collapsed_nddata = plg._collapse_nddata(nddata, weight_mask,
+                                                        function.lower(), spatial_axes,
+                                                        pixar_sr)
+            except Exception as e:
+                exception = e
+            if not cancelled.is_set():
+                loop.call_soon_threadsafe(finish, collapsed_nddata, exception)
+
+        thread = threading.Thread(target=worker, daemon=True)
+        self._background_extractions[dataset] = (thread, cancelled)
+        self.auto_extract_pending = sorted(self._background_extractions)
+        thread.start()
+        return thread
+
+    def _cancel_background_extraction(self, dataset):
+        _, cancelled = self._background_extractions.pop(dataset, (None, None))
+        if cancelled is None:
+            return
+        # the computation itself cannot be interrupted, but its result will be discarded
+        cancelled.set()
+        self.auto_extract_pending = sorted(self._background_extractions)
 
     @observe('wavelength_dependent', 'bg_wavelength_dependent')
     def _wavelength_dependent_changed(self, *args):
@@ -516,6 +623,13 @@ class SpectralExtraction3D(PluginTemplateMixin, ApertureSubsetSelectMixin,
     def _extract_from_aperture(self, cube, uncert_cube, mask_cube, aperture,
                                weight_mask, wavelength_dependent,
                                selected_func, **kwargs):
+        nddata, wcs = self._aperture_nddata(cube, uncert_cube, mask_cube, aperture, weight_mask)
+        collapsed_nddata = self._collapse_nddata(nddata, weight_mask, selected_func,
+                                                 self.spatial_axes,
+                                                 self.cube.meta.get('PIXAR_SR', 1.0), **kwargs)
+        return self._return_extracted(cube, wcs, collapsed_nddata)
+
+    def _aperture_nddata(self, cube, uncert_cube, mask_cube, aperture, weight_mask):
         # This plugin collapses over the *spatial axes* (optionally over a spatial subset,
         # defaults to ``No Subset``). Since the Cubeviz parser puts the fluxes
         # and uncertainties in different glue Data objects, we translate the spectral
@@ -585,6 +699,14 @@ class SpectralExtraction3D(PluginTemplateMixin, ApertureSubsetSelectMixin,
         nddata_reshaped = NDDataArray(
             flux, mask=mask, uncertainty=uncertainties, wcs=wcs, meta=nddata.meta
         )
+        return nddata_reshaped, wcs
+
+    @staticmethod
+    def _collapse_nddata(nddata_reshaped, weight_mask, selected_func, spatial_axes,
+                         pixar_sr, **kwargs):
+        # only operates on the arrays of the cube (and not on the app or plugin), so that
+        # this can also run in a background thread, see _extract_in_background
+
         # by default we want to use operation_ignores_mask=True in nddata:
         kwargs.setdefault("operation_ignores_mask", True)
         # by default we want to propagate uncertainties:
@@ -592,13 +714,13 @@ class SpectralExtraction3D(PluginTemplateMixin, ApertureSubsetSelectMixin,
 
         if selected_func == 'mean':
             # Use built-in sum function to collapse NDDataArray
-            collapsed_sum_for_mean = nddata_reshaped.sum(axis=self.spatial_axes, **kwargs)
+            collapsed_sum_for_mean = nddata_reshaped.sum(axis=spatial_axes, **kwargs)
             # But we still need the mean function for everything except flux
-            collapsed_as_mean = nddata_reshaped.mean(axis=self.spatial_axes, **kwargs)
+            collapsed_as_mean = nddata_reshaped.mean(axis=spatial_axes, **kwargs)
 
             # Then normalize the flux based on the fractional pixel array
             flux_for_mean = (collapsed_sum_for_mean.data /
-                             np.sum(weight_mask, axis=self.spatial_axes)) << nddata_reshaped.unit
+                             np.sum(weight_mask, axis=spatial_axes)) << nddata_reshaped.unit
             # Combine that information into a new NDDataArray
             collapsed_nddata = NDDataArray(flux_for_mean, mask=collapsed_as_mean.mask,
                                            uncertainty=collapsed_as_mean.uncertainty,
@@ -606,7 +728,7 @@ class SpectralExtraction3D(PluginTemplateMixin, ApertureSubsetSelectMixin,
                                            meta=collapsed_as_mean.meta)
         elif selected_func == 'sum':
             collapsed_nddata = getattr(nddata_reshaped, selected_func)(
-                axis=self.spatial_axes, **kwargs
+                axis=spatial_axes, **kwargs
             )  # returns an NDDataArray
 
             # Remove per solid angle denominator to turn sb into flux
@@ -618,17 +740,17 @@ class SpectralExtraction3D(PluginTemplateMixin, ApertureSubsetSelectMixin,
                 # needs to be converted to the selected square angle unit but for now just
                 # force to correct units
                 if sq_angle_unit == u.sr:
-                    aperture_area = self.cube.meta.get('PIXAR_SR', 1.0) * sq_angle_unit
+                    aperture_area = pixar_sr * sq_angle_unit
                 else:
                     aperture_area = 1 * sq_angle_unit
                 collapsed_nddata = collapsed_nddata.multiply(aperture_area,
                                                              propagate_uncertainties=True)
         else:
             collapsed_nddata = getattr(nddata_reshaped, selected_func)(
-                axis=self.spatial_axes, **kwargs
+                axis=spatial_axes, **kwargs
             )  # returns an NDDataArray
 
-        return self._return_extracted(cube, wcs, collapsed_nddata)
+        return collapsed_nddata
 
     def _return_extracted(self, cube, wcs, collapsed_nddata, pass_spectral_axis=False):
         # Convert to Spectrum, with the spectral axis in correct units:
@@ -445,9 +445,11 @@ def test_autoupdate_results(deconfigged_helper, spectrum1d_cube_largest):
     deconfigged_helper.plugins['Subset Tools'].import_region(CircularROI(xc=5, yc=5, radius=3))
 
     # update should take place automatically, but since its async, we'll call manually to ensure
-    # the update is complete before comparing results
+    # the update is complete before comparing results (without an event loop, the scheduled
+    # update is processed immediately)
     for subset in deconfigged_helper._app.data_collection.subset_groups[0].subsets:
-        deconfigged_helper._app._update_live_plugin_results(trigger_subset=subset)
+        deconfigged_helper._app._schedule_live_plugin_results(trigger_subset=subset)
+    assert not len(deconfigged_helper._app._live_results_pending)
     # TODO: this is randomly failing in CI (not always) so will disable the assert for now and just
     # cover to make sure the logic does not crash
 
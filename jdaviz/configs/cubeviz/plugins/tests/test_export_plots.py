@@ -1,6 +1,9 @@
 import os
+from pathlib import Path
+
 import pytest
 
+from jdaviz.conftest import _create_spectrum1d_cube_with_fluxunit
 from jdaviz.configs.default.plugins.export.export import HAS_OPENCV
 
 
@@ -23,6 +26,63 @@ def test_export_movie(deconfigged_helper, spectrum1d_cube, tmp_path):
         os.chdir(orig_path)
 
 
+@pytest.mark.skipif(not HAS_OPENCV, reason="opencv-python is not installed")
+def test_export_movie_headless(cubeviz_helper, tmp_path):
+    import cv2
+
+    n_slices = 100
+    cube = _create_spectrum1d_cube_with_fluxunit(shape=(n_slices, 30, 20))
+    cubeviz_helper.load_data(cube, data_label="test")
+    plugin = cubeviz_helper.plugins["Export"]._obj
+    viewer = cubeviz_helper._app.get_viewer("flux-viewer")
+    orig_slice = viewer.slice
+
+    filename = str(tmp_path / "headless.mp4")
+    plugin.save_movie(viewer, filename, "mp4", i_start=0, i_end=n_slices - 1,
+                      width="64px", height="48px", headless=True)
+
+    # no temporary frames are written and the export is complete when save_movie returns
+    assert os.path.isfile(filename)
+    assert not list(tmp_path.glob("._cubeviz_movie_frame_*"))
+    assert not list(Path(".").glob("._cubeviz_movie_frame_*"))
+    assert plugin.movie_progress == 100
+    assert viewer.slice == orig_slice
+
+    video = cv2.VideoCapture(filename)
+    try:
+        assert int(video.get(cv2.CAP_PROP_FRAME_COUNT)) == n_slices
+        assert int(video.get(cv2.CAP_PROP_FRAME_WIDTH)) == 64
+        assert int(video.get(cv2.CAP_PROP_FRAME_HEIGHT)) == 48
+        # flux increases with the slice index, so later frames are brighter
+        frames = [video.read()[1] for _ in range(n_slices)]
+        assert frames[-1].mean() > frames[n_slices // 2].mean() > frames[0].mean()
+    finally:
+        video.release()
+
+
+@pytest.mark.skipif(not HAS_OPENCV, reason="opencv-python is not installed")
+def test_export_movie_headless_from_ui(cubeviz_helper, tmp_path):
+    cube = _create_spectrum1d_cube_with_fluxunit(shape=(20, 30, 20))
+    cubeviz_helper.load_data(cube, data_label="test")
+    plugin = cubeviz_helper.plugins["Export"]._obj
+    plugin.viewer.selected = "flux-viewer"
+    plugin.viewer_format.selected = "mp4"
+    plugin.movie_headless = True
+    plugin.i_end = 19
+    plugin.filename_value = str(tmp_path / "headless_ui.mp4")
+
+    # exporting from the plugin records the movie in the background (so that the
+    # recording can be interrupted) rather than blocking the frontend
+    with pytest.raises(ValueError, match="only supported with headless=True"):
+        plugin.save_movie(plugin.viewer.selected_obj, plugin.filename_value, "mp4",
+                          blocking=True)
+    filename = plugin.export()
+    plugin._movie_thread.join(timeout=60)
+    assert not plugin._movie_thread.is_alive()
+    assert os.path.isfile(filename)
+    assert plugin.movie_progress == 100
+
+
 @pytest.mark.skipif(HAS_OPENCV, reason="opencv-python is installed")
 def test_no_opencv(cubeviz_helper, spectrum1d_cube):
     cubeviz_helper.load(spectrum1d_cube, data_label="test", format='3D Spectrum')
@@ -1,10 +1,13 @@
+import multiprocessing as mp
 import warnings
 
+import numpy as np
+from astropy import units as u
 from astropy.nddata import CCDData
 from astropy.wcs import WCS
 from glue.core import Data
 from gwcs import WCS as GWCS
-from specutils.manipulation import spectral_slab
+from joblib import Parallel, delayed
 from traitlets import List, Unicode, observe
 
 from jdaviz.core.events import SnackbarMessage
@@ -19,6 +22,126 @@ from jdaviz.core.user_api import PluginUserApi
 
 __all__ = ['Collapse']
 
+COLLAPSE_FUNCTIONS = {'mean': np.nanmean, 'median': np.nanmedian, 'min': np.nanmin,
+                      'max': np.nanmax, 'sum': np.nansum}
+
+# approximate number of elements of a cube read at a time when collapsing it
+COLLAPSE_CHUNK_SIZE = 2**22
+
+
+def _spectral_range_to_slice(spectral_axis, spec_min, spec_max):
+    """
+    Find the range of a spectral axis within the (inclusive) bounds of a spectral region,
+    as `specutils.manipulation.spectral_slab` does, without slicing the spectrum itself.
+
+    Parameters
+    ----------
+    spectral_axis : `~astropy.units.Quantity`
+        Spectral axis, in ascending or descending order.
+    spec_min, spec_max : `~astropy.units.Quantity`
+        Bounds of the spectral region, in units equivalent to those of ``spectral_axis``.
+
+    Returns
+    -------
+    spectral_slice : slice
+        Slice of ``spectral_axis`` within the bounds.
+    """
+    bounds = u.Quantity([spec_min, spec_max]).to_value(spectral_axis.unit, u.spectral())
+    lower, upper = np.min(bounds), np.max(bounds)
+    values = np.asarray(spectral_axis.value)
+    descending = len(values) > 1 and values[-1] < values[0]
+    if descending:
+        values = values[::-1]
+    start = int(np.searchsorted(values, lower, side='left'))
+    stop = int(np.searchsorted(values, upper, side='right'))
+    if descending:
+        start, stop = len(values) - stop, len(values) - start
+    return slice(start, stop)
+
+
+def collapse_cube(flux, function, spectral_axis_index, spectral_slice=slice(None),
+                  mask=None, chunk_size=COLLAPSE_CHUNK_SIZE, n_cpu=None):
+    """
+    Collapse a cube over its spectral axis, ignoring NaNs and masked values.
+
+    The cube is read in spatial tiles of about ``chunk_size`` elements along its first
+    spatial axis, so that neither a copy of the (sliced) cube nor any full-size
+    temporary arrays are needed, and the tiles are collapsed in parallel threads.
+    The result is the same as that of `specutils.Spectrum.collapse` on the
+    spectral slab of the cube.
+
+    Parameters
+    ----------
+    flux : array-like
+        Flux of the cube (without units), which may be memory-mapped.
+    function : {'mean', 'median', 'min', 'max', 'sum'}
+        Function to use for the collapse operation (case insensitive).
+    spectral_axis_index : int
+        Index of the spectral axis of ``flux``.
+    spectral_slice : slice, optional
+        Range of the spectral axis to collapse over.  Defaults to the entire spectrum.
+    mask : array-like or `None`, optional
+        Mask with the same shape as ``flux``, with non-zero values excluded.
+    chunk_size : int, optional
+        Approximate number of elements to read at a time.
+    n_cpu : `None` or int, optional
+        Number of threads to use.  Defaults to the number of available CPU cores - 1.
+
+    Returns
+    -------
+    collapsed : `~numpy.ndarray`
+        Collapsed array, with the spectral axis removed.
+    """
+    reduce = COLLAPSE_FUNCTIONS[function.lower()]
+    if n_cpu is None:
+        n_cpu = mp.cpu_count() - 1
+
+    spectral_slice = slice(*spectral_slice.indices(flux.shape[spectral_axis_index]))
+    n_spectral = len(range(flux.shape[spectral_axis_index])[spectral_slice])
+    if n_spectral == 0:
+        raise ValueError('spectral range does not overlap with the cube')
+    spatial_axes = [i for i in range(flux.ndim) if i != spectral_axis_index]
+    out_shape = tuple(flux.shape[i] for i in spatial_axes)
+
+    # tile along the first spatial axis only, so that each tile is a single slice of
+    # the (potentially memory-mapped) cube
+    tile_axis = spatial_axes[0]
+    per_row = n_spectral * int(np.prod([flux.shape[i] for i in spatial_axes[1:]]))
+    step = max(1, chunk_size // max(1, per_row))
+
+    collapsed = None
+
+    def collapse_tile(start):
+        item = [slice(None)] * flux.ndim
+        item[spectral_axis_index] = spectral_slice
+        item[tile_axis] = slice(start, start + step)
+        item = tuple(item)
+        tile = flux[item]
+        if mask is not None:
+            tile = np.array(tile)
+            tile[np.asarray(mask[item]) != 0] = np.nan
+        return start, reduce(tile, axis=spectral_axis_index)
+
+    def collect(result):
+        nonlocal collapsed
+        start, values = result
+        if collapsed is None:
+            collapsed = np.empty(out_shape, dtype=values.dtype)
+        collapsed[start:start + step] = values
+
+    starts = range(0, flux.shape[tile_axis], step)
+    if n_cpu > 1 and len(starts) > 1:
+        # the numpy reductions release the GIL, so threads avoid having to send the
+        # tiles to other processes
+        results = Parallel(n_jobs=n_cpu, backend='threading', return_as='generator')(
+            delayed(collapse_tile)(start) for start in starts)
+    else:
+        results = map(collapse_tile, starts)
+    for result in results:
+        collect(result)
+
+    return collapsed
+
 
 @tray_registry('g-collapse', label="Collapse", category="data:reduction")
 class Collapse(PluginTemplateMixin, DatasetSelectMixin, SpectralSubsetSelectMixin, AddResultsMixin):
@@ -117,10 +240,13 @@ class Collapse(PluginTemplateMixin, DatasetSelectMixin, SpectralSubsetSelectMixi
 
         with warnings.catch_warnings():
             warnings.filterwarnings('ignore', message='No observer defined on WCS')
-            spec = spectral_slab(cube, spec_min, spec_max)
+            # the same pixel range as spectral_slab, without making a copy of the slab
+            spectral_slice = _spectral_range_to_slice(cube.spectral_axis, spec_min, spec_max)
             # Spatial-spatial image only.
-            collapsed_flux = spec.collapse(self.function_selected.lower(),
-                                           axis=cube.spectral_axis_index)  # Quantity
+            collapsed_flux = collapse_cube(cube.flux.value, self.function_selected,
+                                           cube.spectral_axis_index,
+                                           spectral_slice=spectral_slice,
+                                           mask=cube.mask) * cube.flux.unit  # Quantity
 
             # stuff for exporting to file
             self.collapsed_flux = CCDData(collapsed_flux, wcs=data_wcs)
@@ -1,7 +1,14 @@
+import tracemalloc
+
 import numpy as np
 import pytest
 from astropy import units as u
-from specutils import Spectrum
+from numpy.testing import assert_array_equal
+from specutils import Spectrum, SpectralRegion
+from specutils.manipulation import spectral_slab
+
+from jdaviz.configs.default.plugins.collapse.collapse import (_spectral_range_to_slice,
+                                                              collapse_cube)
 
 
 @pytest.mark.filterwarnings('ignore')
@@ -74,3 +81,100 @@ def test_collapsed_to_extract_plugin(cubeviz_helper, spectral_cube_wcs, tmp_path
     export_plugin = cubeviz_helper.plugins['Export']._obj
 
     assert label in export_plugin.data_collection.labels
+
+
+@pytest.mark.parametrize('function', ['Mean', 'Median', 'Min', 'Max', 'Sum'])
+@pytest.mark.parametrize('n_cpu', [1, 3])
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+def test_collapse_cube_in_tiles(tmp_path, function, n_cpu):
+    # memory-mapped cube read in tiles much smaller than the cube itself
+    shape = (37, 23, 50)
+    flux = np.lib.format.open_memmap(tmp_path / 'cube.npy', mode='w+',
+                                     dtype=np.float32, shape=shape)
+    rng = np.random.default_rng(42)
+    flux[:] = rng.normal(10, 2, shape)
+    flux[3, 4, 10:20] = np.nan
+    flux[5, 6, :] = np.nan
+    flux.flush()
+    mask = rng.random(shape) > 0.9
+
+    cube = Spectrum(flux=np.array(flux) * u.nJy, mask=mask,
+                    spectral_axis=np.linspace(1, 2, shape[2]) * u.um)
+    expected = spectral_slab(cube, 1.2 * u.um, 1.7 * u.um).collapse(function.lower(), axis=2)
+
+    collapsed = collapse_cube(flux, function, 2, spectral_slice=slice(10, 35), mask=mask,
+                              chunk_size=1000, n_cpu=n_cpu)
+    assert collapsed.dtype == expected.dtype
+    assert_array_equal(collapsed, expected.value)
+
+    # spectral axis first, without a mask
+    cube_t = np.lib.format.open_memmap(tmp_path / 'cube_t.npy', mode='w+',
+                                       dtype=np.float32, shape=shape[::-1])
+    cube_t[:] = np.where(mask, np.nan, flux).T
+    cube = Spectrum(flux=np.array(cube_t) * u.nJy, spectral_axis_index=0,
+                    spectral_axis=np.linspace(1, 2, shape[2]) * u.um)
+    expected = cube.collapse(function.lower(), axis=0)
+    assert_array_equal(collapse_cube(cube_t, function, 0, chunk_size=1000, n_cpu=n_cpu),
+                       expected.value)
+
+
+def test_collapse_spectral_subset(cubeviz_helper, spectrum1d_cube_larger):
+    cubeviz_helper.load_data(spectrum1d_cube_larger)
+    coll = cubeviz_helper.plugins['Collapse']
+    cube = coll._obj.dataset.selected_obj
+
+    unit = u.Unit(cubeviz_helper.plugins['Unit Conversion'].spectral_unit.selected)
+    lower, upper = 4.624e-07 * unit, 4.627e-07 * unit
+    cubeviz_helper.plugins['Subset Tools'].import_region(SpectralRegion(lower, upper))
+    coll.spectral_subset = 'Subset 1'
+
+    for function in ('Mean', 'Median', 'Min', 'Max', 'Sum'):
+        coll.function = function
+        expected = spectral_slab(cube, lower, upper).collapse(function.lower(),
+                                                              axis=cube.spectral_axis_index)
+        assert_array_equal(coll.collapse(add_data=False), expected)
+
+
+@pytest.mark.parametrize('spectral_axis', [np.linspace(1, 2, 50) * u.um,
+                                           np.linspace(2, 1, 50) * u.um,
+                                           np.linspace(150, 300, 50) * u.THz])
+@pytest.mark.parametrize(('lower', 'upper'), [(1.2, 1.7), (1.7, 1.2), (0.5, 1.5),
+                                              (1.5, 2.5), (0.5, 0.7), (1.6, 1.6),
+                                              (1.6, 1.62)])
+def test_spectral_range_to_slice(spectral_axis, lower, upper):
+    spec = Spectrum(flux=np.arange(50) * u.nJy, spectral_axis=spectral_axis)
+    spectral_slice = _spectral_range_to_slice(spectral_axis, lower * u.um, upper * u.um)
+    try:
+        expected = spectral_slab(spec, min(lower, upper) * u.um,
+                                 max(lower, upper) * u.um).flux.value
+    except ValueError:
+        # spectral_slab raises when the range does not overlap with the spectrum
+        expected = []
+    assert_array_equal(spec.flux.value[spectral_slice], expected)
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+def test_collapse_cube_peak_memory(tmp_path):
+    # memory-mapped cube that is collapsed without reading it into memory at once
+    shape = (128, 128, 256)
+    flux = np.lib.format.open_memmap(tmp_path / 'cube.npy', mode='w+',
+                                     dtype=np.float32, shape=shape)
+    for i in range(shape[0]):
+        flux[i] = i
+    flux.flush()
+    del flux
+    flux = np.load(tmp_path / 'cube.npy', mmap_mode='r')
+    mask = np.lib.format.open_memmap(tmp_path / 'mask.npy', mode='w+',
+                                     dtype=bool, shape=shape)
+
+    tracemalloc.start()
+    try:
+        collapsed = collapse_cube(flux, 'Sum', 2, spectral_slice=slice(10, 200), mask=mask,
+                                  chunk_size=2**16, n_cpu=2)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert_array_equal(collapsed, np.arange(shape[0])[:, None] * 190 * np.ones(shape[1]))
+    # the cube itself is 16 MiB, the masked tiles read at a time are about 256 KiB each
+    assert peak < flux.nbytes / 8
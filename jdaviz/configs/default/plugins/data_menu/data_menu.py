@@ -140,12 +140,17 @@ class DataMenu(TemplateMixin, LayerSelectMixin, DatasetSelectMixin):
         self.layer.multiselect = True
         self.layer.sort_by = 'zorder'
         self.layer._default_mode = 'empty'
+        # rebuild the layer list once per bulk operation or event-loop tick
+        self.layer._coalesce_updates = True
 
         # we'll use a modified version of the dataset mixin to have a filtered
         # list of data entries in the app that are not in the current viewer.
         # changing the selection has no consequence.
         def data_not_in_viewer(data):
-            return data.label not in self.layer.choices
+            # check the layers of the viewer rather than self.layer.choices, which would
+            # apply a pending (coalesced) update of the layer list every time
+            return data.label not in [lyr.layer.label for viewer in self.layer.viewer_objs
+                                      for lyr in getattr(viewer, 'layers', [])]
 
         self.dataset.filters = ['is_not_wcs_only', 'not_child_layer',
                                 data_not_in_viewer]
@@ -224,12 +229,13 @@ class DataMenu(TemplateMixin, LayerSelectMixin, DatasetSelectMixin):
 
     @property
     def data_labels_loaded(self):
-        return [layer['label'] for layer in self.layer_items
+        # (through self.layer to apply any pending update first)
+        return [layer['label'] for layer in self.layer.items
                 if layer['label'] not in self.existing_subset_labels]
 
     @property
     def data_labels_visible(self):
-        return [layer['label'] for layer in self.layer_items
+        return [layer['label'] for layer in self.layer.items
                 if layer['label'] not in self.existing_subset_labels and layer['visible']]
 
     @property
@@ -399,8 +405,8 @@ class DataMenu(TemplateMixin, LayerSelectMixin, DatasetSelectMixin):
         with self.during_select_sync():
             # map index in dm_layer_selected (inverse order of layer_items)
             # to set self.layer.selected
-            if len(self.layer_items):
-                selected = [self.layer_items[i]['label']
+            if len(self.layer.items):
+                selected = [self.layer.items[i]['label']
                             for i in self.dm_layer_selected]
                 if self.layer.multiselect:
                     self.layer.selected = selected
@@ -460,6 +466,7 @@ class DataMenu(TemplateMixin, LayerSelectMixin, DatasetSelectMixin):
             child_to_parent = {child: data.label for data in self._app.data_collection
                                for child in self._app._get_assoc_data_children(data.label)}
 
+            zorder_changed = False
             for layer in self._viewer.layers:
                 # Skip reordering scatter layers in image viewers.
                 if isinstance(self._viewer, BqplotImageView) and isinstance(layer.state, ScatterLayerState):  # noqa
@@ -504,12 +511,14 @@ class DataMenu(TemplateMixin, LayerSelectMixin, DatasetSelectMixin):
 
                 if new_zorder != layer.zorder:
                     layer.zorder = new_zorder
-                    self.layer._update_items()
+                    zorder_changed = True
 
+            if zorder_changed:
+                self.layer._update_items()
             self.prevent_layer_items_recursion = False
 
             # Only trigger if the order expected in the message and the actual order differ
-            if label_order != [li['label'] for li in self.layer_items if li['is_subset'] is not None]:  # noqa
+            if label_order != [li['label'] for li in self.layer.items if li['is_subset'] is not None]:  # noqa
                 self.layer._update_items()
 
         if not hasattr(self, 'layer') or not self.layer.multiselect:  # pragma: no cover
@@ -517,7 +526,7 @@ class DataMenu(TemplateMixin, LayerSelectMixin, DatasetSelectMixin):
         if not self._during_select_sync:
             with self.during_select_sync():
                 # map list of strings in self.layer.selected to indices in dm_layer_selected
-                layer_labels = [layer['label'] for layer in self.layer_items]
+                layer_labels = [layer['label'] for layer in self.layer.items]
                 layer_selected = self.layer_selected if self.layer.multiselect else [self.layer_selected]  # noqa
                 self.dm_layer_selected = [layer_labels.index(label) for label in layer_selected
                                           if label in layer_labels]
@@ -551,12 +560,12 @@ class DataMenu(TemplateMixin, LayerSelectMixin, DatasetSelectMixin):
 
         # layer info rules
         if self.selected_n_layers == 1:
-            if self.dm_layer_selected == [] or max(self.dm_layer_selected) >= len(self.layer_items):  # noqa pragma: no cover
+            if self.dm_layer_selected == [] or max(self.dm_layer_selected) >= len(self.layer.items):  # noqa pragma: no cover
                 # Can happen during state transition but should immediately be followed up
                 # with an update. Also get here when unloading all data.
                 self.info_enabled = False
                 self.info_tooltip = ''
-            elif self.layer_items[self.dm_layer_selected[0]].get('from_plugin', False):
+            elif self.layer.items[self.dm_layer_selected[0]].get('from_plugin', False):
                 self.info_enabled = False
                 self.info_tooltip = 'Selected data layer is a plugin product and does not have metadata'  # noqa
             else:
@@ -4,6 +4,8 @@ import astropy.units as u
 from regions import CirclePixelRegion, PixCoord
 from specutils import SpectralRegion
 
+from jdaviz.core.template_mixin import LayerSelect
+
 
 def test_load_nddata(imviz_helper):
     data_a = NDData(np.random.rand(16, 16))
@@ -87,3 +89,85 @@ def test_only_compatible_subsets_in_menu(deconfigged_helper, image_hdu_wcs, spec
     # Make sure the spectral subset is only in the spectrum viewer's data menu
     assert "Subset 1" not in iv.data_menu.layer.choices
     assert "Subset 1" in sv.data_menu.layer.choices
+
+
+def test_batch_load_rebuilds_layer_list_once(imviz_helper, monkeypatch):
+    dm = imviz_helper.viewers['imviz-0'].data_menu._obj
+    rebuilds = []
+    rebuild_items = LayerSelect._rebuild_items
+
+    def count_rebuilds(self, *args, **kwargs):
+        if self is dm.layer:
+            rebuilds.append(args)
+        return rebuild_items(self, *args, **kwargs)
+
+    monkeypatch.setattr(LayerSelect, '_rebuild_items', count_rebuilds)
+
+    labels = [f'data_{i}' for i in range(10)]
+    with imviz_helper.batch_load():
+        for label in labels:
+            imviz_helper.load(NDData(np.random.rand(16, 16)), data_label=label)
+    assert len(rebuilds) == 1
+    assert sorted(dm.data_labels_loaded) == sorted(f'{label}[DATA]' for label in labels)
+    assert len(dm.layer_items) == len(labels)
+
+    # within a batch, reading the list applies the pending update first
+    with imviz_helper.batch_load():
+        imviz_helper.load(NDData(np.random.rand(16, 16)), data_label='data_a')
+        assert 'data_a[DATA]' in dm.data_labels_loaded
+        assert len(rebuilds) == 2
+        imviz_helper.load(NDData(np.random.rand(16, 16)), data_label='data_b')
+        assert 'data_b[DATA]' in dm.data_labels_loaded
+        assert len(rebuilds) == 3
+    assert len(rebuilds) == 3
+
+    # outside of a batch (and without an event loop), the list is updated immediately
+    imviz_helper.load(NDData(np.random.rand(16, 16)), data_label='data_10')
+    assert 'data_10[DATA]' in [item['label'] for item in dm.layer_items]
+
+
+def test_layer_list_rebuilt_once_per_event_loop_tick(imviz_helper, monkeypatch):
+    dm = imviz_helper.viewers['imviz-0'].data_menu._obj
+    rebuilds = []
+    rebuild_items = LayerSelect._rebuild_items
+
+    def count_rebuilds(self, *args, **kwargs):
+        if self is dm.layer:
+            rebuilds.append(args)
+        return rebuild_items(self, *args, **kwargs)
+
+    monkeypatch.setattr(LayerSelect, '_rebuild_items', count_rebuilds)
+
+    # stands in for the event loop of the kernel, with the callbacks run on the next tick
+    class TickLoop:
+        def __init__(self):
+            self.callbacks = []
+
+        def call_soon_threadsafe(self, callback, *args):
+            self.callbacks.append((callback, args))
+
+        def tick(self):
+            callbacks, self.callbacks = self.callbacks, []
+            for callback, args in callbacks:
+                callback(*args)
+
+    loop = TickLoop()
+    monkeypatch.setattr('jdaviz.app.get_ioloop', lambda: loop)
+
+    labels = [f'data_{i}' for i in range(5)]
+    for label in labels:
+        imviz_helper.load(NDData(np.random.rand(16, 16)), data_label=label)
+    # the rebuilds are delayed until the end of the tick, and only scheduled once
+    assert len(loop.callbacks) == 1
+    assert len(rebuilds) == 0
+    loop.tick()
+    assert len(rebuilds) == 1
+    assert sorted(item['label'] for item in dm.layer_items) == sorted(
+        f'{label}[DATA]' for label in labels)
+
+    # reading the items within the tick applies the pending update first
+    imviz_helper.load(NDData(np.random.rand(16, 16)), data_label='data_5')
+    assert 'data_5[DATA]' in [item['label'] for item in dm.layer.items]
+    assert len(rebuilds) == 2
+    loop.tick()
+    assert len(rebuilds) == 2
@@ -1,5 +1,6 @@
 from itertools import chain
 import os
+import weakref
 from traitlets import Any, Dict, Bool, List, Unicode, Float, observe
 
 import numpy as np
@@ -14,7 +15,7 @@ from jdaviz.core.template_mixin import (
 from jdaviz.core.tools import ICON_DIR
 from jdaviz.core.user_api import PluginUserApi
 from jdaviz.configs.default.plugins.data_quality.dq_utils import (
-    decode_flags, generate_listed_colormap, dq_flag_map_paths, load_flag_map
+    decode_flags, generate_listed_colormap, dq_flag_map_paths, load_flag_map, summarize_flags
 )
 
 
@@ -47,6 +48,8 @@ class DataQuality(PluginTemplateMixin, ViewerSelectMixin):
         data quality layer corresponding to the science data in ``science_layer``
     * ``dq_layer_opacity``: Opacity of the data quality layer.
     * ``decoded_flags``: List of decoded flags from the selected flag map.
+    * ``flag_bit_counts``: Number of pixels with each bit set, for each bit set in at
+      least one pixel.
     * ``flags_filter``: List of flags to display.
     * ``flag_map_definitions_selected``: Dictionary of the selected flag map.
     """
@@ -69,6 +72,7 @@ class DataQuality(PluginTemplateMixin, ViewerSelectMixin):
     flag_map_definitions_selected = Dict().tag(sync=True)
     flag_map_items = List().tag(sync=True)
     decoded_flags = List().tag(sync=True)
+    flag_bit_counts = Dict().tag(sync=True)
     flags_filter = List().tag(sync=True)
 
     icons = Dict().tag(sync=True)
@@ -85,6 +89,10 @@ class DataQuality(PluginTemplateMixin, ViewerSelectMixin):
 
         self.icons = {k: v for k, v in self._app.state.icons.items()}
 
+        # summaries of the flags in each DQ array, keyed by the id of the array and
+        # stored along with a weak reference to it to detect when an id is reused
+        self._flag_summaries = {}
+
         self.science_layer = LayerSelect(
             self, 'science_layer_items', 'science_layer_selected',
             'viewer_selected', 'science_layer_multiselect',
@@ -167,15 +175,37 @@ class DataQuality(PluginTemplateMixin, ViewerSelectMixin):
             selected_dq = [selected_dq]
         return selected_dq
 
+    def get_flag_summary(self, dq_layer):
+        """
+        Return the summary of the flags in the data of ``dq_layer``, which is only
+        computed the first time it is needed for each DQ array.
+
+        Parameters
+        ----------
+        dq_layer : `~glue.viewers.image.layer_artist.ImageLayerArtist`
+            Data quality layer.
+
+        Returns
+        -------
+        summary : `~jdaviz.configs.default.plugins.data_quality.dq_utils.DQFlagSummary`
+        """
+        dq = dq_layer.layer.get_data(dq_layer.state.attribute)
+        array_ref, summary = self._flag_summaries.get(id(dq), (None, None))
+        if array_ref is None or array_ref() is not dq:
+            summary = summarize_flags(dq)
+            # drop summaries of arrays which no longer exist
+            self._flag_summaries = {k: v for k, v in self._flag_summaries.items()
+                                    if v[0]() is not None}
+            self._flag_summaries[id(dq)] = (weakref.ref(dq), summary)
+        return summary
+
     @property
     def unique_flags(self):
         selected_dq = self.dq_layer_selected_flattened
         if selected_dq is None or not len(selected_dq):
             return []
 
-        dq = selected_dq[0].get_image_data()
-
-        return np.unique(dq[~np.isnan(dq)])
+        return self.get_flag_summary(selected_dq[0]).flags
 
     @property
     def validate_flag_decode_possible(self):
@@ -204,13 +234,16 @@ class DataQuality(PluginTemplateMixin, ViewerSelectMixin):
         if not self.validate_flag_decode_possible:
             return
 
-        unique_flags = self.unique_flags
-        cmap, rgba_colors = generate_listed_colormap(n_flags=len(unique_flags))
+        summary = self.get_flag_summary(self.dq_layer_selected_flattened[0])
+        cmap, rgba_colors = generate_listed_colormap(n_flags=len(summary.flags))
         self.decoded_flags = decode_flags(
             flag_map=self.flag_map_definitions_selected or {},
-            unique_flags=unique_flags,
-            rgba_colors=rgba_colors
+            unique_flags=summary.flags,
+            rgba_colors=rgba_colors,
+            counts=summary.counts
         )
+        # keys of synced dictionaries must be strings
+        self.flag_bit_counts = {str(bit): count for bit, count in summary.bit_counts.items()}
         self.send_state('decoded_flags')
         dq_layers = self.get_dq_layers(viewers=viewers)
 
@@ -241,7 +274,8 @@ class DataQuality(PluginTemplateMixin, ViewerSelectMixin):
 
             with delay_callback(dq_layer.state, 'alpha', 'cmap', 'v_min', 'v_max', 'cmap_bad'):
                 if len(flag_bits):
-                    dq_layer.state.v_min = min(flag_bits)
+                    # zeros (un-flagged pixels) are made transparent by the lookup stretch
+                    dq_layer.state.v_min = 0
                     dq_layer.state.v_max = max(flag_bits)
 
                 dq_layer.state.alpha = self.dq_layer_opacity
@@ -326,7 +360,6 @@ class DataQuality(PluginTemplateMixin, ViewerSelectMixin):
                 # dq_layer.state.stretch = 'lookup'
                 stretch_object = dq_layer.state.stretch_object
                 stretch_object.flags = flag_bits
-                stretch_object.dq_array = dq_layer.get_image_data()
                 stretch_object.hidden_flags = hidden_flags
 
                 # update the colors of the listed colormap without
@@ -339,7 +372,7 @@ class DataQuality(PluginTemplateMixin, ViewerSelectMixin):
                 dq_layer.update()
 
                 if len(flag_bits):
-                    dq_layer.state.v_min = min(flag_bits)
+                    dq_layer.state.v_min = 0
                     dq_layer.state.v_max = max(flag_bits)
 
                 dq_layer.state.alpha = self.dq_layer_opacity
@@ -425,5 +458,6 @@ class DataQuality(PluginTemplateMixin, ViewerSelectMixin):
                 'decoded_flags', 'flags_filter',
                 'dq_layer_opacity',
                 'flag_map_definitions_selected',
-            )
+            ),
+            readonly=('flag_bit_counts',)
         )
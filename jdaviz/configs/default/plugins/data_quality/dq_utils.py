@@ -1,3 +1,4 @@
+from functools import cached_property
 from importlib import resources
 from pathlib import Path
 
@@ -19,6 +20,9 @@ dq_flag_map_paths = {
     'hst-cos': Path('data', 'data_quality', 'hst-cos.csv'),
 }
 
+# approximate number of elements of a DQ array read at a time when summarizing its flags
+DQ_SUMMARY_CHUNK_SIZE = 2**24
+
 
 class LookupStretch:
     """
@@ -43,12 +47,14 @@ class LookupStretch:
 
     @property
     def flag_range(self):
-        return np.max(self.flags) - np.min(self.flags)
+        # the layer limits are expected to span (0, max(flags)), so that un-flagged
+        # pixels (zeros) are not clipped onto the smallest flag
+        return np.max(self.flags)
 
     @property
     def scaled_flags(self):
         # renormalize the flags on range (0, 1):
-        return (self.flags - np.min(self.flags)) / self.flag_range
+        return self.flags / self.flag_range
 
     def dq_array_to_flag_index(self, values):
         # Find the index of the closest entry in `scaled_flags`
@@ -72,7 +78,7 @@ class LookupStretch:
         # astropy.visualization.ManualInterval and normalized on (0, 1)
         # before they arrive here. First, remove that interval and get
         # back the integer values:
-        values_integer = np.round(values * self.flag_range + np.min(self.flags))
+        values_integer = np.round(values * self.flag_range)
 
         # normalize by the number of flags, onto interval (0, 1):
         renormed = self.dq_array_to_flag_index(values) / len(self.flags)
@@ -86,9 +92,10 @@ class LookupStretch:
         else:
             value_is_hidden = False
 
-        # preserve NaNs in values, and make hidden flags NaNs:
+        # preserve NaNs in values, and make un-flagged pixels (zeros in integer
+        # DQ arrays) and hidden flags NaNs:
         return np.where(
-            np.isnan(values) | value_is_hidden,
+            np.isnan(values) | (values_integer == 0) | value_is_hidden,
             np.nan,
             renormed
         )
@@ -98,6 +105,76 @@ if "lookup" not in stretches:
     stretches.add("lookup", LookupStretch, display="DQ")
 
 
+class DQFlagSummary:
+    """
+    Summary of the flags set in a data quality array.
+
+    Attributes
+    ----------
+    flags : `~numpy.ndarray`
+        Sorted unique non-zero flag values in the array.
+    counts : `~numpy.ndarray`
+        Number of pixels with each value in ``flags``.
+    """
+    def __init__(self, flags, counts):
+        self.flags = flags
+        self.counts = counts
+
+    @cached_property
+    def bit_counts(self):
+        """
+        Dictionary of the number of pixels with each bit set, for each bit set in
+        at least one pixel.
+        """
+        bit_counts = {}
+        for flag, count in zip(self.flags, self.counts):
+            for bit in decompose_bit(flag):
+                bit_counts[bit] = bit_counts.get(bit, 0) + int(count)
+        return dict(sorted(bit_counts.items()))
+
+
+def summarize_flags(dq, chunk_size=DQ_SUMMARY_CHUNK_SIZE):
+    """
+    Find the unique flags in a data quality array, and the number of pixels with
+    each of them.
+
+    Zeros (and, for floating point arrays, non-finite values) mark un-flagged pixels
+    and are not included.  The array is read in chunks of about ``chunk_size``
+    elements along its first axis, so that the summary of a large (e.g. memory-mapped)
+    array does not require any full-size temporary arrays.
+
+    Parameters
+    ----------
+    dq : array-like
+        Data quality array.
+    chunk_size : int, optional
+        Approximate number of elements to read at a time.
+
+    Returns
+    -------
+    summary : `DQFlagSummary`
+    """
+    dq = np.atleast_1d(np.asarray(dq))
+    step = max(1, chunk_size // max(1, int(np.prod(dq.shape[1:]))))
+
+    chunk_flags, chunk_counts = [], []
+    for start in range(0, dq.shape[0], step):
+        values = dq[start:start + step].ravel()
+        if values.dtype.kind == 'f':
+            values = values[np.isfinite(values)]
+        flags, counts = np.unique(values[values != 0], return_counts=True)
+        chunk_flags.append(flags)
+        chunk_counts.append(counts)
+
+    if not len(chunk_flags):
+        return DQFlagSummary(np.array([], dtype=int), np.array([], dtype=int))
+
+    flags, inverse = np.unique(np.concatenate(chunk_flags), return_inverse=True)
+    counts = np.bincount(inverse, weights=np.concatenate(chunk_counts),
+                         minlength=len(flags))
+    return DQFlagSummary(flags.astype(int), counts.astype(int))
+
+
 def load_flag_map(mission_or_instrument=None, path=None):
     """
     Load a flag map from disk.
@@ -236,7 +313,7 @@ def decompose_bit(bit):
     return sorted(powers)
 
 
-def decode_flags(flag_map, unique_flags, rgba_colors):
+def decode_flags(flag_map, unique_flags, rgba_colors, counts=None):
     """
     For a list of unique bits in ``unique_flags``, return a list of
     dictionaries of the decomposed bits with their names, definitions, and
@@ -250,6 +327,8 @@ def decode_flags(flag_map, unique_flags, rgba_colors):
         Sequence of unique flags which occur in a data quality array.
     rgba_colors : list of tuples
         RGBA color tuples, one per unique flag.
+    counts : list or array, optional
+        Number of pixels with each flag, included in the decoded flags if provided.
     """
     decoded_flags = []
 
@@ -262,5 +341,7 @@ def decode_flags(flag_map, unique_flags, rgba_colors):
             'color': rgb2hex(color),
             'show': True,
         })
+        if counts is not None:
+            decoded_flags[-1]['count'] = int(counts[i])
 
     return decoded_flags
@@ -9,7 +9,7 @@ from glue.core.subset import RectangularROI
 
 from jdaviz.configs.imviz.plugins.parsers import HAS_ROMAN_DATAMODELS
 from jdaviz.configs.default.plugins.data_quality.dq_utils import (
-    load_flag_map, write_flag_map
+    load_flag_map, write_flag_map, summarize_flags, LookupStretch
 )
 from jdaviz.utils import cached_uri
 
@@ -44,6 +44,41 @@ def test_load_write_load(tmp_path):
         assert orig_value == reloaded_flag_map[flag]
 
 
+@pytest.mark.parametrize('dtype', [np.uint32, np.int16, np.float32])
+def test_summarize_flags(dtype):
+    dq = np.zeros((7, 5, 3), dtype=dtype)
+    dq[0, 0, 0] = 1
+    dq[3, 1:3, 2] = 5
+    dq[6, 4, :] = 16
+    if dtype is np.float32:
+        dq[2, 2, 2] = np.nan
+
+    # a chunk size smaller than the first axis exercises the merging of the chunks
+    summary = summarize_flags(dq, chunk_size=dq[0].size * 2)
+    np.testing.assert_array_equal(summary.flags, [1, 5, 16])
+    np.testing.assert_array_equal(summary.counts, [1, 2, 3])
+    assert summary.bit_counts == {0: 3, 2: 2, 4: 3}
+
+    summary = summarize_flags(np.zeros((4, 4), dtype=dtype))
+    assert len(summary.flags) == len(summary.counts) == 0
+
+
+def test_lookup_stretch_unflagged_transparent():
+    stretch = LookupStretch(flags=np.array([1, 4, 5]))
+    # the layer limits span from zero to the largest flag
+    values = np.array([0, 1, 4, 5]) / 5
+    result = stretch(values.copy())
+    assert np.isnan(result[0])
+    assert np.all(np.isfinite(result[1:]))
+    assert np.all(np.diff(result[1:]) > 0)
+
+    # hidden flags are transparent too
+    stretch.hidden_flags = np.array([4])
+    result = stretch(values.copy())
+    assert np.isnan(result[[0, 2]]).all()
+    assert np.isfinite(result[[1, 3]]).all()
+
+
 def test_jwst_against_stdatamodels():
     # compare our flag map against the flag map dictionary in `stdatamodels`:
     flag_map_loaded = load_flag_map('jwst')
@@ -112,8 +147,21 @@ def test_dq_display_without_telescop_metadata(helper_name, request, multi_extens
     assert dq_layer.state.cmap_bad == (0, 0, 0, 0)
     assert dq_layer.state.alpha == dq_plugin.dq_layer_opacity
 
-    # v_min/v_max should span the actual flag range
-    assert dq_layer.state.v_min, dq_layer.state.v_max == (1, 5)
+    # v_min/v_max should span from zero (un-flagged) to the largest flag
+    assert (dq_layer.state.v_min, dq_layer.state.v_max) == (0, 5)
+
+    # the DQ layer keeps its integer dtype, and the flag summary is cached
+    dq_data = dq_layer.layer.get_data(dq_layer.state.attribute)
+    assert np.issubdtype(dq_data.dtype, np.integer)
+    summary = dq_plugin.get_flag_summary(dq_layer)
+    assert dq_plugin.get_flag_summary(dq_layer) is summary
+    np.testing.assert_array_equal(summary.flags, [1, 4, 5])
+    assert summary.counts.sum() == np.count_nonzero(dq_data)
+
+    # the pixel counts of each flag and of each bit are shown with the decoded flags
+    assert [flag['count'] for flag in dq_plugin.decoded_flags] == summary.counts.tolist()
+    assert dq_plugin.flag_bit_counts == {
+        str(bit): int(np.count_nonzero(dq_data & (1 << bit))) for bit in (0, 2)}
 
 
 @pytest.mark.remote_data
@@ -197,7 +245,7 @@ def test_data_quality_plugin(helper_name, request):
     label_mouseover._viewer_mouse_event(viewer,
                                         {'event': 'mousemove', 'domain': {'x': 10, 'y': 4}})
     dq_val = dq_data[4, 10]
-    assert np.isnan(dq_val)
+    assert dq_val == 0
     label_mouseover_text = label_mouseover.as_text()[0]
     assert 'DQ' not in label_mouseover_text
 
@@ -3,13 +3,14 @@ import time
 from pathlib import Path
 import threading
 
+import numpy as np
 from astropy import units as u
 from astropy.nddata import CCDData
 from glue.core.message import SubsetCreateMessage, SubsetDeleteMessage, SubsetUpdateMessage
 from glue_jupyter.bqplot.image import BqplotImageView
 from regions import CircleSkyRegion, EllipseSkyRegion
 from specutils import Spectrum
-from traitlets import Bool, List, Unicode, observe
+from traitlets import Bool, Float, List, Unicode, observe
 
 from jdaviz.core.custom_traitlets import FloatHandleEmpty, IntHandleEmpty
 from jdaviz.core.marks import ShadowMixin
@@ -112,6 +113,10 @@ class Export(PluginTemplateMixin, ViewerSelectMixin, SubsetSelectMixin,
     movie_fps = FloatHandleEmpty(5.0).tag(sync=True)
     movie_recording = Bool(False).tag(sync=True)
     movie_interrupt = Bool(False).tag(sync=True)
+    # render frames server-side from the viewer state instead of round-tripping through the
+    # frontend (does not require a live browser, but only includes the image layers)
+    movie_headless = Bool(False).tag(sync=True)
+    movie_progress = Float(0).tag(sync=True)
 
     overwrite_warn = Bool(False).tag(sync=True)
 
@@ -130,6 +135,9 @@ class Export(PluginTemplateMixin, ViewerSelectMixin, SubsetSelectMixin,
         # description displayed under plugin title in tray
         self._plugin_description = 'Export data/plots and other outputs to a file.'
 
+        # thread of the last movie recorded in the background
+        self._movie_thread = None
+
         if self.config == 'deconfigged':
             self.docs_link = f'https://jdaviz.readthedocs.io/en/{self.vdocs}/export/index.html'
 
@@ -505,7 +513,10 @@ class Export(PluginTemplateMixin, ViewerSelectMixin, SubsetSelectMixin,
                 restores.append(restore)
 
             if filetype == "mp4":
+                # never block the caller (e.g. the frontend), so that the recording can be
+                # interrupted while it runs
                 self.save_movie(viewer, filename, filetype,
+                                headless=self.movie_headless, blocking=False,
                                 width=f"{self.image_width}px" if self.image_custom_size else None,
                                 height=f"{self.image_height}px" if self.image_custom_size else None)
             else:
@@ -712,9 +723,10 @@ class Export(PluginTemplateMixin, ViewerSelectMixin, SubsetSelectMixin,
             raise ValueError(f"Unsupported filetype={filetype} for save_figure")
 
     @with_spinner('movie_recording')
-    def _save_movie(self, viewer, i_start, i_end, fps, filename, rm_temp_files, width, height):
+    def _save_movie(self, viewer, i_start, i_end, fps, filename, rm_temp_files, width, height,
+                    headless=False):
         # NOTE: All the stuff here has to be in the same thread but
-        #       separate from main app thread to work.
+        #       separate from main app thread to work (unless headless).
 
         if not self.movie_enabled:
             if not HAS_OPENCV:
@@ -727,28 +739,47 @@ class Export(PluginTemplateMixin, ViewerSelectMixin, SubsetSelectMixin,
         i = i_start
         video = None
         slice_plg.value = slice_plg.valid_values_sorted[i_start]
+        self.movie_progress = 0
 
         # TODO: Expose to users?
         i_step = 1  # Need n_frames check if we allow tweaking
+        n_frames = i_end - i_start + 1
 
         try:
+            if headless:
+                frame_size = _movie_frame_size(viewer, width, height)
+                video = cv2.VideoWriter(filename, cv2.VideoWriter_fourcc(*'mp4v'), fps, frame_size, True)  # noqa: E501
+                t_start = time.perf_counter()
+
             while i <= i_end:
                 if self.movie_interrupt:
                     break
 
-                slice_plg.vue_play_next()
-                cur_pngfile = Path(f"._cubeviz_movie_frame_{i}.png")
-                # TODO: skip success snackbars when exporting temp movie frames?
-                self.save_figure(viewer, filename=cur_pngfile, filetype="png", show_dialog=False,
-                                 width=width, height=height)
-                temp_png_files.append(cur_pngfile)
+                if headless:
+                    slice_plg.value = slice_plg.valid_values_sorted[i]
+                    video.write(_render_viewer_frame(viewer, frame_size))
+                else:
+                    slice_plg.vue_play_next()
+                    cur_pngfile = Path(f"._cubeviz_movie_frame_{i}.png")
+                    # TODO: skip success snackbars when exporting temp movie frames?
+                    self.save_figure(viewer, filename=cur_pngfile, filetype="png",
+                                     show_dialog=False, width=width, height=height)
+                    temp_png_files.append(cur_pngfile)
+
+                    # Wait for the roundtrip to the frontend to complete.
+                    while viewer.figure._upload_png_callback is not None:
+                        time.sleep(0.05)
+
                 i += i_step
+                self.movie_progress = 100 * (i - i_start) / n_frames
 
-                # Wait for the roundtrip to the frontend to complete.
-                while viewer.figure._upload_png_callback is not None:
-                    time.sleep(0.05)
+            if headless and not self.movie_interrupt:
+                throughput = n_frames / (time.perf_counter() - t_start)
+                self.hub.broadcast(SnackbarMessage(
+                    f"Saved {filename} ({n_frames} frames, {throughput:.1f} frames/s)",
+                    sender=self, color="success"))
 
-            if not self.movie_interrupt:
+            elif not self.movie_interrupt:
                 # Grab frame size.
                 frame_shape = cv2.imread(temp_png_files[0]).shape
                 frame_size = (frame_shape[1], frame_shape[0])
@@ -760,7 +791,9 @@ class Export(PluginTemplateMixin, ViewerSelectMixin, SubsetSelectMixin,
             self.hub.broadcast(SnackbarMessage(
                 f"Error saving {filename}: {e!r}", sender=self, color="error", traceback=e))
         finally:
-            cv2.destroyAllWindows()
+            if not headless:
+                # NOTE: not available (nor needed) with opencv-python-headless
+                cv2.destroyAllWindows()
             if video:
                 video.release()
             slice_plg.value = slice_plg.valid_values_sorted[orig_slice]
@@ -776,15 +809,22 @@ class Export(PluginTemplateMixin, ViewerSelectMixin, SubsetSelectMixin,
             self.movie_interrupt = False
 
     def save_movie(self, viewer, filename, filetype, i_start=None, i_end=None, fps=None,
-                   rm_temp_files=True, width=None, height=None):
+                   rm_temp_files=True, width=None, height=None, headless=False,
+                   blocking=None):
         """Save selected slices as a movie.
 
-        This method creates a PNG file per frame (``._cubeviz_movie_frame_<n>.png``)
+        By default, this method creates a PNG file per frame (``._cubeviz_movie_frame_<n>.png``)
         in the working directory before stitching all the frames into a movie.
         Please make sure you have sufficient memory for this operation.
         PNG files are deleted after the movie is created unless otherwise specified.
         If another PNG file with the same name already exists, it will be silently replaced.
 
+        With ``headless=True``, frames are instead rendered in Python directly from the
+        viewer state (image layers with their stretch, colormap and opacity) and streamed into
+        the encoder without temporary files or a round-trip to the frontend.  In this mode
+        the export runs in the calling thread by default (see ``blocking``) and so can be
+        used in batch jobs without a live browser.
+
         Parameters
         ----------
         i_start, i_end : int or `None`
@@ -815,6 +855,14 @@ class Export(PluginTemplateMixin, ViewerSelectMixin, SubsetSelectMixin,
         height : str, optional
             Height of the exported image. Required if width is provided.
 
+        headless : bool
+            Render frames server-side from the viewer state.  Default is `False`.
+
+        blocking : bool or `None`
+            Only return once the movie is written.  Only supported with ``headless=True``,
+            otherwise the movie is always recorded in a background thread.  Defaults to
+            the value of ``headless``.
+
         Returns
         -------
         out_filename : str
@@ -830,7 +878,12 @@ class Export(PluginTemplateMixin, ViewerSelectMixin, SubsetSelectMixin,
         if filetype != "mp4":
             raise NotImplementedError(f"filetype={filetype} not supported")
 
-        if viewer.shape is None:
+        if blocking is None:
+            blocking = headless
+        elif blocking and not headless:
+            raise ValueError("blocking=True is only supported with headless=True")
+
+        if viewer.shape is None and not headless:
             raise ValueError("Selected viewer has no display shape.")
 
         if fps is None:
@@ -854,10 +907,15 @@ class Export(PluginTemplateMixin, ViewerSelectMixin, SubsetSelectMixin,
         if i_end <= i_start:
             raise ValueError(f"No frames to write: i_start={i_start}, i_end={i_end}")
 
-        threading.Thread(
-            target=lambda: self._save_movie(viewer, i_start, i_end, fps, filename, rm_temp_files,
-                                            width, height)
-        ).start()
+        if blocking:
+            self._save_movie(viewer, i_start, i_end, fps, filename, rm_temp_files,
+                             width, height, headless=True)
+        else:
+            self._movie_thread = threading.Thread(
+                target=lambda: self._save_movie(viewer, i_start, i_end, fps, filename,
+                                                rm_temp_files, width, height, headless=headless)
+            )
+            self._movie_thread.start()
 
         return filename
 
@@ -919,3 +977,37 @@ class Export(PluginTemplateMixin, ViewerSelectMixin, SubsetSelectMixin,
         self.hub.broadcast(SnackbarMessage(
             f"Movie recording interrupted by user, {self.filename_value} will be deleted.",
             sender=self, color="warning"))
+
+
+def _movie_frame_size(viewer, width=None, height=None):
+    # (width, height) of the frames for a movie of the given viewer, following the same
+    # conventions as save_figure ("800px") but falling back on the native resolution of the
+    # viewer limits when the viewer has not been displayed
+    if width is not None and height is not None:
+        return int(str(width).rstrip('px')), int(str(height).rstrip('px'))
+    if viewer.shape is not None:
+        return int(viewer.shape[1]), int(viewer.shape[0])
+    state = viewer.state
+    return (max(int(np.ceil(state.x_max - state.x_min)), 1),
+            max(int(np.ceil(state.y_max - state.y_min)), 1))
+
+
+def _render_viewer_frame(viewer, frame_size):
+    """
+    Render the current image layers of a viewer into a BGR uint8 frame.
+
+    This uses the same glue composite array that backs the image shown in the frontend,
+    so the stretch, colormap, color mode, opacity and current slice of each layer are
+    respected, but without needing a round-trip through the browser.
+    """
+    width, height = frame_size
+    state = viewer.state
+    bounds = [(state.y_min, state.y_max, height), (state.x_min, state.x_max, width)]
+    rgba = viewer._composite(bounds=bounds)
+    if rgba is None:
+        return np.zeros((height, width, 3), dtype=np.uint8)
+    # composite onto a black background and flip so that the origin is in the lower-left
+    rgb = np.nan_to_num(rgba[::-1, :, :3] * rgba[::-1, :, 3:])
+    frame = np.clip(rgb * 255, 0, 255).astype(np.uint8)
+    # opencv expects BGR
+    return np.ascontiguousarray(frame[:, :, ::-1])
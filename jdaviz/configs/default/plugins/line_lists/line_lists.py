@@ -20,7 +20,7 @@ from jdaviz.core.events import (AddDataMessage,
                                 RedshiftMessage,
                                 SpectralMarksChangedMessage)
 from jdaviz.core.linelists import load_preset_linelist, get_linelist_metadata
-from jdaviz.core.marks import SpectralLine
+from jdaviz.core.marks import SpectralLines
 from jdaviz.core.registries import tray_registry
 from jdaviz.core.template_mixin import (PluginTemplateMixin, ViewerSelectMixin,
                                         CustomToolbarToggleMixin)
@@ -324,9 +324,10 @@ class LineListTool(PluginTemplateMixin, ViewerSelectMixin, CustomToolbarToggleMi
         z = u.Quantity(self.rs_redshift)
 
         for mark in self.spectrum_viewer.figure.marks:
-            # update ALL to this redshift, if adding support for per-line redshift
-            # this logic will need to change to not affect ALL lines
-            if not isinstance(mark, SpectralLine):
+            # update ALL to this redshift (vectorized over all lines in the mark), if
+            # adding support for per-line redshift this logic will need to change to not
+            # affect ALL lines
+            if not isinstance(mark, SpectralLines):
                 continue
 
             mark.redshift = z
@@ -584,8 +585,8 @@ class LineListTool(PluginTemplateMixin, ViewerSelectMixin, CustomToolbarToggleMi
     def update_line_mark_dict(self):
         self.line_mark_dict = {}
         for m in self.spectrum_viewer.figure.marks:
-            if isinstance(m, SpectralLine):
-                self.line_mark_dict[m.table_index] = m
+            if isinstance(m, SpectralLines):
+                self.line_mark_dict.update({line.table_index: line for line in m.lines})
 
         n_lines_shown = len(self.line_mark_dict)
 
@@ -927,14 +928,17 @@ class LineListTool(PluginTemplateMixin, ViewerSelectMixin, CustomToolbarToggleMi
 
             self.list_contents[listname]["color"] = color
 
+            mark_colors = {}
             for line in self.list_contents[listname]["lines"]:
                 line["colors"] = color
                 # Update the astropy table entry
                 name_rest = line["name_rest"]
                 self.spectrum_viewer.spectral_lines.loc[name_rest]["colors"] = color
-                # Update the color on the plot
-                if name_rest in self.line_mark_dict:
-                    self.line_mark_dict[name_rest].colors = [color]
+                mark_colors[name_rest] = color
+            # Update the colors on the plot
+            for mark in self.spectrum_viewer.figure.marks:
+                if isinstance(mark, SpectralLines):
+                    mark.set_colors(mark_colors)
 
             self.send_state('list_contents')
 
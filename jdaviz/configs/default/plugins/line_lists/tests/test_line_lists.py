@@ -6,11 +6,16 @@ import astropy.units as u
 from astropy.table import QTable
 from specutils import Spectrum
 
-from jdaviz.core.marks import SpectralLine
+from jdaviz.core.marks import SpectralLineHandle, SpectralLines
 from jdaviz.core.linelists import get_available_linelists
 from jdaviz.core.linelists import get_linelist_metadata
 
 
+def _plotted_lines(viewer):
+    return [line for mark in viewer.figure.marks if isinstance(mark, SpectralLines)
+            for line in mark.lines]
+
+
 # two-argument Table.loc is deprecated as of Astropy 7.2. Syntax update will be needed
 # and is as below:
 # Table.loc_indices.with_index(...):
@@ -52,6 +57,59 @@ class TestLineLists:
             == "Unknown (Custom)"
         )
 
+    def test_many_lines_single_mark(self, specviz_helper):
+        spec = Spectrum(flux=np.random.rand(100)*u.Jy,
+                        spectral_axis=np.arange(6000, 7000, 10)*u.AA)
+        specviz_helper.load_data(spec)
+        viewer = specviz_helper._app.get_viewer(
+            specviz_helper._default_spectrum_viewer_reference_name)
+        n_marks = len(viewer.figure.marks)
+
+        lt = QTable()
+        lt['linename'] = [f'L{i}' for i in range(2000)]
+        lt['rest'] = np.linspace(5000, 8000, 2000)*u.AA
+        lt['colors'] = ['#00FF00'] * 1000 + ['#0000FF'] * 1000
+        specviz_helper.load_line_list(lt)
+
+        # all lines are drawn by a single mark (plus the mark of the identified line)
+        lines_marks = [m for m in viewer.figure.marks if isinstance(m, SpectralLines)]
+        assert len(lines_marks) == 1
+        assert len(viewer.figure.marks) == n_marks + 2
+        lines_mark = lines_marks[0]
+        assert lines_mark.x.shape == (2000, 2)
+        assert lines_mark.colors[0] == '#00FF00'
+        assert lines_mark.colors[-1] == '#0000FF'
+
+        # redshift is applied to all lines at once
+        specviz_helper.set_redshift(0.1)
+        assert_allclose(lines_mark.x[:, 0], lt['rest'].value * 1.1)
+        assert_allclose(_plotted_lines(viewer)[10].obs_value, lt['rest'][10].value * 1.1)
+
+        viewer.state.x_min, viewer.state.x_max = 6000, 7000
+        n_left = np.sum(lt['rest'].value * 1.1 < 6000)
+        n_right = np.sum(lt['rest'].value * 1.1 > 7000)
+        assert viewer._offscreen_lines_marks.left.text == [f'\u25c0 {n_left}']
+        assert viewer._offscreen_lines_marks.right.text == [f'{n_right} \u25b6']
+
+        # identifying a line highlights it in its own mark
+        _plotted_lines(viewer)[10].identify = True
+        assert lines_mark.identified == 'L10 5015.007503751876'
+        assert_allclose(lines_mark.identified_mark.x, [lt['rest'][10].value * 1.1] * 2)
+
+        viewer.erase_spectral_lines(name_rest=['L10 5015.007503751876'])
+        assert lines_mark.x.shape == (1999, 2)
+        assert lines_mark.identified is None
+        assert len(lines_mark.identified_mark.x) == 0
+
+        # the individual lines are no longer marks in the figure
+        assert not any(isinstance(m, SpectralLineHandle) for m in viewer.figure.marks)
+        assert isinstance(_plotted_lines(viewer)[0], SpectralLineHandle)
+
+        # the former mark class is a deprecated alias of the handles to the lines
+        with pytest.warns(DeprecationWarning, match='SpectralLine is deprecated'):
+            from jdaviz.core.marks import SpectralLine
+        assert SpectralLine is SpectralLineHandle
+
     def test_redshift(self, specviz_helper, spectrum1d):
         # Also test that plugin is disabled before data is loaded.
         ll_plugin = specviz_helper.plugins['Line Lists']._obj
@@ -174,9 +232,8 @@ class TestLineLists:
         # Load second line, redshift should also be applied to it
         specviz_helper.plot_spectral_lines("O III")
 
-        viewer_lines = [mark for mark in specviz_helper._app.get_viewer(
-            specviz_helper._default_spectrum_viewer_reference_name).figure.marks
-            if isinstance(mark, SpectralLine)]
+        viewer_lines = _plotted_lines(specviz_helper._app.get_viewer(
+            specviz_helper._default_spectrum_viewer_reference_name))
 
         assert np.allclose([line.redshift for line in viewer_lines], 0.01)
 
@@ -198,9 +255,8 @@ class TestLineLists:
         # Load remaining lines
         specviz_helper.plot_spectral_lines(global_redshift)
 
-        viewer_lines = [mark for mark in specviz_helper._app.get_viewer(
-            specviz_helper._default_spectrum_viewer_reference_name).figure.marks
-            if isinstance(mark, SpectralLine)]
+        viewer_lines = _plotted_lines(specviz_helper._app.get_viewer(
+            specviz_helper._default_spectrum_viewer_reference_name))
 
         assert np.allclose([line.redshift for line in viewer_lines], 0.01)
 
@@ -253,12 +309,10 @@ class TestLineLists:
 
         # Verify that lines were plotted at the correct observed wavelength
         if hasattr(helper, '_default_spectrum_viewer_reference_name'):
-            viewer_lines = [mark for mark in helper._app.get_viewer(
-                            helper._default_spectrum_viewer_reference_name).figure.marks
-                            if isinstance(mark, SpectralLine)]
+            viewer_lines = _plotted_lines(helper._app.get_viewer(
+                            helper._default_spectrum_viewer_reference_name))
         else:
-            viewer_lines = [mark for mark in helper._app.get_viewer('1D Spectrum').figure.marks
-                            if isinstance(mark, SpectralLine)]
+            viewer_lines = _plotted_lines(helper._app.get_viewer('1D Spectrum'))
         assert np.all([line.redshift == 0.1 for line in viewer_lines])
 
         # Test erasing lines
@@ -1,4 +1,4 @@
-from traitlets import List, Unicode
+from traitlets import Bool, List, Unicode, observe
 
 from jdaviz.core.registries import tray_registry
 from jdaviz.core.template_mixin import PluginTemplateMixin, SelectPluginComponent
@@ -27,6 +27,9 @@ class Logger(PluginTemplateMixin):
 
     history = List().tag(sync=True)
 
+    timing_enabled = Bool(False).tag(sync=True)
+    timing_summary = List().tag(sync=True)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -45,7 +48,8 @@ class Logger(PluginTemplateMixin):
 
     @property
     def user_api(self):
-        expose = ['popup_verbosity', 'history_verbosity', 'history', 'clear_history']
+        expose = ['popup_verbosity', 'history_verbosity', 'history', 'clear_history',
+                  'timing_enabled', 'update_timing_summary']
         return PluginUserApi(self, expose=expose)
 
     def clear_history(self):
@@ -54,6 +58,37 @@ class Logger(PluginTemplateMixin):
     def vue_clear_history(self, *args):
         return self.clear_history()
 
+    @observe('timing_enabled')
+    def _timing_enabled_changed(self, msg={}):
+        self._app._timing.enabled = self.timing_enabled
+        self.update_timing_summary()
+
+    def update_timing_summary(self, max_rows=20):
+        """
+        Update the summary of the timing spans recorded in the app (see the ``timing``
+        attribute of the helper) shown in the logger.
+
+        Parameters
+        ----------
+        max_rows : int, optional
+            Number of entries to show, with the longest total duration.
+        """
+        timing = self._app._timing
+        self.timing_enabled = timing.enabled
+        self.timing_summary = [{'name': entry['name'],
+                                'category': entry['category'],
+                                'count': entry['count'],
+                                'total': f"{entry['total'] * 1e3:.1f}",
+                                'max': f"{entry['max'] * 1e3:.1f}"}
+                               for entry in timing.summary()[:max_rows]]
+
+    def vue_update_timing_summary(self, *args):
+        self.update_timing_summary()
+
+    def vue_clear_timing(self, *args):
+        self._app._timing.clear()
+        self.update_timing_summary()
+
     def queue_message(self, msg, msg_level=None):
         if msg_level not in _verbosity_levels:
             msg_level = 'info'
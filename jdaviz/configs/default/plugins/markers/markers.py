@@ -1,6 +1,7 @@
 import numpy as np
 from astropy import units as u
 from astropy.coordinates import SkyCoord
+from scipy.spatial import cKDTree
 from traitlets import Bool, Unicode, Instance, observe, default
 import ipywidgets as widgets
 
@@ -119,6 +120,11 @@ class Markers(PluginTemplateMixin, ViewerSelectMixin, TableMixin):
         self._distance_first_point = None
         self._temporary_dist_measure = None
         self._viewer_for_drawing = None
+        # per-viewer table row index of each point in the MarkersMark of that viewer
+        self._mark_rows = {}
+        # per-viewer cached KD-tree (and the scaling it was built with) of the marker
+        # positions used for snapping
+        self._snap_index = {}
 
         # Set the callbacks for each table's clear button
         self.table._clear_callback = self._clear_markers_table_callback
@@ -191,6 +197,8 @@ class Markers(PluginTemplateMixin, ViewerSelectMixin, TableMixin):
         """
         for mark in self.marks.values():
             mark.clear()
+        self._mark_rows.clear()
+        self._snap_index.clear()
 
         # The only job here is to announce that the table is empty.
         self.hub.broadcast(MarkersPluginUpdate(table_length=0, sender=self))
@@ -233,23 +241,34 @@ class Markers(PluginTemplateMixin, ViewerSelectMixin, TableMixin):
     def _on_viewer_added(self, msg):
         self._create_viewer_callbacks(self._app.get_viewer_by_id(msg.viewer_id))
 
+    @staticmethod
+    def _viewer_id(viewer):
+        return viewer.reference if viewer.reference is not None else viewer.reference_id
+
+    def _in_viewer_mask(self, viewer):
+        """
+        Boolean mask of the rows in the markers table that belong to data shown in ``viewer``.
+        """
+        viewer_loaded_data = [lyr.layer.label for lyr in viewer.layers]
+        # note: could eventually have a user-provided switch to show markers in other viewers
+        # by just skipping this first viewer_label == viewer_id check
+        return ((np.asarray(self.table._qtable['viewer']) == self._viewer_id(viewer))
+                & np.isin(np.asarray(self.table._qtable['data_label']), viewer_loaded_data))
+
     def _recompute_mark_positions(self, viewer):
         if self.table is None or self.table._qtable is None:
             return
         if 'world_ra' not in self.table.headers_avail:
             return
-        viewer_id = viewer.reference if viewer.reference is not None else viewer.reference_id
-        viewer_loaded_data = [lyr.layer.label for lyr in viewer.layers]
+        viewer_id = self._viewer_id(viewer)
         data_labels = self.table._qtable['data_label']
-        viewer_labels = self.table._qtable['viewer']
-        # note: could eventually have a user-provided switch to show markers in other viewers
-        # by just skipping this first viewer_label == viewer_id check
-        in_viewer = [viewer_label == viewer_id and data_label in viewer_loaded_data
-                     for viewer_label, data_label in zip(viewer_labels, data_labels)]
+        in_viewer = self._in_viewer_mask(viewer)
         viewer_mark = self._get_mark(viewer)
         if not np.any(in_viewer):
             viewer_mark.x, viewer_mark.y = [], []
+            self._mark_rows[viewer_id] = np.array([], dtype=int)
             return
+        rows = np.flatnonzero(in_viewer)
 
         if self._app._align_by.lower() == 'wcs':
             # convert from the sky coordinates in the table to pixels via the WCS of the current
@@ -266,6 +285,7 @@ class Markers(PluginTemplateMixin, ViewerSelectMixin, TableMixin):
             except Exception:
                 # fail gracefully
                 new_x, new_y = [], []
+                rows = np.array([], dtype=int)
 
         elif self._app._align_by.lower() == 'pixels':
             # When aligning by pixels, we can just use the pixel coordinates
@@ -286,8 +306,10 @@ class Markers(PluginTemplateMixin, ViewerSelectMixin, TableMixin):
             pixel_y = np.asarray(self.table._qtable['pixel_y'])
             new_x = np.append(new_x, pixel_x[pixel_only_inds])
             new_y = np.append(new_y, pixel_y[pixel_only_inds])
+            rows = np.append(rows, np.flatnonzero(pixel_only_inds))
 
         viewer_mark.x, viewer_mark.y = new_x, new_y
+        self._mark_rows[viewer_id] = rows
 
     def _add_sky_distance_row(self, p1, p2, viewer):
         world_avail = ('world_ra' in p1 and 'world_ra' in p2 and
@@ -385,6 +407,31 @@ class Markers(PluginTemplateMixin, ViewerSelectMixin, TableMixin):
 
         return text_ui, text_plot
 
+    def _get_snap_index(self, viewer, x_scale, y_scale):
+        """
+        Return a KD-tree of the positions of the markers in ``viewer`` (divided by
+        ``x_scale`` and ``y_scale``, or ignoring y if ``y_scale`` is None) and the index
+        into the mark of each point in the tree.  The tree is cached per-viewer and only
+        rebuilt when the marker positions or the scaling change.
+        """
+        viewer_mark = self._get_mark(viewer)
+        viewer_id = self._viewer_id(viewer)
+        cache_key = (viewer_mark.x, viewer_mark.y, x_scale, y_scale)
+        cached = self._snap_index.get(viewer_id)
+        if (cached is not None and cached[0][0] is cache_key[0]
+                and cached[0][1] is cache_key[1] and cached[0][2:] == cache_key[2:]):
+            return cached[1], cached[2]
+
+        xs = np.asarray(viewer_mark.x, dtype=float) / x_scale
+        if y_scale is None:
+            points = xs[:, np.newaxis]
+        else:
+            points = np.column_stack([xs, np.asarray(viewer_mark.y, dtype=float) / y_scale])
+        mark_inds = np.flatnonzero(np.all(np.isfinite(points), axis=1))
+        tree = cKDTree(points[mark_inds]) if len(mark_inds) else None
+        self._snap_index[viewer_id] = (cache_key, tree, mark_inds)
+        return tree, mark_inds
+
     def _get_snap_coordinates(self, viewer):
         viewer_mark = self._get_mark(viewer)
         cursor_coords = self.coords_info.as_dict()
@@ -393,81 +440,56 @@ class Markers(PluginTemplateMixin, ViewerSelectMixin, TableMixin):
         if not len(viewer_mark.x) or cursor_x is None or cursor_y is None:
             return cursor_coords
 
-        marker_xs, marker_ys = viewer_mark.x, viewer_mark.y
-        distances_sq = None
-
+        x_scale = y_scale = None
         if ('x' in viewer.scales and 'y' in viewer.scales and
                 hasattr(viewer.scales['x'], 'domain') and hasattr(viewer.scales['x'], 'range') and
                 hasattr(viewer.scales['y'], 'domain') and hasattr(viewer.scales['y'], 'range')):
 
-            x_scale = viewer.scales['x']
-            y_scale = viewer.scales['y']
-
-            x_pixel_span = abs(x_scale.range[1] - x_scale.range[0])
-            y_pixel_span = abs(y_scale.range[1] - y_scale.range[0])
+            x_pixel_span = abs(viewer.scales['x'].range[1] - viewer.scales['x'].range[0])
+            y_pixel_span = abs(viewer.scales['y'].range[1] - viewer.scales['y'].range[0])
 
             if x_pixel_span > 0 and y_pixel_span > 0:
-                x_domain_span = x_scale.domain[1] - x_scale.domain[0]
-                x_units_per_px = x_domain_span / x_pixel_span
-
-                y_domain_span = y_scale.domain[1] - y_scale.domain[0]
-                y_units_per_px = y_domain_span / y_pixel_span
-
-                dx_pix = (marker_xs - cursor_x) / x_units_per_px
-                dy_pix = (marker_ys - cursor_y) / y_units_per_px
-
-                # Use 1D distance for spectrum viewers
-                if not _is_image_viewer(viewer):
-                    # For spectrum viewers, only consider the distance along the spectral axis.
-                    distances_sq = dx_pix**2
-                else:
-                    # For image viewers, consider the 2d distance.
-                    distances_sq = dx_pix**2 + dy_pix**2
-
-        # If the preferred method was not possible or failed, use the fallback.
-        if distances_sq is None:
+                # distances are measured in screen pixels
+                x_domain = viewer.scales['x'].domain
+                y_domain = viewer.scales['y'].domain
+                x_scale = (x_domain[1] - x_domain[0]) / x_pixel_span
+                y_scale = (y_domain[1] - y_domain[0]) / y_pixel_span
+
+        # If the preferred method was not possible, use the fallback.
+        if not x_scale or not y_scale:
             try:
-                x_data_range = viewer.state.x_max - viewer.state.x_min
-                y_data_range = viewer.state.y_max - viewer.state.y_min
-
-                if not x_data_range or not y_data_range:
-                    return cursor_coords
-
-                norm_dx = (marker_xs - cursor_x) / x_data_range
-                norm_dy = (marker_ys - cursor_y) / y_data_range
-
-                if not _is_image_viewer(viewer):
-                    distances_sq = norm_dx**2
-                else:
-                    distances_sq = norm_dx**2 + norm_dy**2
-
+                x_scale = viewer.state.x_max - viewer.state.x_min
+                y_scale = viewer.state.y_max - viewer.state.y_min
             except Exception:
                 # If all else fails, do not snap
                 return cursor_coords
 
-        if distances_sq is None:
-            # This case would be hit if both primary and fallback methods fail.
-            return cursor_coords
+            if not x_scale or not y_scale:
+                return cursor_coords
 
-        # Find the closest marker using the calculated distances.
-        closest_marker_index_in_viewer = np.nanargmin(distances_sq)
-        viewer_id = viewer.reference if viewer.reference is not None else viewer.reference_id
-        viewer_loaded_data = [lyr.layer.label for lyr in viewer.layers]
-        all_items_table = self.table.export_table()
+        if not _is_image_viewer(viewer):
+            # For spectrum viewers, only consider the distance along the spectral axis.
+            y_scale = None
 
-        if all_items_table is None:
+        tree, mark_inds = self._get_snap_index(viewer, x_scale, y_scale)
+        if tree is None:
             return cursor_coords
-
-        in_viewer_indices = [
-            i for i, item in enumerate(all_items_table)
-            if item.get('viewer') == viewer_id and item.get('data_label') in viewer_loaded_data
-        ]
-
-        if not in_viewer_indices or closest_marker_index_in_viewer >= len(in_viewer_indices):
+        cursor = [cursor_x / x_scale]
+        if y_scale is not None:
+            cursor.append(cursor_y / y_scale)
+        closest_marker_index_in_viewer = int(mark_inds[tree.query(cursor)[1]])
+
+        # map from the point in the mark back to its row in the markers table
+        qtable = self.table._qtable
+        if qtable is None:
+            return cursor_coords
+        mark_rows = self._mark_rows.get(self._viewer_id(viewer))
+        if mark_rows is None or len(mark_rows) != len(viewer_mark.x):
+            mark_rows = np.flatnonzero(self._in_viewer_mask(viewer))
+        if closest_marker_index_in_viewer >= len(mark_rows):
             return cursor_coords
 
-        snapped_table_index = in_viewer_indices[closest_marker_index_in_viewer]
-        snapped_row = all_items_table[snapped_table_index]
+        snapped_row = qtable[int(mark_rows[closest_marker_index_in_viewer])]
 
         snapped_coords = {k: snapped_row.get(k) for k in self.table.headers_avail}
         snapped_coords['axes_x'] = viewer_mark.x[closest_marker_index_in_viewer]
@@ -561,7 +583,12 @@ class Markers(PluginTemplateMixin, ViewerSelectMixin, TableMixin):
             except ValueError as err:  # pragma: no cover
                 raise ValueError(f'failed to add {row_info} to table: {repr(err)}')
             x, y = row_info['axes_x'], row_info['axes_y']
-            self._get_mark(viewer).append_xy(getattr(x, 'value', x), getattr(y, 'value', y))
+            viewer_mark = self._get_mark(viewer)
+            viewer_id = self._viewer_id(viewer)
+            mark_rows = self._mark_rows.get(viewer_id, np.array([], dtype=int))
+            if len(mark_rows) == len(viewer_mark.x):
+                self._mark_rows[viewer_id] = np.append(mark_rows, len(self.table) - 1)
+            viewer_mark.append_xy(getattr(x, 'value', x), getattr(y, 'value', y))
 
         # on mac 'option + d' gets transmitted as delta instead of just d + alt
         elif data['event'] == 'keydown' and data.get('key') in ('d', '∂'):
@@ -523,6 +523,45 @@ def test_distance_tool_snapping(cubeviz_helper, spectrum1d_cube):
     assert mp._obj.measurements_table.items[0]['Distance (pix)'] == "0.00"
 
 
+def test_distance_tool_snapping_uses_cached_index(imviz_helper, monkeypatch):
+    """Tests that snapping picks the nearest marker without exporting the table."""
+    imviz_helper.load_data(np.zeros((100, 100)))
+    iv = imviz_helper._app.get_viewer('imviz-0')
+    mp = imviz_helper.plugins['Markers']
+    mp.open_in_tray()
+    label_mouseover = imviz_helper._coords_info
+
+    for x, y in [(10, 10), (50, 60), (80, 20), (30, 90)]:
+        label_mouseover._viewer_mouse_event(iv, {'event': 'mousemove', 'domain': {'x': x, 'y': y}})
+        mp._obj._on_viewer_key_event(iv, {'event': 'keydown', 'key': 'm'})
+
+    def export_table(*args, **kwargs):
+        raise AssertionError('the table should not be exported when snapping')
+    monkeypatch.setattr(mp._obj.table, 'export_table', export_table)
+
+    label_mouseover._viewer_mouse_event(iv, {'event': 'mousemove', 'domain': {'x': 77, 'y': 24}})
+    mp._obj._on_viewer_key_event(iv, {'event': 'keydown', 'key': 'd', 'altKey': True})
+    first_point = mp._obj._distance_first_point
+    assert_allclose([first_point['axes_x'], first_point['axes_y']], [80, 20])
+    assert_allclose([first_point['pixel_x'], first_point['pixel_y']], [80, 20])
+    snap_index = mp._obj._snap_index['imviz-0']
+
+    label_mouseover._viewer_mouse_event(iv, {'event': 'mousemove', 'domain': {'x': 28, 'y': 85}})
+    mp._obj._on_viewer_key_event(iv, {'event': 'keydown', 'key': 'd', 'altKey': True})
+    # the index is re-used as long as the markers do not change
+    assert mp._obj._snap_index['imviz-0'] is snap_index
+    assert mp._obj.measurements_table.items[-1]['Distance (pix)'] == f"{np.hypot(50, 70):.2f}"
+
+    # adding a marker updates the index
+    label_mouseover._viewer_mouse_event(iv, {'event': 'mousemove', 'domain': {'x': 75, 'y': 25}})
+    mp._obj._on_viewer_key_event(iv, {'event': 'keydown', 'key': 'm'})
+    label_mouseover._viewer_mouse_event(iv, {'event': 'mousemove', 'domain': {'x': 77, 'y': 24}})
+    mp._obj._on_viewer_key_event(iv, {'event': 'keydown', 'key': 'd', 'altKey': True})
+    first_point = mp._obj._distance_first_point
+    assert_allclose([first_point['axes_x'], first_point['axes_y']], [75, 25])
+    assert first_point['pixel_x'] == mp._obj.table._qtable['pixel_x'][-1]
+
+
 def test_distance_tool_clearing(cubeviz_helper, spectrum1d_cube):
     """Tests that clearing the measurements table removes marks from the viewer."""
     cubeviz_helper.load_data(spectrum1d_cube, "test")
@@ -5,7 +5,8 @@ import pytest
 import numpy as np
 
 from astropy import units as u
-from astropy.modeling.fitting import TRFLSQFitter
+from astropy.modeling.fitting import LevMarLSQFitter, TRFLSQFitter
+from astropy.modeling.models import Const1D
 from astropy.tests.helper import assert_quantity_allclose
 from astropy.utils.compat.optional_deps import HAS_SCIPY
 from astropy.utils.exceptions import AstropyUserWarning
@@ -167,3 +168,42 @@ def test_blackbody_array_temperature():
     multibb = BlackBody(np.ones(4) * u.K)
     flux = multibb(np.ones((3, 4)) * u.mm)
     assert flux.shape == (3, 4)
+
+
+@pytest.mark.parametrize("output_units", ('SNU', 'FNU', 'FLAM', 'SLAM', u.MJy))
+def test_blackbody_fit_deriv(output_units):
+    """Compare the analytic derivatives with finite differences."""
+    b = BlackBody(800 * u.K, scale=2.0, output_units=output_units)
+    x = np.linspace(1, 20, 11) * u.micron
+    temperature, scale = 800.0, 2.0
+
+    d_temperature, d_scale = b.fit_deriv(x, temperature, scale)
+
+    dt = 1e-3
+    numerical_d_temperature = (b.evaluate(x, temperature + dt, scale)
+                               - b.evaluate(x, temperature - dt, scale)) / (2 * dt)
+    np.testing.assert_allclose(d_temperature, numerical_d_temperature, rtol=1e-6)
+    np.testing.assert_allclose(d_scale, b.evaluate(x, temperature, 1.0), rtol=1e-12)
+
+
+@pytest.mark.skipif(not HAS_SCIPY, reason="requires scipy")
+def test_blackbody_compound_fit_analytic_jacobian():
+    fitter = LevMarLSQFitter()
+
+    wav = np.linspace(1, 20, 100) * u.micron
+    truth = (BlackBody(800 * u.K, scale=2e-9, output_units=u.Jy)
+             + Const1D(0.05 * u.Jy))
+    fnu = truth(wav)
+
+    initial = (BlackBody(700 * u.K, scale=1e-9, output_units=u.Jy)
+               + Const1D(0.01 * u.Jy))
+    analytic = fitter(initial, wav, fnu, maxiter=1000)
+    n_analytic = fitter.fit_info['nfev']
+    numerical = fitter(initial, wav, fnu, maxiter=1000, estimate_jacobian=True)
+    n_numerical = fitter.fit_info['nfev']
+
+    assert_quantity_allclose(analytic.temperature_0, 800 * u.K)
+    assert_quantity_allclose(analytic.amplitude_1, 0.05 * u.Jy)
+    assert_quantity_allclose(numerical.temperature_0, 800 * u.K)
+    assert_quantity_allclose(numerical.amplitude_1, 0.05 * u.Jy, rtol=1e-2)
+    assert n_analytic < n_numerical
@@ -1,6 +1,8 @@
 import math
 import os
 import warnings
+import weakref
+from collections import OrderedDict
 
 import matplotlib
 import numpy as np
@@ -108,6 +110,180 @@ def _round_step(step):
     return float(np.round(step, decimals)), decimals
 
 
+class _HistogramSampleCache:
+    """
+    Per-layer cache of the random subsamples the limits of the stretch histogram are
+    computed from.
+
+    For each (data, attribute) pair, a random subset of the finite values of the full
+    array is drawn once, along with a coarse grid of tiles over the first two axes,
+    each holding its own random subset and the positions of the sampled pixels.
+    Zoom-restricted histograms are then derived from the tiles overlapping the zoom
+    window instead of re-slicing the raw array.  Entries are keyed on the data hash
+    (falling back on the identity of the underlying array) so that they are
+    invalidated whenever the data themselves change.
+
+    Parameters
+    ----------
+    sample_size : int
+        Maximum number of values returned for a histogram.
+    tile_grid : int
+        Maximum number of tiles along each of the first two axes.
+    max_entries : int
+        Maximum number of layers kept in the cache before the least recently used
+        entry is dropped.
+    """
+    # zoom windows with fewer pixels than this are cheap enough to slice directly
+    DIRECT_SLICE_PIXELS = 1_000_000
+
+    def __init__(self, sample_size=RANDOM_SUBSET_SIZE, tile_grid=16, max_entries=8):
+        self.sample_size = sample_size
+        self.tile_grid = tile_grid
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def clear(self):
+        self._entries.clear()
+
+    def _get_entry(self, data, attribute, array):
+        key = (data.uuid, str(attribute))
+        data_hash = data.meta.get('_data_hash')
+        entry = self._entries.get(key)
+        if (entry is not None and entry['data_hash'] == data_hash
+                and entry['array_ref']() is array):
+            self._entries.move_to_end(key)
+            return entry
+
+        entry = self._build_entry(array)
+        entry['data_hash'] = data_hash
+        entry['array_ref'] = weakref.ref(array)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def _build_entry(self, array):
+        # deterministic sampling so that revisiting a layer shows the same histogram
+        rng = np.random.default_rng(0)
+        entry = {'size': array.size, 'shape': array.shape,
+                 'sample': _random_finite_sample(array, self.sample_size, rng)}
+        entry['limits'] = _sample_percentile_limits(entry['sample'])
+
+        if array.ndim < 2:
+            entry['tiles'] = []
+            return entry
+
+        ny, nx = array.shape[:2]
+        y_edges = np.unique(np.linspace(0, ny, min(self.tile_grid, ny) + 1).astype(int))
+        x_edges = np.unique(np.linspace(0, nx, min(self.tile_grid, nx) + 1).astype(int))
+        n_tiles = (len(y_edges) - 1) * (len(x_edges) - 1)
+        # spread a total budget of samples over the tiles, so that a zoom window
+        # covering a fraction of the image still retains enough samples
+        per_tile = max(self.sample_size * 16 // n_tiles, 1)
+        tiles = []
+        for y0, y1 in zip(y_edges[:-1], y_edges[1:]):
+            for x0, x1 in zip(x_edges[:-1], x_edges[1:]):
+                tile_shape = (y1 - y0, x1 - x0) + array.shape[2:]
+                inds = np.unravel_index(_random_indices(int(np.prod(tile_shape)),
+                                                        per_tile, rng),
+                                        tile_shape)
+                yy, xx = inds[0] + y0, inds[1] + x0
+                # gather the sampled pixels from the array itself, so that only those
+                # (and not the whole tile) are read
+                values = array[(yy, xx) + inds[2:]]
+                finite = np.isfinite(values)
+                # only the positions along the first two axes matter for windowing
+                tiles.append({'bounds': (y0, y1, x0, x1),
+                              'values': values[finite],
+                              'y': yy[finite], 'x': xx[finite]})
+        entry['tiles'] = tiles
+        return entry
+
+    def get_sample(self, data, attribute, array, window=None):
+        """
+        Return a random subsample of the finite values of ``array``.
+
+        Parameters
+        ----------
+        data : `~glue.core.data.Data`
+            The glue data containing ``array``, used to key the cache.
+        attribute : `~glue.core.component_id.ComponentID` or str
+            The component of ``data`` corresponding to ``array``.
+        array : ndarray
+            The component array.
+        window : tuple or None
+            ``(y_min, y_max, x_min, x_max)`` in array indices along the first two axes
+            or None to sample the full array.
+
+        Returns
+        -------
+        sample : ndarray
+            1D array of (at most ``sample_size``) finite values.
+        n_pixels : int
+            Number of pixels covered by ``array`` (or ``window``).
+        limits : tuple
+            The 2.5 and 97.5 percentiles of ``sample``.
+        """
+        if window is None:
+            entry = self._get_entry(data, attribute, array)
+            return entry['sample'], entry['size'], entry['limits']
+
+        y_min, y_max, x_min, x_max = window
+        ny, nx = array.shape[:2]
+        y_min, y_max = np.clip([y_min, y_max], 0, ny)
+        x_min, x_max = np.clip([x_min, x_max], 0, nx)
+        n_pixels = int(max(y_max - y_min, 0) * max(x_max - x_min, 0)
+                       * np.prod(array.shape[2:], dtype=int))
+
+        if n_pixels <= self.DIRECT_SLICE_PIXELS:
+            sub_data = array[y_min:y_max, x_min:x_max]
+            rng = np.random.default_rng(0)
+            sample = _random_finite_sample(sub_data, self.sample_size, rng)
+            return sample, n_pixels, _sample_percentile_limits(sample)
+
+        entry = self._get_entry(data, attribute, array)
+        samples = []
+        for tile in entry['tiles']:
+            ty0, ty1, tx0, tx1 = tile['bounds']
+            if ty1 <= y_min or ty0 >= y_max or tx1 <= x_min or tx0 >= x_max:
+                continue
+            in_window = ((tile['y'] >= y_min) & (tile['y'] < y_max)
+                         & (tile['x'] >= x_min) & (tile['x'] < x_max))
+            samples.append(tile['values'][in_window])
+        sample = np.concatenate(samples) if len(samples) else np.array([])
+        if sample.size > self.sample_size:
+            rng = np.random.default_rng(0)
+            sample = rng.choice(sample, size=self.sample_size, replace=False)
+        return sample, n_pixels, _sample_percentile_limits(sample)
+
+
+def _random_indices(n, size, rng):
+    # sorted random flat indices into an array of n elements (all of them if n <= size).
+    # Indices are drawn with replacement and duplicates dropped, which needs memory in
+    # size rather than in n (as would rng.choice without replacement).
+    if n <= size:
+        return np.arange(n)
+    return np.unique(rng.integers(n, size=size))
+
+
+def _random_finite_sample(array, size, rng):
+    array = np.asarray(array)
+    # oversample to account for non-finite entries before drawing the final subset
+    values = array[np.unravel_index(_random_indices(array.size, 2 * size, rng), array.shape)]
+    values = values[np.isfinite(values)]
+    if values.size > size:
+        values = rng.choice(values, size=size, replace=False)
+    return values
+
+
+def _sample_percentile_limits(sample):
+    # equivalent to PercentileInterval(95).get_limits(sample)
+    if not len(sample):
+        return np.nan, np.nan
+    return tuple(np.percentile(sample, [2.5, 97.5]))
+
+
 @tray_registry('g-plot-options', label="Plot Options",
                category='core', sidebar='settings', subtab=0)
 class PlotOptions(PluginTemplateMixin, ViewerSelectMixin):
@@ -523,6 +699,9 @@ class PlotOptions(PluginTemplateMixin, ViewerSelectMixin):
         # to refresh the top-layer determination (see ``_watch_layer_visibility``)
         self._visibility_watched = set()
 
+        # cached random subsamples of the image layers for the stretch histogram
+        self._hist_sample_cache = _HistogramSampleCache()
+
         if self.config == 'deconfigged':
             self.docs_link = f'https://jdaviz.readthedocs.io/en/{self.vdocs}/settings/plot_options.html'  # noqa
 
@@ -1340,19 +1519,18 @@ class PlotOptions(PluginTemplateMixin, ViewerSelectMixin):
 
         comp = data.get_component(layer.state.attribute)
 
-        # TODO: further optimization could be done by caching sub_data
         if self.stretch_hist_zoom_limits and (not self.layer_multiselect or len(self.layer_selected) == 1):  # noqa
             if hasattr(viewer, '_get_zoom_limits'):
                 # Viewer limits. This takes account of Imviz linking.
                 xy_limits = viewer._get_zoom_limits(data).astype(int)
                 x_limits = xy_limits[:, 0]
                 y_limits = xy_limits[:, 1]
-                x_min = max(x_limits.min(), 0)
-                x_max = x_limits.max()
-                y_min = max(y_limits.min(), 0)
-                y_max = y_limits.max()
-
+                y_min, y_max = max(y_limits.min(), 0), y_limits.max()
+                x_min, x_max = max(x_limits.min(), 0), x_limits.max()
                 sub_data = comp.data[y_min:y_max, x_min:x_max]
+                _, n_pixels, hist_lims = self._hist_sample_cache.get_sample(
+                    data, layer.state.attribute, comp.data,
+                    window=(y_min, y_max, x_min, x_max))
 
             else:
                 # spectrum-2d-viewer, for example.  We'll assume the viewer
@@ -1370,28 +1548,24 @@ class PlotOptions(PluginTemplateMixin, ViewerSelectMixin):
                                 (y_data <= viewer.state.y_max))
 
                 sub_data = comp.data[inds]
+                n_pixels = sub_data.size
+                hist_lims = _sample_percentile_limits(
+                    _random_finite_sample(sub_data, RANDOM_SUBSET_SIZE,
+                                          np.random.default_rng(0)))
 
         else:
             # include all data, regardless of zoom limits
             sub_data = comp.data
+            _, n_pixels, hist_lims = self._hist_sample_cache.get_sample(
+                data, layer.state.attribute, comp.data)
 
+        # the histogram is computed by glue from a random subset of the data, with the
+        # counts scaled to the number of pixels in the data, whereas its limits are taken
+        # from the cached subsamples
         self.stretch_histogram.viewer.state.random_subset = RANDOM_SUBSET_SIZE
         self.stretch_histogram._update_data('histogram', x=sub_data)
 
-        if len(sub_data) > 0:
-
-            # Use glue to compute the statistics since this allows us to use
-            # a random subset of the data to compute the histogram.
-            # The 2.5 and 97.5 hardcoded here is equivalent to
-            # PercentileInterval(95).get_limits(sub_data)
-            glue_data = self.stretch_histogram._app.data_collection['histogram']
-            hist_lims = (
-                glue_data.compute_statistic('percentile', glue_data.id['x'],
-                                            percentile=2.5, random_subset=RANDOM_SUBSET_SIZE),
-                glue_data.compute_statistic('percentile', glue_data.id['x'],
-                                            percentile=97.5, random_subset=RANDOM_SUBSET_SIZE)
-            )
-
+        if n_pixels > 0:
             # set the stepsize for vmin/vmax to be approximately 1% of the range of the
             # histogram (within the percentile interval), rounded to 1-2 significant digits
             # to avoid random step sizes.  This logic is somewhat arbitrary and can be safely
@@ -1403,7 +1577,7 @@ class PlotOptions(PluginTemplateMixin, ViewerSelectMixin):
                 self.stretch_histogram.viewer.state.hist_x_min = hist_lims[0]
                 self.stretch_histogram.viewer.state.hist_x_max = hist_lims[1]
 
-        self.stretch_histogram.figure.title = f"{len(sub_data)} pixels"
+        self.stretch_histogram.figure.title = f"{n_pixels} pixels"
 
         # update the n_bins since this may be a new layer
         self._histogram_nbins_changed()
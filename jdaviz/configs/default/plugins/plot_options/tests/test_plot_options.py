@@ -3,6 +3,7 @@ import pytest
 from astropy import units as u
 from astropy.nddata import NDData
 from astropy.table import QTable
+from glue.core import Data
 import glue_jupyter
 import matplotlib
 from numpy.testing import assert_allclose
@@ -11,7 +12,8 @@ from photutils.datasets import make_4gaussians_image
 from regions import CirclePixelRegion, PixCoord
 from jdaviz.configs.imviz.tests.utils import _image_hdu_wcs
 
-from jdaviz.configs.default.plugins.plot_options.plot_options import SplineStretch
+from jdaviz.configs.default.plugins.plot_options.plot_options import (SplineStretch,
+                                                                      _HistogramSampleCache)
 
 
 @pytest.mark.filterwarnings('ignore')
@@ -168,6 +170,34 @@ def test_stretch_histogram(cubeviz_helper, spectrum1d_cube_with_uncerts):
     po_prevzoom.activate()
 
 
+def test_stretch_histogram_sample_cache():
+    arr = np.arange(2000 * 1000, dtype=float).reshape(2000, 1000)
+    arr[:10] = np.nan
+    data = Data(x=arr, label='image')
+    cache = _HistogramSampleCache(sample_size=1000, tile_grid=8)
+
+    sample, n_pixels, limits = cache.get_sample(data, 'x', arr)
+    assert len(sample) == 1000
+    assert n_pixels == arr.size
+    assert np.all(np.isfinite(sample))
+    assert limits[0] < limits[1]
+
+    # repeated requests reuse the cached subsample
+    assert cache.get_sample(data, 'x', arr)[0] is sample
+
+    # zoom windows larger than the direct-slice threshold are derived from the tiles
+    cache.DIRECT_SLICE_PIXELS = 0
+    window_sample, n_pixels, _ = cache.get_sample(data, 'x', arr, window=(500, 1500, 0, 250))
+    assert n_pixels == 1000 * 250
+    assert len(window_sample) > 0
+    rows, cols = np.divmod(window_sample, 1000)
+    assert np.all((rows >= 500) & (rows < 1500) & (cols < 250))
+
+    # replacing the array invalidates the cached entry
+    new_arr = arr + 1
+    assert cache.get_sample(data, 'x', new_arr)[0] is not sample
+
+
 @pytest.mark.filterwarnings('ignore')
 def test_user_api(cubeviz_helper, spectrum1d_cube):
     cubeviz_helper.load_data(spectrum1d_cube)
@@ -11,7 +11,7 @@ from glue.core.edit_subset_mode import (AndMode, AndNotMode, OrMode,
                                         ReplaceMode, XorMode, NewMode)
 from glue.core.roi import CircularROI, CircularAnnulusROI, EllipticalROI, RectangularROI
 from glue.core.subset import (RoiSubsetState, RangeSubsetState, CompositeSubsetState,
-                              MaskSubsetState, ElementSubsetState)
+                              MaskSubsetState, ElementSubsetState, OrState)
 from glue.icons import icon_path
 from glue_jupyter.widgets.subset_mode_vuetify import SelectionModeMenu
 from glue_jupyter.common.toolbar_vuetify import read_icon
@@ -1370,6 +1370,22 @@ class SubsetTools(PluginTemplateMixin, LoadersMixin):
                     # self.app.session.edit_subset_mode.edit_subset = None
                     self.subset.selected = self.subset.default_text
 
+                # Consecutive regions that are combined with 'or' are collected and
+                # applied as a single compound subset state, rather than updating the
+                # subset (and everything listening to it) once per region.
+                pending_rois = []
+                pending_label = None
+
+                def apply_pending_rois():
+                    nonlocal pending_label
+                    if not len(pending_rois):
+                        return
+                    self._apply_rois(viewer, pending_rois)
+                    if pending_label is not None:
+                        self.rename_selected(pending_label)
+                    pending_rois.clear()
+                    pending_label = None
+
                 label_index = 0
                 for index, region in enumerate(regions):
                     # Set combination mode for how region will be applied to current subset
@@ -1381,9 +1397,9 @@ class SubsetTools(PluginTemplateMixin, LoadersMixin):
 
                     # Combination_mode should be 'new' if combo_mode is not set or explicitly 'new'
                     if combo_mode == 'new' or combo_mode is None:
-                        self.combination_mode.selected = 'new'
-                    elif combo_mode:
-                        self.combination_mode.selected = combo_mode
+                        mode_selected = 'new'
+                    else:
+                        mode_selected = combo_mode
 
                     if (isinstance(region, (SkyCircularAperture, SkyEllipticalAperture,
                                             SkyRectangularAperture, SkyCircularAnnulus,
@@ -1417,6 +1433,28 @@ class SubsetTools(PluginTemplateMixin, LoadersMixin):
                                            CircularAnnulus, SkyCircularAnnulus)):
                         region = aperture2regions(region)
 
+                    # an ROI that is combined with 'or' into pending ROIs is applied along
+                    # with them, otherwise any pending ROIs need to be applied first.  The
+                    # union of the pending ROIs is applied with the mode of the first one,
+                    # which only gives the same result as applying them one at a time if
+                    # that mode is 'new', 'replace' or 'or'.
+                    is_roi = isinstance(region, (CirclePixelRegion, CircleSkyRegion,
+                                                 EllipsePixelRegion, EllipseSkyRegion,
+                                                 RectanglePixelRegion, RectangleSkyRegion,
+                                                 CircleAnnulusPixelRegion,
+                                                 CircleAnnulusSkyRegion, CircularROI,
+                                                 CircularAnnulusROI, EllipticalROI,
+                                                 RectangularROI))
+                    if is_roi and not len(viewer.layers):
+                        bad_regions.append((region, f'No data loaded in viewer {viewer_name}'))
+                        continue
+                    grouped = (is_roi and len(pending_rois) > 0 and combo_mode == 'or'
+                               and self.combination_mode.selected in ('new', 'replace', 'or'))
+                    if not grouped:
+                        apply_pending_rois()
+                        if mode_selected:
+                            self.combination_mode.selected = mode_selected
+
                     # region: Convert to ROI.
                     # NOTE: Out-of-bounds ROI will succeed; this is native glue behavior.
                     if (isinstance(region, (CirclePixelRegion, CircleSkyRegion,
@@ -1426,21 +1464,21 @@ class SubsetTools(PluginTemplateMixin, LoadersMixin):
                         try:
                             if getattr(data.coords, 'world_n_dim', None) == 3:
                                 data_wcs = _get_celestial_wcs(data.coords)
-                                state = regions2roi(region, wcs=data_wcs)
+                                roi = regions2roi(region, wcs=data_wcs)
                             else:
-                                state = regions2roi(region, wcs=data.coords)
+                                roi = regions2roi(region, wcs=data.coords)
                         except ValueError:
                             if '_orig_spatial_wcs' not in data.meta:
                                 bad_regions.append((region,
                                                     f'Failed to load: _orig_spatial_wcs'
                                                     f' meta tag not in {data.label}'))
                                 continue
-                            state = regions2roi(region, wcs=data.meta['_orig_spatial_wcs'])
-                        viewer.apply_roi(state)
+                            roi = regions2roi(region, wcs=data.meta['_orig_spatial_wcs'])
+                        pending_rois.append(roi)
 
                     elif isinstance(region, (CircularROI, CircularAnnulusROI,
                                              EllipticalROI, RectangularROI)):
-                        viewer.apply_roi(region)
+                        pending_rois.append(region)
 
                     elif isinstance(region, SpectralRegion):
                         # Use viewer_name if provided in kwarg, otherwise use
@@ -1492,10 +1530,17 @@ class SubsetTools(PluginTemplateMixin, LoadersMixin):
                     if max_num_regions is not None and n_loaded >= max_num_regions:
                         break
 
-                    if self.combination_mode.selected in ('new', 'replace') and subset_label is not None:  # noqa
-                        self.rename_selected(subset_label[label_index])
+                    if (not grouped and subset_label is not None
+                            and self.combination_mode.selected in ('new', 'replace')):
+                        if len(pending_rois):
+                            # renamed once the pending regions are applied
+                            pending_label = subset_label[label_index]
+                        else:
+                            self.rename_selected(subset_label[label_index])
                         label_index += 1
 
+                apply_pending_rois()
+
         finally:
             self.app._importing_regions = False
 
@@ -1520,6 +1565,24 @@ class SubsetTools(PluginTemplateMixin, LoadersMixin):
         if return_bad_regions:
             return bad_regions
 
+    @staticmethod
+    def _apply_rois(viewer, rois):
+        """
+        Apply the union of ``rois`` to ``viewer`` with the current combination mode as a
+        single subset state.  The states of the individual ROIs are combined in a balanced
+        tree so that the depth of the resulting compound state only grows logarithmically
+        with the number of ROIs.  As with any ROI subset, the mask is only computed by glue
+        once it is needed.
+        """
+        if len(rois) == 1:
+            viewer.apply_roi(rois[0])
+            return
+        states = [viewer._roi_to_subset_state(roi) for roi in rois]
+        while len(states) > 1:
+            states = [OrState(*states[i:i+2]) if i + 1 < len(states) else states[i]
+                      for i in range(0, len(states), 2)]
+        viewer.apply_subset_state(states[0])
+
     @observe('combination_mode_selected')
     def _combination_mode_selected_updated(self, change):
         self._app.session.edit_subset_mode.mode = SUBSET_MODES_PRETTY[change['new']]
@@ -8,7 +8,10 @@ from astropy.coordinates import SkyCoord
 from astropy.nddata import NDData
 from astropy.tests.helper import assert_quantity_allclose
 from glue.core.edit_subset_mode import ReplaceMode, NewMode
+from glue.core.hub import HubListener
+from glue.core.message import SubsetUpdateMessage
 from glue.core.roi import EllipticalROI, CircularROI, CircularAnnulusROI, RectangularROI
+from glue.core.subset import CompositeSubsetState
 from numpy.testing import assert_allclose
 from regions import (CircleAnnulusPixelRegion, CirclePixelRegion,
                      CircleSkyRegion, CompoundPixelRegion, CompoundSkyRegion,
@@ -523,6 +526,81 @@ def test_get_composite_sky_region_remove(imviz_helper, image_2d_wcs):
         assert_quantity_allclose(actual[0].radius, expected_region.radius)
 
 
+def test_import_many_regions_as_compound_subset(imviz_helper):
+    imviz_helper.load_data(NDData(np.ones((100, 100)) * u.nJy))
+    st = imviz_helper.plugins['Subset Tools']
+
+    rng = np.random.default_rng(0)
+    n_regions = 200
+    centers = rng.uniform(0, 100, (n_regions, 2))
+    regions = [CirclePixelRegion(PixCoord(x, y), radius=2) for x, y in centers]
+    regions += [CirclePixelRegion(PixCoord(50, 50), radius=10)]
+
+    state_updates = []
+    listener = HubListener()
+    imviz_helper._app.hub.subscribe(listener, SubsetUpdateMessage,
+                                    handler=state_updates.append,
+                                    filter=lambda msg: msg.attribute == 'subset_state')
+    st.import_region(regions, combination_mode=['new'] + ['or'] * (n_regions - 1) + ['new'],
+                     subset_label=['Many', 'Single'], max_num_regions=None)
+
+    subsets = imviz_helper._app.get_subsets()
+    assert list(subsets.keys()) == ['Many', 'Single']
+    assert len(subsets['Many']) == n_regions
+    assert len(subsets['Single']) == 1
+
+    # all regions combined with 'or' are applied in one go (as a balanced tree of states),
+    # rather than updating the state of the new subset for each region
+    assert state_updates == []
+    subset_state = imviz_helper._app.data_collection.subset_groups[0].subset_state
+
+    def depth(state):
+        if isinstance(state, CompositeSubsetState):
+            return 1 + max(depth(state.state1), depth(state.state2))
+        return 0
+    assert depth(subset_state) == int(np.ceil(np.log2(n_regions)))
+
+    yy, xx = np.mgrid[:100, :100]
+    expected = np.zeros((100, 100), dtype=bool)
+    for x, y in centers:
+        expected |= (xx - x) ** 2 + (yy - y) ** 2 < 4
+    data = imviz_helper._app.data_collection[0]
+    assert_allclose(subset_state.to_mask(data), expected)
+
+
+def test_import_regions_into_empty_viewer(imviz_helper):
+    imviz_helper.load_data(NDData(np.ones((10, 10)) * u.nJy), data_label='a')
+    imviz_helper._app.remove_data_from_viewer('imviz-0', 'a[DATA]')
+    st = imviz_helper.plugins['Subset Tools']
+
+    # regions that cannot be applied to the (empty) viewer are reported rather than dropped
+    regions = [CirclePixelRegion(PixCoord(3, 3), radius=2)] * 2
+    bad_regions = st.import_region(regions, combination_mode=['new', 'or'],
+                                   refdata_label='a[DATA]', return_bad_regions=True)
+    assert [reason for _, reason in bad_regions] == ['No data loaded in viewer imviz-0'] * 2
+    assert len(imviz_helper._app.data_collection.subset_groups) == 0
+
+
+@pytest.mark.parametrize('mode', ['andnot', 'and', 'xor'])
+def test_import_regions_or_after_other_mode(imviz_helper, mode):
+    imviz_helper.load_data(NDData(np.ones((100, 100)) * u.nJy))
+    st = imviz_helper.plugins['Subset Tools']
+
+    centers = [(40, 50), (55, 50), (70, 50)]
+    regions = [CirclePixelRegion(PixCoord(x, y), radius=10) for x, y in centers]
+    st.import_region(regions, combination_mode=['new', mode, 'or'])
+
+    # the region combined with 'or' is added to the result of the previous two,
+    # just as if the regions were applied one at a time
+    yy, xx = np.mgrid[:100, :100]
+    a, b, c = [(xx - x) ** 2 + (yy - y) ** 2 < 100 for x, y in centers]
+    expected = {'andnot': a & ~b, 'and': a & b, 'xor': a ^ b}[mode] | c
+
+    subset_state = imviz_helper._app.data_collection.subset_groups[0].subset_state
+    data = imviz_helper._app.data_collection[0]
+    assert_allclose(subset_state.to_mask(data), expected)
+
+
 def test_check_valid_subset_label(imviz_helper):
 
     # imviz instance with some data
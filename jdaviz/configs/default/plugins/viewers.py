@@ -4,6 +4,7 @@ import warnings
 
 import numpy as np
 from numpy.linalg import norm
+from scipy.spatial import cKDTree
 
 from glue.config import data_translator
 from glue.core import BaseData
@@ -43,6 +44,8 @@ from jdaviz.core.astrowidgets_api import AstrowidgetsImageViewerMixin
 from jdaviz.core.custom_units_and_equivs import _eqv_sb_per_pixel_to_per_angle
 from jdaviz.core.events import (SnackbarMessage,
                                 NewViewerMessage,
+                                LinkUpdatedMessage,
+                                ChangeRefDataMessage,
                                 ViewerRemovedMessage,
                                 ViewerVisibleLayersChangedMessage,
                                 RestoreToolbarMessage,
@@ -1623,6 +1626,15 @@ class JdavizTableViewer(JdavizViewerMixin, TableViewer):
         self.hub.subscribe(self, TableSelectRowClickMessage,
                            handler=self._on_table_select_row_click)
 
+        # cache of the catalog positions projected into the reference frame of the image
+        # viewers and a KD-tree built on them for nearest-row lookup on click, only
+        # invalidated when linking or orientation changes (or the catalog itself changes)
+        self._click_index_cache = {}
+        self.hub.subscribe(self, LinkUpdatedMessage,
+                           handler=self._clear_click_index_cache)
+        self.hub.subscribe(self, ChangeRefDataMessage,
+                           handler=self._clear_click_index_cache)
+
         # Subscribe to ViewerRemovedMessage to clean up toolbar overrides
         # if this table viewer is removed while tools are active
         self.hub.subscribe(self, ViewerRemovedMessage,
@@ -1644,36 +1656,13 @@ class JdavizTableViewer(JdavizViewerMixin, TableViewer):
         click_x, click_y = msg.x, msg.y
 
         try:
-            layer = self.layers[0].layer
-
-            # Get sky coordinates for WCS-accurate comparison.
-            # Click coordinates are in the viewer's reference frame, so catalog
-            # coordinates must also be converted to that frame for proper matching.
-            xs, ys = None, None
-            skycoords = _get_skycoords_from_table(layer)
-
-            if skycoords is not None:
-                # Convert sky coordinates to pixels in the viewer's reference frame
-                for viewer in self.jdaviz_app.get_viewers_of_cls('ImvizImageView'):
-                    if viewer.state.reference_data is None:
-                        continue
-                    if viewer.state.reference_data.coords is None:
-                        continue
-                    pixel_result = viewer.state.reference_data.coords.world_to_pixel(skycoords)
-                    xs, ys = pixel_result[0], pixel_result[1]
-                    break
-            else:
-                # Fall back to pixel coordinates only if no sky coordinates available
-                pixel_coords = _get_pixel_coords_from_table(layer)
-                if pixel_coords is not None:
-                    xs, ys = pixel_coords
-
-            if xs is None or ys is None:
+            index = self._get_click_index(self.layers[0].layer)
+            if index is None:
                 return
 
             # Find nearest point and toggle its selection
-            distsq = (xs - click_x)**2 + (ys - click_y)**2
-            ind = int(np.argmin(distsq))
+            tree, rows = index
+            ind = int(rows[tree.query([click_x, click_y])[1]])
 
             current_checked = list(self.widget_table.checked)
             if ind in current_checked:
@@ -1684,6 +1673,60 @@ class JdavizTableViewer(JdavizViewerMixin, TableViewer):
         except Exception:  # nosec # pragma: no cover
             pass
 
+    def _clear_click_index_cache(self, *args):
+        self._click_index_cache.clear()
+
+    def _get_click_index(self, layer):
+        """
+        Return a KD-tree of the positions of the catalog rows in the pixel frame of the
+        reference data of the first image viewer (or in the catalog's own pixel columns
+        if it has no sky coordinates) along with the row indices of the indexed points,
+        or `None` if the positions cannot be determined.
+        """
+        ref_data = None
+        for viewer in self.jdaviz_app.get_viewers_of_cls('ImvizImageView'):
+            if viewer.state.reference_data is None:
+                continue
+            if viewer.state.reference_data.coords is None:
+                continue
+            ref_data = viewer.state.reference_data
+            break
+
+        key = (id(layer), layer.size,
+               id(ref_data), id(getattr(ref_data, 'coords', None)))
+        if key in self._click_index_cache:
+            return self._click_index_cache[key]
+
+        # Get sky coordinates for WCS-accurate comparison.
+        # Click coordinates are in the viewer's reference frame, so catalog
+        # coordinates must also be converted to that frame for proper matching.
+        xs, ys = None, None
+        skycoords = _get_skycoords_from_table(layer)
+
+        if skycoords is not None:
+            # Convert sky coordinates to pixels in the viewer's reference frame
+            if ref_data is not None:
+                pixel_result = ref_data.coords.world_to_pixel(skycoords)
+                xs, ys = pixel_result[0], pixel_result[1]
+        else:
+            # Fall back to pixel coordinates only if no sky coordinates available
+            pixel_coords = _get_pixel_coords_from_table(layer)
+            if pixel_coords is not None:
+                xs, ys = pixel_coords
+
+        index = None
+        if xs is not None and ys is not None:
+            # non-finite positions (e.g. sources off the WCS) can never be the closest,
+            # so only index the finite ones and keep track of their original rows
+            points = np.column_stack([np.ravel(xs), np.ravel(ys)]).astype(float)
+            rows = np.flatnonzero(np.all(np.isfinite(points), axis=1))
+            if len(rows):
+                index = (cKDTree(points[rows]), rows)
+
+        self._click_index_cache.clear()
+        self._click_index_cache[key] = index
+        return index
+
     def _add_or_update_column(self, column_name, data=None):
         """
         Add a new column to the table or update it if it already exists.
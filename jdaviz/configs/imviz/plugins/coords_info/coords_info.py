@@ -705,7 +705,8 @@ class CoordsInfo(TemplateMixin, DatasetSelectMixin):
             self.row1b_title = 'Value'
 
             if associated_dq_layers is not None:
-                if np.isnan(dq_value):
+                # zero is the value of un-flagged pixels in (integer) DQ arrays
+                if np.isnan(dq_value) or dq_value == 0:
                     dq_text = ''
                 else:
                     dq_text = f' (DQ: {int(dq_value):d})'
@@ -6,7 +6,7 @@ from jdaviz.core.events import ViewerAddedMessage
 from jdaviz.core.registries import tray_registry
 from jdaviz.core.template_mixin import (PluginTemplateMixin, ViewerSelectMixin, Plot,
                                         skip_if_no_updates_since_last_active)
-from jdaviz.utils import get_top_layer_index
+from jdaviz.utils import get_top_layer_index, _decimate_profile, _ImageProfileCache
 
 
 __all__ = ['LineProfileXY']
@@ -37,6 +37,8 @@ class LineProfileXY(PluginTemplateMixin, ViewerSelectMixin):
 
         self.plot_across_x = Plot(self, name='across_x')
         self.plot_across_y = Plot(self, name='across_y')
+        # contiguous copies (and row/column ranges) of the last image profiles were drawn for
+        self._profile_cache = _ImageProfileCache()
         for plot in (self.plot_across_x, self.plot_across_y):
             # override default styling
             plot.figure.fig_margin = {'top': 60, 'bottom': 60, 'left': 65, 'right': 15}
@@ -142,29 +144,37 @@ class LineProfileXY(PluginTemplateMixin, ViewerSelectMixin):
         y_min = max(int(np.nan_to_num(y_limits.min(), nan=0)), 0)
         y_max = min(int(np.nan_to_num(y_limits.max(), nan=ny)), ny)
 
+        # the full profiles are sent to the plots (so that they can be panned past the
+        # zoomed region), decimated if needed
+        values = comp.data
+
         self.plot_across_x.figure.title = f'X={x}'
-        self.plot_across_x._update_data('line', x=range(comp.data.shape[0]), y=comp.data[:, x],
-                                        reset_lims=False)
-        zoomed_data_x = comp.data[y_min:y_max, x]
-        if zoomed_data_x.size > 0:
+        column = self._profile_cache.column(values, values, x)
+        plot_x, plot_y = _decimate_profile(np.arange(ny), column)
+        self.plot_across_x._update_data('line', x=plot_x, y=plot_y, reset_lims=False)
+        if y_max > y_min:
+            range_min, range_max = self._profile_cache.column_range(values, values, x,
+                                                                    y_min, y_max)
             self.plot_across_x.set_limits(x_min=y_min,
                                           x_max=y_max,
-                                          y_min=np.nanmin(zoomed_data_x) * 0.95,
-                                          y_max=np.nanmax(zoomed_data_x) * 1.05)
+                                          y_min=range_min * 0.95,
+                                          y_max=range_max * 1.05)
         self.plot_across_x.update_style('line', line_visible=True,
                                         markers_visible=False, color='gray', size=10)
         self.plot_across_x.viewer.axis_x.label = 'Y (pix)'
         self.plot_across_x.viewer.axis_y.label = y_label
 
         self.plot_across_y.figure.title = f'Y={y}'
-        self.plot_across_y._update_data('line', x=range(comp.data.shape[1]), y=comp.data[y, :],
-                                        reset_lims=False)
-        zoomed_data_y = comp.data[y, x_min:x_max]
-        if zoomed_data_y.size > 0:
+        row = self._profile_cache.row(values, values, y)
+        plot_x, plot_y = _decimate_profile(np.arange(nx), row)
+        self.plot_across_y._update_data('line', x=plot_x, y=plot_y, reset_lims=False)
+        if x_max > x_min:
+            range_min, range_max = self._profile_cache.row_range(values, values, y,
+                                                                 x_min, x_max)
             self.plot_across_y.set_limits(x_min=x_min,
                                           x_max=x_max,
-                                          y_min=np.nanmin(zoomed_data_y) * 0.95,
-                                          y_max=np.nanmax(zoomed_data_y) * 1.05)
+                                          y_min=range_min * 0.95,
+                                          y_max=range_max * 1.05)
         self.plot_across_y.update_style('line', line_visible=True,
                                         markers_visible=False, color='gray', size=10)
         self.plot_across_y.viewer.axis_x.label = 'X (pix)'
@@ -33,19 +33,6 @@ INFO_MSG = ("The file contains more viewable extensions. Add the '[*]' suffix"
             " to the file name to load all of them.")
 
 
-def prep_data_layer_as_dq(data):
-    # nans are used to mark "good" flags in the DQ colormap, so
-    # convert DQ array to float to support nans:
-    for component_id in data.main_components:
-        if component_id.label.startswith("DQ"):
-            break
-
-    cid = data.get_component(component_id)
-    data_arr = np.float32(cid.data)
-    data_arr[data_arr == 0] = np.nan
-    data.update_components({cid: data_arr})
-
-
 @data_parser_registry("imviz-data-parser")
 def parse_data(app, file_obj, ext=None, data_label=None,
                parent=None, cache=None, local_path=None, timeout=None,
@@ -288,10 +275,6 @@ def _parse_image(app, file_obj, data_label, ext=None, parent=None, try_gwcs_to_f
         if not data.meta.get(_wcs_only_label, False):
             data_label = app.return_data_label(data_label, alt_name="image_data")
 
-        # TODO: generalize/centralize this for use in other configs too
-        if '[DQ' in data_label:
-            prep_data_layer_as_dq(data)
-
         if parent is not None:
             parent_data_label = parent
         elif '[DQ' in data_label:
@@ -476,8 +459,6 @@ def _roman_asdf_2d_to_glue_data(file_obj, data_label, ext=None, try_gwcs_to_fits
         component = Component(np.array(ext_values), units=bunit)
         data.add_component(component=component, label=comp_label)
         data.meta.update(standardize_metadata(dict(meta)))
-        if comp_label == 'DQ':
-            prep_data_layer_as_dq(data)
 
         yield data, new_data_label
 
@@ -8,6 +8,7 @@ from astropy.wcs.utils import pixel_to_pixel
 from regions import PolygonSkyRegion, PolygonPixelRegion, PixCoord
 from glue.core.link_helpers import LinkSame
 from glue_jupyter.bqplot.image import BqplotImageView
+from glue_jupyter.common.state_widgets.layer_scatter import ScatterLayerStateWidget
 
 from jdaviz.configs.imviz import wcs_utils
 from jdaviz.core.aida_api import AIDAMixin
@@ -15,6 +16,7 @@ from jdaviz.core.astrowidgets_api import AstrowidgetsImageViewerMixin
 from jdaviz.core.events import SnackbarMessage
 from jdaviz.core.marks import RegionOverlay
 from jdaviz.core.registries import viewer_registry
+from jdaviz.core.scatter_layers import LevelOfDetailScatterLayerArtist
 from jdaviz.core.freezable_state import FreezableBqplotImageViewerState
 from jdaviz.configs.default.plugins.viewers import JdavizViewerMixin
 from jdaviz.utils import (get_wcs_only_layer_labels, data_has_valid_wcs,
@@ -73,6 +75,8 @@ class ImvizImageView(JdavizViewerMixin, BqplotImageView, AstrowidgetsImageViewer
 
         self.data_menu._obj.dataset.add_filter('is_catalog_or_image_not_spectrum')
 
+        self._layer_style_widget_cls[LevelOfDetailScatterLayerArtist] = ScatterLayerStateWidget
+
         self.aid = self
 
     def on_mouse_or_key_event(self, data):
@@ -301,6 +305,19 @@ class ImvizImageView(JdavizViewerMixin, BqplotImageView, AstrowidgetsImageViewer
         # Make it so y axis label is not covering tick numbers.
         self.figure.axes[1].label_offset = "-50"
 
+    def get_data_layer_artist(self, layer=None, layer_state=None):
+        if layer.ndim == 1:
+            # catalogs and markers: only send the points in view to the frontend
+            return self.get_layer_artist(LevelOfDetailScatterLayerArtist,
+                                         layer=layer, layer_state=layer_state)
+        return super().get_data_layer_artist(layer, layer_state)
+
+    def get_subset_layer_artist(self, layer=None, layer_state=None):
+        if layer.ndim == 1:
+            return self.get_layer_artist(LevelOfDetailScatterLayerArtist,
+                                         layer=layer, layer_state=layer_state)
+        return super().get_subset_layer_artist(layer, layer_state)
+
     def data(self, cls=None):
         return [layer_state.layer  # .get_object(cls=cls or self.default_class)
                 for layer_state in self.state.layers
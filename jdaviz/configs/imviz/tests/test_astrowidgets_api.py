@@ -11,6 +11,7 @@ from astropy.visualization import AsinhStretch, LinearStretch, LogStretch, SqrtS
 from numpy.testing import assert_allclose
 
 from jdaviz.configs.imviz.tests.utils import BaseImviz_WCS_NoWCS, BaseDeconfiggedImage_WCS_WCS
+from jdaviz.core.scatter_layers import LevelOfDetailScatterLayerArtist
 
 
 # TODO: Remove skip when https://github.com/bqplot/bqplot/pull/1397/files#r726500097 is resolved.
@@ -336,6 +337,61 @@ class TestMarkers(BaseImviz_WCS_NoWCS):
             self.viewer.add_markers(tbl, use_skycoord=True, marker_name='my_sky')
 
 
+@pytest.mark.parametrize('n_markers', (10**4, 12000,
+                                       pytest.param(2 * 10**5, marks=pytest.mark.slow)))
+def test_markers_level_of_detail(imviz_helper, n_markers):
+    imviz_helper.load_data(np.zeros((1000, 1000)), data_label='image')
+    viewer = imviz_helper.default_viewer._obj.glue_viewer
+    viewer.shape = (100, 100)
+    viewer.state._set_axes_aspect_ratio(1)
+
+    rng = np.random.default_rng(42)
+    x, y = rng.uniform(0, 1000, (2, n_markers))
+    # an isolated source in an otherwise empty corner is never thinned out
+    x[0], y[0] = 1200, 1200
+
+    viewer.add_markers(Table({'x': x, 'y': y}), marker_name='many')
+
+    layer = [lyr for lyr in viewer.layers if lyr.layer.label == 'many'][0]
+    assert isinstance(layer, LevelOfDetailScatterLayerArtist)
+    assert layer.state.density_map is False
+    max_markers = layer.max_markers
+    # glue only switches layers with more than 10^5 points to a density map, which is
+    # only overridden where the number of markers shown is limited instead
+    assert layer.state.points_mode == ('markers' if n_markers > 10**5 else 'auto')
+
+    def shown():
+        return np.column_stack([layer.scatter_mark.x, layer.scatter_mark.y])
+
+    viewer.state.x_min, viewer.state.x_max = -500, 1500
+    viewer.state.y_min, viewer.state.y_max = -500, 1500
+    assert len(shown()) <= max_markers
+    assert [1200, 1200] in shown().tolist()
+    if n_markers <= max_markers:
+        assert len(shown()) == n_markers
+
+    # zooming in shows all (and only) the markers within (some padding around) the viewport
+    viewer.state.x_min, viewer.state.x_max = 100, 150
+    viewer.state.y_min, viewer.state.y_max = 100, 150
+    in_view = ((x >= 100) & (x <= 150) & (y >= 100) & (y <= 150)).sum()
+    xy = shown()
+    assert in_view <= len(xy) <= max_markers
+    if n_markers > max_markers:
+        assert np.all((xy > 50) & (xy < 200))
+
+        # panning within the padded region does not send any markers again
+        sent_x = layer.scatter_mark.x
+        viewer.state.x_min += 10
+        viewer.state.x_max += 10
+        assert layer.scatter_mark.x is sent_x
+
+        # but panning past it does
+        viewer.state.x_min += 50
+        viewer.state.x_max += 50
+        assert layer.scatter_mark.x is not sent_x
+        assert np.all(layer.scatter_mark.x > 100)
+
+
 @pytest.mark.remote_data
 @pytest.mark.filterwarnings('ignore::pytest.PytestUnraisableExceptionWarning')
 @pytest.mark.filterwarnings("ignore:The Catalogs plugin is deprecated*:astropy.utils.exceptions.AstropyDeprecationWarning")  # noqa
@@ -168,3 +168,30 @@ def test_line_profile_with_nan(deconfigged_helper):
                          lp_plot.layers['line'].state.viewer_state.y_min,
                          lp_plot.layers['line'].state.viewer_state.y_max],
                         [0, 9, 0.95, 1.05])
+
+
+def test_line_profile_zoomed(deconfigged_helper):
+    arr = np.arange(20000.).reshape(100, 200)
+    deconfigged_helper.load(arr, format='Image')
+    viewer = deconfigged_helper.viewers['Image']._obj.glue_viewer
+    viewer.state.x_min, viewer.state.x_max = 20, 60
+    viewer.state.y_min, viewer.state.y_max = 10, 30
+
+    lp_plugin = deconfigged_helper.plugins['Image Profiles (XY)']._obj
+    lp_plugin.plugin_opened = True
+    lp_plugin.selected_x = 40
+    lp_plugin.selected_y = 20
+    lp_plugin.vue_draw_plot()
+    assert lp_plugin.plot_available
+
+    # the full profiles are sent to the plots, which are zoomed to the region in the viewer
+    x_limits, y_limits = viewer._get_zoom_limits(viewer.state.reference_data).T
+    for lp_plot, limits, expected in ((lp_plugin.plot_across_x, y_limits, arr[:, 40]),
+                                      (lp_plugin.plot_across_y, x_limits, arr[20])):
+        x = lp_plot.layers['line'].layer.data['x']
+        start, stop = int(limits.min()), int(limits.max())
+        assert_array_equal(x, np.arange(len(expected)))
+        assert_array_equal(lp_plot.layers['line'].layer.data['y'], expected)
+        assert_allclose([lp_plot.layers['line'].state.viewer_state.y_min,
+                         lp_plot.layers['line'].state.viewer_state.y_max],
+                        [expected[start] * 0.95, expected[stop - 1] * 1.05])
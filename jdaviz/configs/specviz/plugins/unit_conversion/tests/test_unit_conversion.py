@@ -96,6 +96,31 @@ def test_conv_wave_flux(deconfigged_helper, spectrum1d, uncert):
     assert u.Unit(viewer.state.y_display_unit) == u.Unit(new_flux)
 
 
+def test_conv_messages_batched(cubeviz_helper, spectrum1d_cube):
+    from glue.core.hub import HubListener
+    from jdaviz.core.events import GlobalDisplayUnitChanged, ViewerVisibleLayersChangedMessage
+
+    cubeviz_helper.load(spectrum1d_cube, data_label='test')
+    app = cubeviz_helper._app
+    listener = HubListener()
+    received = []
+    for message_class in (GlobalDisplayUnitChanged, ViewerVisibleLayersChangedMessage):
+        app.hub.subscribe(listener, message_class, handler=received.append)
+
+    # changing the flux unit also changes the surface brightness unit, which are
+    # each reported once, after all the viewers are updated
+    cubeviz_helper.plugins['Unit Conversion'].flux_unit = 'MJy'
+    units = {msg.axis: msg.unit for msg in received
+             if isinstance(msg, GlobalDisplayUnitChanged)}
+    assert units['flux'] == u.MJy
+    assert units['sb'] == u.MJy / u.pix**2
+    axes = [msg.axis for msg in received if isinstance(msg, GlobalDisplayUnitChanged)]
+    assert len(axes) == len(set(axes))
+    viewers = [msg.viewer_reference for msg in received
+               if isinstance(msg, ViewerVisibleLayersChangedMessage)]
+    assert len(viewers) == len(set(viewers))
+
+
 def test_conv_no_data(specviz_helper, spectrum1d):
     """plugin unit selections won't have valid choices yet, preventing
     attempting to set display units."""
@@ -311,7 +311,21 @@ class UnitConversion(PluginTemplateMixin):
                 or (self.config in ('cubeviz', 'deconfigged')
                     and not len(self.spectral_y_type_selected))):
 
-            data_obj = self._app._jdaviz_helper.get_data(msg.data.label)
+            is_image_layer = (isinstance(viewer, BqplotImageView)
+                              and 'Trace' not in msg.data.meta)
+            if is_image_layer and 'spectral_axis_index' not in msg.data.meta:
+                # only the units of an image are needed below, so avoid translating
+                # (and so reading into memory) the entire, possibly memory-mapped, array
+                data_comp = msg.data.get_component(msg.data.main_components[0])
+                data_obj = u.Quantity(0, data_comp.units or '')
+            elif is_image_layer and msg.data.ndim == 3:
+                # only the flux and spectral axis units of a cube are needed below, so
+                # avoid also translating (and so copying) the uncertainty cube
+                data_obj = msg.data.get_object(
+                    cls=Spectrum, statistic=None, attribute=msg.data.main_components[0],
+                    spectral_axis_index=msg.data.meta['spectral_axis_index'])
+            else:
+                data_obj = self._app._jdaviz_helper.get_data(msg.data.label)
 
             # if the viewer is spectral and the data is Spectrum, get flux/sb/spectral
             # axis units from the Spectrum object
@@ -472,71 +486,74 @@ class UnitConversion(PluginTemplateMixin):
 
         axis = msg.get('name').split('_')[0]
 
-        if axis == 'spectral':
-            for sv in self.spectrum_1d_viewers:
-                if not (is_physical_spectral_unit(self.spectral_unit.selected)
-                        and is_physical_spectral_unit(sv.state.x_display_unit)):
-                    continue
-                xunit = valid_glue_display_unit(self.spectral_unit.selected, sv, 'x')
-                sv.state.x_display_unit = xunit
-                sv.set_plot_axes()
-            for s2dv in self.spectrum_2d_viewers:
-                if not hasattr(s2dv.state, 'x_display_unit'):
-                    continue
-                if not (is_physical_spectral_unit(self.spectral_unit.selected)
-                        and is_physical_spectral_unit(s2dv.state.x_display_unit)):
-                    continue
-                xunit = valid_glue_display_unit(self.spectral_unit.selected, s2dv, 'x')
-                s2dv.state.x_display_unit = xunit
-                s2dv.set_plot_axes()
-
-        elif axis == 'flux':
-            # handle spectral y-unit first since that is a more apparent change to the user
-            # and feels laggy if it is done later
-            if self.spectral_y_type_selected == 'Flux':
-                self._handle_spectral_y_unit()
-            for sv in self.spectrum_1d_viewers:
-                if not (is_physical_flux_unit(self.flux_unit.selected)
-                        and is_physical_flux_unit(sv.state.y_display_unit)):
-                    continue
-                sv.set_plot_axes()
-
-            if len(self.angle_unit_selected):
-                # NOTE: setting sb_unit_selected will call this method again with axis=='sb',
-                # which in turn will call _handle_attribute_display_unit,
-                # _handle_spectral_y_unit (if spectral_y_type_selected == 'Surface Brightness'),
-                #  and send a second GlobalDisplayUnitChanged message for sb
-                self.sb_unit_selected = flux_to_sb_unit(self.flux_unit.selected,
-                                                        self.angle_unit.selected)
-
-        elif axis == 'angle':
-            if len(self.flux_unit_selected):
-                # NOTE: setting sb_unit_selected will call this method again with axis=='sb',
-                # which in turn will call _handle_attribute_display_unit,
-                # _handle_spectral_y_unit (if spectral_y_type_selected == 'Surface Brightness'),
-                #  and send a second GlobalDisplayUnitChanged message for sb
-                self.sb_unit_selected = flux_to_sb_unit(self.flux_unit.selected,
-                                                        self.angle_unit.selected)
-
-        elif axis == 'sb':
-            # handle spectral y-unit first since that is a more apparent change to the user
-            # and feels laggy if it is done later
-            if self.spectral_y_type_selected == 'Surface Brightness':
-                self._handle_spectral_y_unit()
-
-            self._handle_attribute_display_unit(self.sb_unit_selected)
-            for sv in self.spectrum_1d_viewers:
-                if not (is_physical_flux_unit(self.sb_unit_selected)
-                        and is_physical_flux_unit(sv.state.y_display_unit)):
-                    continue
-                sv.set_plot_axes()
-
-        # custom axes downstream can override _on_unit_selected if anything needs to be
-        # processed before the GlobalDisplayUnitChanged message is broadcast
-
-        # axis (first) argument will be one of: spectral, flux, angle, sb, time
-        self.hub.broadcast(GlobalDisplayUnitChanged(axis,
-                           msg.new, sender=self))
+        # messages resulting from this selection (the visible layers of the viewers, the
+        # display units of dependent axes, ...) are delivered once all the viewers are updated
+        with self._app.batch_messages():
+            if axis == 'spectral':
+                for sv in self.spectrum_1d_viewers:
+                    if not (is_physical_spectral_unit(self.spectral_unit.selected)
+                            and is_physical_spectral_unit(sv.state.x_display_unit)):
+                        continue
+                    xunit = valid_glue_display_unit(self.spectral_unit.selected, sv, 'x')
+                    sv.state.x_display_unit = xunit
+                    sv.set_plot_axes()
+                for s2dv in self.spectrum_2d_viewers:
+                    if not hasattr(s2dv.state, 'x_display_unit'):
+                        continue
+                    if not (is_physical_spectral_unit(self.spectral_unit.selected)
+                            and is_physical_spectral_unit(s2dv.state.x_display_unit)):
+                        continue
+                    xunit = valid_glue_display_unit(self.spectral_unit.selected, s2dv, 'x')
+                    s2dv.state.x_display_unit = xunit
+                    s2dv.set_plot_axes()
+
+            elif axis == 'flux':
+                # handle spectral y-unit first since that is a more apparent change to the user
+                # and feels laggy if it is done later
+                if self.spectral_y_type_selected == 'Flux':
+                    self._handle_spectral_y_unit()
+                for sv in self.spectrum_1d_viewers:
+                    if not (is_physical_flux_unit(self.flux_unit.selected)
+                            and is_physical_flux_unit(sv.state.y_display_unit)):
+                        continue
+                    sv.set_plot_axes()
+
+                if len(self.angle_unit_selected):
+                    # NOTE: setting sb_unit_selected will call this method again with axis=='sb',
+                    # which in turn will call _handle_attribute_display_unit,
+                    # _handle_spectral_y_unit (if spectral_y_type_selected == 'Surface Brightness'),
+                    #  and send a second GlobalDisplayUnitChanged message for sb
+                    self.sb_unit_selected = flux_to_sb_unit(self.flux_unit.selected,
+                                                            self.angle_unit.selected)
+
+            elif axis == 'angle':
+                if len(self.flux_unit_selected):
+                    # NOTE: setting sb_unit_selected will call this method again with axis=='sb',
+                    # which in turn will call _handle_attribute_display_unit,
+                    # _handle_spectral_y_unit (if spectral_y_type_selected == 'Surface Brightness'),
+                    #  and send a second GlobalDisplayUnitChanged message for sb
+                    self.sb_unit_selected = flux_to_sb_unit(self.flux_unit.selected,
+                                                            self.angle_unit.selected)
+
+            elif axis == 'sb':
+                # handle spectral y-unit first since that is a more apparent change to the user
+                # and feels laggy if it is done later
+                if self.spectral_y_type_selected == 'Surface Brightness':
+                    self._handle_spectral_y_unit()
+
+                self._handle_attribute_display_unit(self.sb_unit_selected)
+                for sv in self.spectrum_1d_viewers:
+                    if not (is_physical_flux_unit(self.sb_unit_selected)
+                            and is_physical_flux_unit(sv.state.y_display_unit)):
+                        continue
+                    sv.set_plot_axes()
+
+            # custom axes downstream can override _on_unit_selected if anything needs to be
+            # processed before the GlobalDisplayUnitChanged message is broadcast
+
+            # axis (first) argument will be one of: spectral, flux, angle, sb, time
+            self.hub.broadcast(GlobalDisplayUnitChanged(axis,
+                               msg.new, sender=self))
 
     @observe('spectral_y_type_selected')
     def _handle_spectral_y_unit(self, *args):
@@ -17,7 +17,7 @@ from jdaviz.core.events import (AddDataToViewerMessage,
                                 LineIdentifyMessage)
 from jdaviz.core.freezable_state import FreezableBqplotImageViewerState
 from jdaviz.core.registries import viewer_registry
-from jdaviz.core.marks import SpectralLine
+from jdaviz.core.marks import SpectralLines
 from jdaviz.core.linelists import load_preset_linelist, get_available_linelists
 from jdaviz.core.unit_conversion_utils import (spectral_unit_conversion,
                                                flux_unit_conversion,
@@ -181,9 +181,24 @@ class Spectrum1DViewer(JdavizProfileView, WithSliceIndicator):
         if return_table:
             return line_table
 
+    def _get_spectral_lines_mark(self, create=False):
+        """
+        Return the `SpectralLines` mark drawing all plotted lines, creating it if
+        ``create`` is `True` and it does not yet exist (otherwise returning `None`).
+        """
+        for mark in self.figure.marks:
+            if isinstance(mark, SpectralLines):
+                return mark
+        if not create:
+            return None
+        mark = SpectralLines(self)
+        self.figure.marks = self.figure.marks + mark.marks
+        return mark
+
     def _broadcast_plotted_lines(self, marks=None):
         if marks is None:
-            marks = [x for x in self.figure.marks if isinstance(x, SpectralLine)]
+            lines_mark = self._get_spectral_lines_mark()
+            marks = lines_mark.lines if lines_mark is not None else []
 
         msg = SpectralMarksChangedMessage(marks, sender=self)
         self.session.hub.broadcast(msg)
@@ -197,53 +212,42 @@ class Spectrum1DViewer(JdavizProfileView, WithSliceIndicator):
         """
         Erase either all spectral lines, all spectral lines sharing the same
         name (e.g. 'He II') or a specific name-rest value combination (e.g.
-        'HE II 1640.5', stored in SpectralLine as 'table_index').
+        'HE II 1640.5', stored in SpectralLineHandle as 'table_index').
         """
-        fig = self.figure
+        lines_mark = self._get_spectral_lines_mark()
         if name is None and name_rest is None:
-            fig.marks = [x for x in fig.marks if not isinstance(x, SpectralLine)]
+            if lines_mark is not None:
+                lines_mark.remove_lines()
             if show_none:
                 self.spectral_lines["show"] = False
             self._broadcast_plotted_lines([])
         else:
-            temp_marks = []
             # Toggle "show" value in main astropy table. The astropy table
             # machinery only allows updating a single row at a time.
+            if isinstance(name_rest, str):
+                name_rest = [name_rest]
             if name_rest is not None:
-                if isinstance(name_rest, str):
-                    self.spectral_lines.loc[name_rest]["show"] = False
-                elif isinstance(name_rest, list):
-                    for nr in name_rest:
-                        self.spectral_lines.loc[nr]["show"] = False
-            # Get rid of the marks we no longer want
-            for x in fig.marks:
-                if isinstance(x, SpectralLine):
-                    if name is not None:
-                        self.spectral_lines.loc[name]["show"] = False
-                        if x.name == name:
-                            continue
-                    else:
-                        if isinstance(name_rest, str):
-                            if x.table_index == name_rest:
-                                continue
-                        elif isinstance(name_rest, list):
-                            if x.table_index in name_rest:
-                                continue
-                temp_marks.append(x)
-            fig.marks = temp_marks
+                for nr in name_rest:
+                    self.spectral_lines.loc[nr]["show"] = False
+            if lines_mark is not None:
+                if name is not None and len(lines_mark.lines):
+                    self.spectral_lines.loc[name]["show"] = False
+                # Get rid of the lines we no longer want
+                lines_mark.remove_lines(table_indices=name_rest,
+                                        names=[name] if name is not None else None)
             self._broadcast_plotted_lines()
 
-    def _create_spectral_mark(self, line, plot_units, redshift, color, **kwargs):
+    def _add_spectral_lines(self, lines, plot_units, redshift, colors, **kwargs):
         """
-        Create and return a SpectralLine mark for a table row.
-        This centralizes construction to prevent duplicating SpectralLine(...) calls.
+        Add the lines in the table ``lines`` to the `SpectralLines` mark.
+        This centralizes adding lines to prevent duplicating the conversion of the rows.
         """
-        return SpectralLine(self,
-                            line['rest'].to_value(plot_units),
-                            redshift,
-                            name=line["linename"],
-                            table_index=line["name_rest"],
-                            colors=[color], **kwargs)
+        lines_mark = self._get_spectral_lines_mark(create=True)
+        for k, v in kwargs.items():
+            setattr(lines_mark, k, v)
+        return lines_mark.add_lines(u.Quantity(lines['rest']).to_value(plot_units),
+                                    list(lines["linename"]), list(lines["name_rest"]),
+                                    colors, redshift)
 
     @deprecated(since="5.2", alternative="plot_spectral_lines")
     def plot_spectral_line(self, line, global_redshift=None, plot_units=None, **kwargs):
@@ -310,11 +314,11 @@ class Spectrum1DViewer(JdavizProfileView, WithSliceIndicator):
 
             color = colors if colors is not None else line["colors"]
 
-            mark = self._create_spectral_mark(line, plot_units, redshift, color,
-                                              **kwargs)
+            self._add_spectral_lines(line.table[[line.index]]
+                                     if isinstance(line, table.Row) else line,
+                                     plot_units, redshift, [color], **kwargs)
 
-            # Add mark and broadcast
-            self.figure.marks = self.figure.marks + [mark]
+            # Broadcast the change to the plotted lines
             self._broadcast_plotted_lines()
             return
 
@@ -337,14 +341,13 @@ class Spectrum1DViewer(JdavizProfileView, WithSliceIndicator):
         elif len(colors) != len(lines_to_plot):
             colors = colors * len(lines_to_plot)
 
-        marks = []
-        for line_row, color in zip(lines_to_plot, colors):
-            # Plot only the lines with show=True
-            if "show" in lines_to_plot.colnames and not line_row["show"]:
-                continue
-            marks.append(self._create_spectral_mark(line_row, plot_units, redshift,
-                                                    color, **kwargs))
-        self.figure.marks = self.figure.marks + marks
+        # Plot only the lines with show=True
+        if "show" in lines_to_plot.colnames:
+            show = np.asarray(lines_to_plot["show"], dtype=bool)
+        else:
+            show = np.ones(len(lines_to_plot), dtype=bool)
+        colors = [color for color, shown in zip(colors, show) if shown]
+        self._add_spectral_lines(lines_to_plot[show], plot_units, redshift, colors, **kwargs)
         self._broadcast_plotted_lines()
         return
 
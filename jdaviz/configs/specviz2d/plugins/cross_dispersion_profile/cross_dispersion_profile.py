@@ -2,6 +2,7 @@ import math
 
 import astropy.units as u
 from astropy.coordinates import SpectralCoord
+from astropy.nddata import NDData
 import numpy as np
 from bqplot import LinearScale
 from specreduce.tracing import FlatTrace
@@ -17,6 +18,7 @@ from jdaviz.core.template_mixin import (DatasetSelect, PluginTemplateMixin,
 from jdaviz.core.unit_conversion_utils import (all_flux_unit_conversion_equivs,
                                                flux_unit_conversion)
 from jdaviz.core.user_api import PluginUserApi
+from jdaviz.utils import _decimate_profile, _ImageProfileCache
 
 __all__ = ['CrossDispersionProfile']
 
@@ -109,6 +111,10 @@ class CrossDispersionProfile(PluginTemplateMixin, PlotMixin):
 
         # attribute to access computed profile, will be a quantity array
         self._profile = None
+        # column-major copies of the flux and mask of the selected dataset, so that
+        # profiles only need to touch the selected column
+        self._flux_cache = _ImageProfileCache()
+        self._mask_cache = _ImageProfileCache()
 
         # override default plot styling
         self.plot.figure.fig_margin = {'top': 60, 'bottom': 60, 'left': 65,
@@ -277,7 +283,7 @@ class CrossDispersionProfile(PluginTemplateMixin, PlotMixin):
                 ymax = self.y_pixel + int(self.width/2)
                 ymin = self.y_pixel - int(self.width/2)
 
-            self.marks['2d']['pix'].update_xy(np.full(data.shape[1], self.pixel),
+            self.marks['2d']['pix'].update_xy(np.full(ymax + 1 - ymin, self.pixel),
                                               range(ymin, ymax+1),
                                               viewers=self.marks_viewers2d)
             self.marks['2d']['pix'].visible = self.is_active
@@ -336,14 +342,27 @@ class CrossDispersionProfile(PluginTemplateMixin, PlotMixin):
         else:
             width = self.width
 
+        if not 0 <= self.pixel < data.shape[1]:
+            raise ValueError('Pixels chosen to measure cross dispersion profile are'
+                             ' out of image bounds.')
+
+        # the profile only depends on the selected column, so measure it on that column
+        # alone (taken from the cached copy of the data) rather than the full 2D spectrum
+        flux = self._flux_cache.column(data, data.flux.value, self.pixel)
+        if data.mask is not None:
+            mask = self._mask_cache.column(data, data.mask, self.pixel)[:, np.newaxis]
+        else:
+            mask = None
+        column = NDData(flux[:, np.newaxis], unit=data.flux.unit, mask=mask)
+
         # create a FlatTrace at y_pixel
-        trace = FlatTrace(data, self.y_pixel)
+        trace = FlatTrace(column, self.y_pixel)
 
-        profile = measure_cross_dispersion_profile(data,
+        profile = measure_cross_dispersion_profile(column,
                                                    trace=trace,
                                                    crossdisp_axis=0,
                                                    width=width,
-                                                   pixel=self.pixel,
+                                                   pixel=0,
                                                    pixel_range=None,
                                                    align_along_trace=False)
 
@@ -377,7 +396,8 @@ class CrossDispersionProfile(PluginTemplateMixin, PlotMixin):
             # is centered on y_pixel
             x += int(self.y_pixel - (self.width / 2))
 
-        self.plot._update_data('profile', x=x, y=self.profile, reset_lims=True)
+        x, y = _decimate_profile(x, self.profile)
+        self.plot._update_data('profile', x=x, y=y, reset_lims=True)
         self.plot.update_style('profile', line_visible=True, color='gray',
                                size=32)
 
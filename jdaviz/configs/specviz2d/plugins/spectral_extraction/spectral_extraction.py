@@ -1,6 +1,8 @@
+import copy
 import numpy as np
 from functools import cached_property
 
+from glue_jupyter.utils import debounced
 from traitlets import Bool, List, Unicode, observe
 
 from jdaviz.configs.mosviz.plugins.viewers import Spectrum1DViewer
@@ -35,6 +37,16 @@ _model_cls = {'Spline': models.Spline1D,
               'Chebyshev': models.Chebyshev1D}
 
 
+def _inputs_match(inputs, other):
+    # parameters are compared by value, data and intermediate products (which are only
+    # replaced, never modified, when their own inputs change) by identity
+    if len(inputs) != len(other):
+        return False
+    return all(a is b or (isinstance(a, (str, int, float, tuple)) and type(a) is type(b)
+                          and a == b)
+               for a, b in zip(inputs, other))
+
+
 @tray_registry('spectral-extraction-2d', label="2D Spectral Extraction",
                category="data:reduction")
 class SpectralExtraction2D(PluginTemplateMixin):
@@ -272,6 +284,10 @@ class SpectralExtraction2D(PluginTemplateMixin):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        # intermediate products of the trace -> background -> extraction pipeline, each
+        # stored alongside the inputs used to compute it (see _get_cached_product)
+        self._pipeline_cache = {}
+
         # description displayed under plugin title in tray
         self._plugin_description = 'Extract 1D spectrum from 2D image.'
         if self.config == 'deconfigged':
@@ -704,7 +720,7 @@ class SpectralExtraction2D(PluginTemplateMixin):
         # also called by any of the _interaction_in_*_step
         if self.interactive_extract:
             try:
-                sp1d = self.export_extract_spectrum(add_data=False)
+                sp1d = self._get_ext_spectrum()
             except Exception as e:
                 # NOTE: ignore error, but will be raised when clicking ANY of the export buttons
                 # NOTE: FitTrace or manual background are often giving a
@@ -721,7 +737,8 @@ class SpectralExtraction2D(PluginTemplateMixin):
 
         if self.interactive_extract and self.active_step == 'bg':
             try:
-                spec = self.export_bg_spectrum()
+                spec = self._get_cached_product('bg_spec', (self._get_bg(),),
+                                                lambda: self._get_bg().bkg_spectrum())
             except Exception:
                 self.marks['bg_spec'].clear()
             else:
@@ -731,6 +748,12 @@ class SpectralExtraction2D(PluginTemplateMixin):
         else:
             self.marks['bg_spec'].clear()
 
+    @debounced(delay_seconds=0.1, method=True)
+    def _debounced_update_interactive_extract(self, event={}):
+        # the 1D previews are the most expensive part of an interaction, so only update them
+        # once a burst of changes (i.e. dragging through values of an input) has settled
+        self._update_interactive_extract(event)
+
     @observe('is_active', 'trace_dataset_selected', 'trace_type_selected',
              'trace_trace_selected', 'trace_offset', 'trace_order',
              'trace_pixel', 'trace_peak_method_selected',
@@ -744,7 +767,7 @@ class SpectralExtraction2D(PluginTemplateMixin):
             return
 
         try:
-            trace = self.export_trace(add_data=False)
+            trace = self._get_trace()
         except Exception:
             # NOTE: ignore error, but will be raised when clicking ANY of the export buttons
             self.marks['trace'].clear()
@@ -754,7 +777,7 @@ class SpectralExtraction2D(PluginTemplateMixin):
                                           viewers=self.marks_viewers2d)
             self.marks['trace'].line_style = 'solid'
 
-        self._update_interactive_extract(event)
+        self._debounced_update_interactive_extract(event)
 
         self.active_step = 'trace'
 
@@ -816,7 +839,7 @@ class SpectralExtraction2D(PluginTemplateMixin):
                 for mark in ['bg2_center', 'bg2_lower', 'bg2_upper']:
                     self.marks[mark].clear()
 
-        self._update_interactive_extract(event)
+        self._debounced_update_interactive_extract(event)
 
         self.active_step = 'bg'
 
@@ -855,7 +878,7 @@ class SpectralExtraction2D(PluginTemplateMixin):
                 for mark in ['ext_lower', 'ext_upper']:
                     self.marks[mark].clear()
 
-        self._update_interactive_extract(event)
+        self._debounced_update_interactive_extract(event)
 
         self.active_step = 'ext'
 
@@ -867,6 +890,18 @@ class SpectralExtraction2D(PluginTemplateMixin):
         else:
             self.ext_uncert_warn = False
 
+    def _get_cached_product(self, stage, inputs, compute):
+        """
+        Return the product of a stage of the extraction pipeline, only calling ``compute``
+        if any of ``inputs`` changed since the product was last computed.
+        """
+        cached = self._pipeline_cache.get(stage)
+        if cached is not None and _inputs_match(cached[0], inputs):
+            return cached[1]
+        product = compute()
+        self._pipeline_cache[stage] = (inputs, product)
+        return product
+
     def _set_create_kwargs(self, **kwargs):
         invalid_kwargs = [k for k in kwargs.keys() if not hasattr(self, k)]
         if len(invalid_kwargs):
@@ -919,6 +954,30 @@ class SpectralExtraction2D(PluginTemplateMixin):
         if len(kwargs) and self.active_step != 'trace':
             self.update_marks(step='trace')
 
+        # copy so that modifying the returned trace does not modify the cached trace
+        trace = copy.copy(self._get_trace())
+
+        if add_data:
+            self.trace_add_results.add_results_from_plugin(trace,
+                                                           format='Trace',
+                                                           replace=False)
+
+        return trace
+
+    def _get_trace(self):
+        if self.trace_trace_selected != 'New Trace':
+            inputs = (self.trace_trace.selected_obj, self.trace_dataset.selected_obj,
+                      self.trace_offset)
+        elif self.trace_type_selected == 'Flat':
+            inputs = (self.trace_dataset.selected_obj, self.trace_type_selected, self.trace_pixel)
+        else:
+            inputs = (self.trace_dataset.selected_obj, self.trace_type_selected,
+                      self.trace_pixel, self.trace_order, self.trace_do_binning,
+                      self.trace_bins if self.trace_do_binning else None,
+                      self.trace_window, self.trace_peak_method_selected)
+        return self._get_cached_product('trace', inputs, self._compute_trace)
+
+    def _compute_trace(self):
         if self.trace_trace_selected != 'New Trace':
             # then we're offsetting an existing trace
             # for FlatTrace, we can keep and expose a new FlatTrace (which has the advantage of
@@ -947,11 +1006,6 @@ class SpectralExtraction2D(PluginTemplateMixin):
         else:
             raise NotImplementedError(f"trace_type={self.trace_type_selected} not implemented")
 
-        if add_data:
-            self.trace_add_results.add_results_from_plugin(trace,
-                                                           format='Trace',
-                                                           replace=False)
-
         return trace
 
     def vue_create_trace(self, *args):
@@ -959,13 +1013,16 @@ class SpectralExtraction2D(PluginTemplateMixin):
 
     def _get_bg_trace(self):
         if self.bg_type_selected == 'Manual':
-            trace = tracing.FlatTrace(self.trace_dataset.get_selected_spectrum(
-                                      use_display_units=True),
-                                      self.bg_trace_pixel)
+            spectrum = self.trace_dataset.selected_spectrum
+            trace = self._get_cached_product('bg_trace', (spectrum, self.bg_trace_pixel),
+                                             lambda: tracing.FlatTrace(spectrum,
+                                                                       self.bg_trace_pixel))
         elif self.bg_trace_selected == 'From Plugin':
-            trace = self.export_trace(add_data=False)
+            trace = self._get_trace()
         else:
-            trace = self.bg_trace.get_selected_spectrum(use_display_units=True)
+            trace = self._get_cached_product('bg_trace', (self.bg_trace.selected_dc_item,),
+                                             lambda: self.bg_trace.get_selected_spectrum(
+                                                 use_display_units=True))
 
         return trace
 
@@ -1014,23 +1071,31 @@ class SpectralExtraction2D(PluginTemplateMixin):
         if len(kwargs) and self.active_step != 'bg':
             self.update_marks(step='bg')
 
+        # copy so that modifying the returned background does not modify the cached background
+        return copy.copy(self._get_bg())
+
+    def _get_bg(self):
+        inputs = (self.bg_dataset.selected_spectrum, self._get_bg_trace(),
+                  self.bg_type_selected, self.bg_width, self.bg_statistic_selected)
+        if self.bg_type_selected != 'Manual':
+            inputs += (self.bg_separation,)
+        return self._get_cached_product('bg', inputs, self._compute_bg)
+
+    def _compute_bg(self):
         trace = self._get_bg_trace()
 
         if self.bg_type_selected == 'Manual':
-            bg = background.Background(self.bg_dataset.get_selected_spectrum(
-                                       use_display_units=True),
+            bg = background.Background(self.bg_dataset.selected_spectrum,
                                        [trace], width=self.bg_width,
                                        statistic=self.bg_statistic.selected.lower())
         elif self.bg_type_selected == 'OneSided':
-            bg = background.Background.one_sided(self.bg_dataset.get_selected_spectrum(
-                                                 use_display_units=True),
+            bg = background.Background.one_sided(self.bg_dataset.selected_spectrum,
                                                  trace,
                                                  self.bg_separation,
                                                  width=self.bg_width,
                                                  statistic=self.bg_statistic.selected.lower())
         elif self.bg_type_selected == 'TwoSided':
-            bg = background.Background.two_sided(self.bg_dataset.get_selected_spectrum(
-                                                 use_display_units=True),
+            bg = background.Background.two_sided(self.bg_dataset.selected_spectrum,
                                                  trace,
                                                  self.bg_separation,
                                                  width=self.bg_width,
@@ -1051,7 +1116,11 @@ class SpectralExtraction2D(PluginTemplateMixin):
             Whether to add the resulting image to the application, according to the options
             defined in the plugin.
         """
-        bg_spec = self.export_bg(**kwargs).bkg_image()
+        self._set_create_kwargs(**kwargs)
+        if len(kwargs) and self.active_step != 'bg':
+            self.update_marks(step='bg')
+
+        bg_spec = copy.copy(self._get_bg_img())
 
         if add_data:
             self.bg_add_results.add_results_from_plugin(bg_spec,
@@ -1060,6 +1129,10 @@ class SpectralExtraction2D(PluginTemplateMixin):
 
         return bg_spec
 
+    def _get_bg_img(self):
+        return self._get_cached_product('bg_img', (self._get_bg(),),
+                                        lambda: self._get_bg().bkg_image())
+
     def vue_create_bg_img(self, *args):
         try:
             self.export_bg_img(add_data=True)
@@ -1103,7 +1176,11 @@ class SpectralExtraction2D(PluginTemplateMixin):
             Whether to add the resulting image to the application, according to the options
             defined in the plugin.
         """
-        bg_sub_spec = self.export_bg(**kwargs).sub_image()
+        self._set_create_kwargs(**kwargs)
+        if len(kwargs) and self.active_step != 'bg':
+            self.update_marks(step='bg')
+
+        bg_sub_spec = copy.copy(self._get_bg_sub())
 
         if add_data:
             self.bg_sub_add_results.add_results_from_plugin(bg_sub_spec,
@@ -1112,20 +1189,26 @@ class SpectralExtraction2D(PluginTemplateMixin):
 
         return bg_sub_spec
 
+    def _get_bg_sub(self):
+        return self._get_cached_product('bg_sub', (self._get_bg(),),
+                                        lambda: self._get_bg().sub_image())
+
     def vue_create_bg_sub(self, *args):
         self.export_bg_sub(add_data=True)
 
     def _get_ext_trace(self):
         if self.ext_trace_selected == 'From Plugin':
-            return self.export_trace(add_data=False)
+            return self._get_trace()
         else:
-            return self.ext_trace.get_selected_spectrum(use_display_units=True)
+            return self._get_cached_product('ext_trace', (self.ext_trace.selected_dc_item,),
+                                            lambda: self.ext_trace.get_selected_spectrum(
+                                                use_display_units=True))
 
     def _get_ext_input_spectrum(self):
         if self.ext_dataset_selected == 'From Plugin':
-            return self.export_bg_sub(add_data=False)
+            return self._get_bg_sub()
         else:
-            return self.ext_dataset.get_selected_spectrum(use_display_units=True)
+            return self.ext_dataset.selected_spectrum
 
     def import_extract(self, ext):
         """
@@ -1159,6 +1242,11 @@ class SpectralExtraction2D(PluginTemplateMixin):
             ext = extract.BoxcarExtract(inp_sp2d, trace, width=self.ext_width)
         elif self.ext_type_selected == 'Horne':
             spatial_profile = None
+            if (inp_sp2d.uncertainty is None
+                    or not hasattr(inp_sp2d.uncertainty, 'uncertainty_type')):
+                # copy to avoid modifying the (cached) input spectrum
+                inp_sp2d = copy.copy(inp_sp2d)
+
             if inp_sp2d.uncertainty is None:
                 inp_sp2d.uncertainty = VarianceUncertainty(np.ones_like(inp_sp2d.data))
 
@@ -1227,5 +1315,16 @@ class SpectralExtraction2D(PluginTemplateMixin):
 
         return spectrum
 
+    def _get_ext_spectrum(self):
+        # extracted spectrum for the live preview
+        inputs = (self._get_ext_input_spectrum(), self._get_ext_trace(), self.ext_type_selected)
+        if self.ext_type_selected == 'Boxcar':
+            inputs += (self.ext_width,)
+        elif self.ext_type_selected == 'Horne':
+            inputs += (self.horne_ext_profile_selected, self.self_prof_n_bins,
+                       self.self_prof_interp_degree_x, self.self_prof_interp_degree_y)
+        return self._get_cached_product('ext_spectrum', inputs,
+                                        lambda: self.export_extract().spectrum)
+
     def vue_extract_spectrum(self, *args):
         self.export_extract_spectrum(add_data=True)
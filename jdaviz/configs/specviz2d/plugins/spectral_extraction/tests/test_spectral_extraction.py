@@ -791,3 +791,59 @@ class TestTwo2dSpectra:
         # Check that the 1D viewer updated its x-axis limits to match the 2D viewer
         expected = (x_min_1d + dx, x_max_1d + dx, y_min_1d, y_max_1d)
         assert_allclose(viewer_1d.get_limits(), expected)
+
+
+@pytest.mark.filterwarnings('ignore')
+def test_pipeline_cache(deconfigged_helper, spectrum2d, monkeypatch):
+    deconfigged_helper.load(spectrum2d, format='2D Spectrum')
+    pext = deconfigged_helper.plugins['2D Spectral Extraction']._obj
+
+    n_computed = {'trace': 0, 'bg': 0}
+    compute_trace, compute_bg = pext._compute_trace, pext._compute_bg
+
+    def count_trace():
+        n_computed['trace'] += 1
+        return compute_trace()
+
+    def count_bg():
+        n_computed['bg'] += 1
+        return compute_bg()
+
+    monkeypatch.setattr(pext, '_compute_trace', count_trace)
+    monkeypatch.setattr(pext, '_compute_bg', count_bg)
+
+    pext.trace_type_selected = 'Flat'
+    pext.bg_type_selected = 'TwoSided'
+    pext.bg_separation = 3
+    pext.bg_width = 1
+
+    with pext.as_active():
+        pext.active_step = 'ext'
+        assert len(pext.marks['extract'].marks_list[0].y) == len(spectrum2d.spectral_axis)
+        n_trace, n_bg = n_computed['trace'], n_computed['bg']
+        bg_sub = pext._get_bg_sub()
+
+        # simulate dragging the extraction width: only the extraction itself is recomputed
+        for width in np.linspace(1, 3, 10):
+            pext.ext_width = width
+        assert n_computed == {'trace': n_trace, 'bg': n_bg}
+        assert pext._get_bg_sub() is bg_sub
+        assert_allclose(pext.marks['extract'].marks_list[0].y,
+                        pext.export_extract_spectrum().flux.value)
+
+        # changing the background only recomputes the background (and downstream)
+        pext.bg_width = 2
+        assert n_computed == {'trace': n_trace, 'bg': n_bg + 1}
+        assert pext._get_bg_sub() is not bg_sub
+
+        # changing the trace invalidates everything downstream
+        pext.trace_pixel = 2
+        assert n_computed == {'trace': n_trace + 1, 'bg': n_bg + 2}
+
+    # modifying exported objects does not affect the cached intermediate products
+    trace = pext.export_trace()
+    trace.trace_pos = 0
+    assert pext._get_trace().trace_pos == 2
+    bg = pext.export_bg()
+    bg.width = 10
+    assert pext._get_bg().width == 2
@@ -1,2 +1,8 @@
 # Import glue translators because this registers them - not used directly here
 import glue_astronomy.translators as _glue_astronomy_translators  # noqa
+
+# Importing the configurations registers all built-in viewers, plugins, tools, and
+# parsers.  This is deferred until jdaviz.core (or any configuration) is first imported
+# rather than done on ``import jdaviz`` and must happen before any other jdaviz.core
+# module is imported to avoid circular imports between the core and the configurations.
+import jdaviz.configs as _jdaviz_configs  # noqa
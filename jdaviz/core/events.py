@@ -1,7 +1,7 @@
 import traceback as tb
 
 import astropy.units as u
-from glue.core.message import Message
+from glue.core.message import Message, SubsetUpdateMessage
 
 __all__ = ['NewViewerMessage', 'ViewerAddedMessage', 'ViewerRemovedMessage', 'LoadDataMessage',
            'AddDataMessage', 'DataRenamedMessage', 'SnackbarMessage', 'RemoveDataMessage',
@@ -17,7 +17,7 @@ __all__ = ['NewViewerMessage', 'ViewerAddedMessage', 'ViewerRemovedMessage', 'Lo
            'PluginTableAddedMessage', 'PluginTableModifiedMessage',
            'PluginPlotAddedMessage', 'PluginPlotModifiedMessage',
            'IconsUpdatedMessage', 'RestoreToolbarMessage',
-           'TableSelectRowClickMessage']
+           'TableSelectRowClickMessage', 'COALESCIBLE_MESSAGES']
 
 
 class NewViewerMessage(Message):
@@ -627,3 +627,20 @@ class RestoreToolbarMessage(Message):
     '''Message generated to restore all toolbar instances to their original configuration'''
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+
+
+# Messages which are coalesced within Application.batch_messages: for each message type, a
+# function returning the key of a message, with only the last message broadcast for each key
+# being delivered (once the block exits).  These all describe the current state of something
+# (rather than a change that subscribers need to see every step of), and types are matched
+# exactly (not including subclasses).
+COALESCIBLE_MESSAGES = {
+    GlobalDisplayUnitChanged: lambda msg: msg.axis,
+    ViewerVisibleLayersChangedMessage: lambda msg: msg.viewer_reference,
+    LinkUpdatedMessage: lambda msg: None,
+    MarkersPluginUpdate: lambda msg: None,
+    FootprintMarkVisibilityChangedMessage: lambda msg: msg.viewer_id,
+    PluginTableModifiedMessage: lambda msg: id(msg.sender),
+    PluginPlotModifiedMessage: lambda msg: id(msg.sender),
+    SubsetUpdateMessage: lambda msg: (msg.subset, msg.attribute),
+}
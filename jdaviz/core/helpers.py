@@ -24,7 +24,6 @@ from astropy.utils.decorators import deprecated
 from regions.core.core import Region
 from specutils import Spectrum, SpectralRegion
 
-from jdaviz.app import PrivateApplication
 from jdaviz.configs.default.plugins.viewers import JdavizViewerWindow
 from jdaviz.core.events import SnackbarMessage, ExitBatchLoadMessage, SliceSelectSliceMessage
 from jdaviz.core.loaders.resolvers import find_matching_resolver
@@ -64,6 +63,9 @@ class ConfigHelper(HubListener):
 
     def __init__(self, app=None, verbosity=None, history_verbosity=None):
         if app is None:
+            # jdaviz.app imports jdaviz.core (and therefore the configurations, which
+            # subclass this helper), so is only imported once needed
+            from jdaviz.app import PrivateApplication
             self._app = PrivateApplication(configuration=self._default_configuration)
         else:
             self._app = app
@@ -111,24 +113,28 @@ class ConfigHelper(HubListener):
         # context managers.  Once they're all exited, then the linking/showing will
         # take place.
         self._in_batch_load += 1
-        with self._app.data_collection.delay_link_manager_update():
-            # user entrypoint (anything within the with-statement will get called here)
-            yield
-
-        self._in_batch_load -= 1
-        if not self._in_batch_load:
-            self._app.hub.broadcast(ExitBatchLoadMessage(sender=self._app))
-
-            # Process any deferred set_data_visibility calls
-            for call_kwargs in self.pending_set_data_visibility:
-                self._app.set_data_visibility(**call_kwargs)
-            self.pending_set_data_visibility = []
-
-            # add any data to viewers that were requested but deferred
-            for data_label, viewer_ref in self._delayed_show_in_viewer_labels.items():
-                self._app.set_data_visibility(viewer_ref, data_label,
-                                              visible=True, replace=False)
-            self._delayed_show_in_viewer_labels = {}
+        # messages describing the state of the app (visible layers, icons, ...) are only
+        # delivered, and the layer lists of the data menus only rebuilt, once all the data
+        # are added to the viewers
+        with self._app.batch_messages():
+            with self._app.data_collection.delay_link_manager_update():
+                # user entrypoint (anything within the with-statement will get called here)
+                yield
+
+            self._in_batch_load -= 1
+            if not self._in_batch_load:
+                self._app.hub.broadcast(ExitBatchLoadMessage(sender=self._app))
+
+                # Process any deferred set_data_visibility calls
+                for call_kwargs in self.pending_set_data_visibility:
+                    self._app.set_data_visibility(**call_kwargs)
+                self.pending_set_data_visibility = []
+
+                # add any data to viewers that were requested but deferred
+                for data_label, viewer_ref in self._delayed_show_in_viewer_labels.items():
+                    self._app.set_data_visibility(viewer_ref, data_label,
+                                                  visible=True, replace=False)
+                self._delayed_show_in_viewer_labels = {}
 
     def load_data(self, data, data_label=None, parser_reference=None, **kwargs):
         if data_label:
@@ -395,6 +401,21 @@ class ConfigHelper(HubListener):
     def plugin_plots(self):
         return self._app._plugin_plots
 
+    @property
+    def timing(self):
+        """
+        Access the (opt-in) timing of loading data, plugin computations and hub messages.
+
+        Use ``timing.enable()`` (or the Logger plugin) to start recording, then
+        ``timing.summary()`` or ``timing.to_chrome_trace(filename)`` to inspect the
+        recorded spans.
+
+        Returns
+        -------
+        timing : `~jdaviz.core.timing.TimingRecorder`
+        """
+        return self._app._timing
+
     @property
     def viewers(self):
         """
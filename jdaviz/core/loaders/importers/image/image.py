@@ -397,15 +397,9 @@ class ImageImporter(BaseImporterToDataCollection):
         for d, ext_name in zip(data, ext_names):
             if d is None:
                 continue
+            # DQ components are kept in their native (integer) dtype, the zeros
+            # (un-flagged pixels) are made transparent by the DQ lookup stretch
             d.meta['_extname'] = ext_name
-            for component_id in d.main_components:
-                if component_id.label.lower().startswith("dq"):
-                    # for DQ components, map zeros to nans
-                    # so that they are not displayed in the DQ colormap
-                    cid = d.get_component(component_id)
-                    data_arr = np.float32(cid.data)
-                    data_arr[data_arr == 0] = np.nan
-                    d.update_components({cid: data_arr})
 
         return data
 
@@ -501,7 +495,8 @@ class ImageImporter(BaseImporterToDataCollection):
         # Map data hash -> label for data already in the data collection so that
         # 'Auto' can associate new children with a previously loaded parent.
         dc_hash_to_label = {data.meta.get('_data_hash'): data.label
-                            for data in self._app.data_collection}
+                            for data in self._app.data_collection
+                            if data.meta.get('_data_hash') is not None}
 
         parent_labels = []
         for ext_item in ext_items:
@@ -1,3 +1,5 @@
+import tracemalloc
+
 import pytest
 import numpy as np
 import astropy.units as u
@@ -67,3 +69,25 @@ def test_roman_level_3(deconfigged_helper, roman_level_3_mosaic):
     # check that the importer works on Roman L3s
     importer = _create_importer(input_data=roman_level_3_mosaic)
     assert importer._check_is_valid() == ''
+
+
+def test_image_fits_memmap_peak_memory(deconfigged_helper, tmp_path):
+    # loading an image from a file should keep it memory-mapped rather than reading
+    # (or copying) the full array into memory
+    arr = np.random.default_rng(0).random((2048, 2048)).astype('>f4')
+    filename = str(tmp_path / 'large_image.fits')
+    fits.HDUList([fits.PrimaryHDU(),
+                  fits.ImageHDU(arr, header=fits.Header({'BUNIT': 'Jy'}), name='SCI')]
+                 ).writeto(filename)
+
+    tracemalloc.start()
+    try:
+        deconfigged_helper.load(filename, format='Image', data_label='large_image')
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < arr.nbytes / 4
+    data = deconfigged_helper._app.data_collection[0]
+    np.testing.assert_array_equal(data.get_component(data.main_components[0]).data[:5, :5],
+                                  arr[:5, :5])
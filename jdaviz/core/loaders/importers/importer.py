@@ -134,7 +134,8 @@ class BaseImporter(PluginTemplateMixin, ValidatorMixin):
                                 data.label,
                                 self.hash_map_to_label[data.meta.get('_data_hash')])
                                for data in self._app.data_collection
-                               if data.meta.get('_data_hash') in self.data_hashes]
+                               if data.meta.get('_data_hash') is not None
+                               and data.meta.get('_data_hash') in self.data_hashes]
 
         if len(existing_data_in_dc) > 0:
             existing_data_in_dc, dc_labels, loader_labels = zip(*existing_data_in_dc)
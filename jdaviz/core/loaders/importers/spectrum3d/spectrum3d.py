@@ -1,8 +1,10 @@
+from functools import cached_property
 import numpy as np
 from traitlets import Any, Bool, List, Unicode, observe
 from astropy import units as u
 from astropy.nddata import StdDevUncertainty
 from specutils import Spectrum
+from glue.core import Data
 from glue.core.message import DataCollectionAddMessage, DataCollectionDeleteMessage
 
 from jdaviz.core.custom_units_and_equivs import PIX2
@@ -16,8 +18,10 @@ from jdaviz.core.template_mixin import (AutoTextField,
                                         SelectPluginComponent,
                                         ViewerSelectCreateNew)
 from jdaviz.core.unit_conversion_utils import (is_unit_per_solid_angle,
-                                               _eqv_flux_to_sb_pixel)
+                                               _eqv_flux_to_sb_pixel,
+                                               _spectrum_with_flux_unit)
 from jdaviz.core.user_api import ImporterUserApi
+from jdaviz.utils import create_data_hash
 
 
 __all__ = ['Spectrum3DImporter']
@@ -92,6 +96,9 @@ class Spectrum3DImporter(BaseImporterToDataCollection, SpectrumInputExtensionsMi
 
     # Extraction Options
     auto_extract = Bool(True).tag(sync=True)
+    # whether the automatic extraction is computed in the background (and added once ready)
+    # rather than before returning.  Imports from the UI always extract in the background.
+    auto_extract_in_background = Bool(False).tag(sync=True)
     function_items = List().tag(sync=True)
     function_selected = Unicode('Sum').tag(sync=True)
     # Don't load uncertainty and mask as separate cubes, e.g. for plugin results
@@ -407,7 +414,8 @@ class Spectrum3DImporter(BaseImporterToDataCollection, SpectrumInputExtensionsMi
     @property
     def user_api(self):
         # TODO: remove flux_only and just have plugins set the extensions for mask/unc/dq
-        expose = ['auto_extract', 'ext_data_label', 'ext_viewer', 'flux_only']
+        expose = ['auto_extract', 'auto_extract_in_background', 'ext_data_label', 'ext_viewer',
+                  'flux_only']
         if self.has_unc:
             expose += ['unc_data_label', 'unc_viewer']
         if self.has_mask:
@@ -448,9 +456,20 @@ class Spectrum3DImporter(BaseImporterToDataCollection, SpectrumInputExtensionsMi
     def default_spectral_axis_index(self):
         return 0
 
-    @property
+    @cached_property
     def output(self):
-        sp = self.spectrum
+        # the output is accessed many times while importing, so is computed once for
+        # each (cached) input spectrum
+        return self._spectrum_to_per_pix2(self.spectrum)
+
+    def _clear_cache(self, *attrs):
+        # output is derived from the cached spectra, so is cleared along with them
+        if 'spectra' in attrs:
+            attrs += ('output',)
+        super()._clear_cache(*attrs)
+
+    @staticmethod
+    def _spectrum_to_per_pix2(sp):
 
         # convert flux and uncertainty to per-pix2 if input is not a surface brightness
         if not is_unit_per_solid_angle(sp.flux.unit):
@@ -475,7 +494,20 @@ class Spectrum3DImporter(BaseImporterToDataCollection, SpectrumInputExtensionsMi
         if '_orig_spatial_wcs' not in sp.meta:
             sp.meta['_orig_spatial_wcs'] = sp.wcs
 
-        return sp.with_flux_unit(target_flux_unit, equivalencies=_eqv_flux_to_sb_pixel())
+        # when the flux is not a surface brightness this only relabels the unit, in which
+        # case the arrays are shared with the input rather than copied
+        return _spectrum_with_flux_unit(sp, target_flux_unit,
+                                        equivalencies=_eqv_flux_to_sb_pixel())
+
+    def vue_import_clicked(self, *args, **kwargs):
+        # show the cube as soon as possible when importing from the UI, rather than
+        # waiting for the extraction of the entire cube
+        orig_in_background = self.auto_extract_in_background
+        self.auto_extract_in_background = True
+        try:
+            super().vue_import_clicked(*args, **kwargs)
+        finally:
+            self.auto_extract_in_background = orig_in_background
 
     def __call__(self):
         # get a copy of all requested data-labels before additional data entries changes defaults
@@ -492,8 +524,11 @@ class Spectrum3DImporter(BaseImporterToDataCollection, SpectrumInputExtensionsMi
 
         if self.has_unc and not self.flux_only and self.output.uncertainty is not None:
             # TODO: detect if uncertainty exists and hide section from UI
+            unc = self.output.uncertainty
+            if not isinstance(unc, StdDevUncertainty):
+                unc = unc.represent_as(StdDevUncertainty)
             uncert = Spectrum(spectral_axis=self.output.spectral_axis,
-                              flux=self.output.uncertainty.represent_as(StdDevUncertainty).quantity,
+                              flux=u.Quantity(unc.array, unc.unit, copy=False),
                               wcs=self.output.wcs,
                               meta=self.output.meta,
                               spectral_axis_index=self.output.spectral_axis_index)
@@ -518,22 +553,49 @@ class Spectrum3DImporter(BaseImporterToDataCollection, SpectrumInputExtensionsMi
         if not self.auto_extract:
             return
 
+        if self.auto_extract_in_background:
+            # the cube is viewable immediately, with the extracted spectrum added once
+            # it is ready (unless the cube is removed in the meantime)
+            self._add_dq_cube(data_label, dq_data_label)
+            try:
+                spext = self._app.get_tray_item_from_name('spectral-extraction-3d')
+                thread = spext._extract_in_background(
+                    data_label,
+                    lambda ext, exception: self._add_auto_extraction(spext, ext, exception,
+                                                                     ext_data_label),
+                    function=self.function.selected)
+            except Exception as e:
+                self._add_auto_extraction(None, None, e, ext_data_label)
+            else:
+                # the extraction already ran synchronously if there is no running event loop
+                if thread is not None:
+                    self._app.hub.broadcast(SnackbarMessage(
+                        f"Extracting a 1D spectrum from {data_label} in the background.",
+                        color='info', sender=self))
+            return
+
         try:
             spext = self._app.get_tray_item_from_name('spectral-extraction-3d')
             ext = spext._extract_in_new_instance(dataset=data_label,
                                                  function=self.function.selected,
                                                  auto_update=False,
                                                  add_data=False)
-            # we'll add the data manually instead of through add_results_from_plugin
-            # but still want to preserve the plugin metadata
-            ext.meta['plugin'] = spext._plugin_name
         except Exception as e:
-            ext = None
+            self._add_auto_extraction(None, None, e, ext_data_label)
+        else:
+            self._add_auto_extraction(spext, ext, None, ext_data_label)
+            self._add_dq_cube(data_label, dq_data_label)
+
+    def _add_auto_extraction(self, spext, ext, exception, ext_data_label):
+        if exception is not None:
             msg = SnackbarMessage(
                 "Automatic spectrum extraction failed. See the 3D spectral extraction"
                 " plugin to perform a custom extraction",
-                color='error', sender=self, timeout=10000, traceback=e)
+                color='error', sender=self, timeout=10000, traceback=exception)
         else:
+            # we'll add the data manually instead of through add_results_from_plugin
+            # but still want to preserve the plugin metadata
+            ext.meta['plugin'] = spext._plugin_name
             msg = SnackbarMessage(
                 "The extracted 1D spectrum was generated automatically."
                 " See the 3D spectral extraction plugin for details or to"
@@ -545,41 +607,44 @@ class Spectrum3DImporter(BaseImporterToDataCollection, SpectrumInputExtensionsMi
             self.add_to_data_collection(ext, ext_data_label, viewer_select=self.ext_viewer,
                                         data_type='1D Spectrum')
 
-            if self.has_dq and not self.flux_only:
-                dq_hdu = self.dq_extension.selected_obj
-
-                # Skip DQ loading if no DQ extension was selected
-                if dq_hdu is None:
-                    return
-
-                # for DQ components, map zeros to nans
-                # so that they are not displayed in the colormap
-                dq_data = np.float32(dq_hdu.data)
-                dq_data[dq_data == 0] = np.nan
-
-                # Set _extname so the DQ plugin can identify this as a DQ layer
-                dq_meta = dict(self.output.meta)
-                dq_meta['_extname'] = 'DQ'
-
-                dq_cube = Spectrum(spectral_axis=self.output.spectral_axis,
-                                   flux=dq_data * u.dimensionless_unscaled,
-                                   wcs=self.output.wcs,
-                                   meta=dq_meta,
-                                   spectral_axis_index=self.output.spectral_axis_index)
-
-                # in cubeviz, use the dq_viewer selection. in deconfigged, optionally
-                # add to flux viewer based on checkbox, or don't add to any viewer
-                if self.config == 'cubeviz':
-                    viewer_for_dq = self.dq_viewer
-                else:
-                    viewer_for_dq = self.viewer if self.dq_add_to_flux_viewer else False
-
-                self.add_to_data_collection(dq_cube,
-                                            dq_data_label,
-                                            parent=data_label,
-                                            viewer_select=viewer_for_dq)
-
-                self._app._jdaviz_helper._loaded_dq_cube = self._app.data_collection[dq_data_label]
+    def _add_dq_cube(self, data_label, dq_data_label):
+        if not self.has_dq or self.flux_only:
+            return
+
+        dq_hdu = self.dq_extension.selected_obj
+
+        # Skip DQ loading if no DQ extension was selected
+        if dq_hdu is None:
+            return
+
+        # The DQ cube is kept in its native (integer) dtype, with the zeros
+        # (un-flagged pixels) made transparent by the DQ lookup stretch. It is
+        # added as glue data sharing the coordinates of the flux cube, since
+        # going through Spectrum would convert it to floats.
+        flux_data = self._app.data_collection[data_label]
+        dq_cube = Data(coords=flux_data.coords)
+        dq_cube['flux'] = dq_hdu.data
+        dq_cube.get_component('flux').units = str(u.dimensionless_unscaled)
+        dq_cube.meta.update(self.output.meta)
+        dq_cube.meta['spectral_axis_index'] = self.output.spectral_axis_index
+        # Set _extname so the DQ plugin can identify this as a DQ layer
+        dq_cube.meta['_extname'] = 'DQ'
+
+        # in cubeviz, use the dq_viewer selection. in deconfigged, optionally
+        # add to flux viewer based on checkbox, or don't add to any viewer
+        if self.config == 'cubeviz':
+            viewer_for_dq = self.dq_viewer
+        else:
+            viewer_for_dq = self.viewer if self.dq_add_to_flux_viewer else False
+
+        self.add_to_data_collection(dq_cube,
+                                    dq_data_label,
+                                    data_hash=create_data_hash(dq_hdu.data),
+                                    parent=data_label,
+                                    viewer_select=viewer_for_dq,
+                                    cls=Spectrum)
+
+        self._app._jdaviz_helper._loaded_dq_cube = self._app.data_collection[dq_data_label]
 
     def assign_component_type(self, comp_id, comp, units, physical_type):
         comp_type = _spatial_assign_component_type(comp_id, comp, units, physical_type)
@@ -1,3 +1,14 @@
+import asyncio
+import threading
+import tracemalloc
+
+import numpy as np
+from astropy import units as u
+from astropy.io import fits
+from astropy.nddata import StdDevUncertainty
+from astropy.wcs import WCS
+from specutils import Spectrum
+
 from jdaviz.core.loaders.importers.spectrum3d.spectrum3d import Spectrum3DImporter
 
 
@@ -16,3 +27,194 @@ def test_spectrum3d_importer_is_valid(deconfigged_helper, spectrum1d, spectrum1d
     if 'spectra' in importer.__dict__:
         del importer.__dict__['spectra']
     assert importer._check_is_valid() == 'Spectrum flux must be 3D.'
+
+
+def test_spectrum3d_fits_memmap_peak_memory(deconfigged_helper, tmp_path):
+    # the spectrum created from a cube file should wrap the memory-mapped array rather
+    # than reading (or copying) the full cube into memory
+    wcs = WCS(naxis=3)
+    wcs.wcs.ctype = ['RA---TAN', 'DEC--TAN', 'WAVE']
+    wcs.wcs.crval = [205, 27, 4.6]
+    wcs.wcs.cdelt = [-0.0001, 0.0001, 0.001]
+    wcs.wcs.crpix = [1, 1, 1]
+    wcs.wcs.cunit = ['deg', 'deg', 'um']
+    header = wcs.to_header()
+    header['BUNIT'] = 'Jy'
+    arr = np.random.default_rng(0).random((64, 256, 256)).astype('>f4')
+    filename = str(tmp_path / 'large_cube.fits')
+    fits.HDUList([fits.PrimaryHDU(), fits.ImageHDU(arr, header=header, name='FLUX')]
+                 ).writeto(filename)
+
+    ldr = deconfigged_helper.loaders['file']
+    tracemalloc.start()
+    try:
+        ldr.filepath = filename
+        ldr.format = '3D Spectrum'
+        sp = ldr.importer._obj.spectrum
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < arr.nbytes / 4
+    # converting to a surface brightness only relabels the unit
+    assert sp.flux.unit == u.Jy / u.pix**2
+    np.testing.assert_array_equal(sp.flux.value[:2, :2, :2], arr[:2, :2, :2])
+
+
+def test_spectrum3d_import_peak_memory(deconfigged_helper):
+    # converting the cube to a surface brightness only relabels the unit and should not
+    # copy the cube, nor should the (many) accesses of the output while importing
+    wcs = WCS(naxis=3)
+    wcs.wcs.ctype = ['RA---TAN', 'DEC--TAN', 'WAVE']
+    wcs.wcs.crval = [205, 27, 4.6]
+    wcs.wcs.cdelt = [-0.0001, 0.0001, 0.001]
+    wcs.wcs.crpix = [1, 1, 1]
+    wcs.wcs.cunit = ['deg', 'deg', 'um']
+    flux = np.random.default_rng(0).random((64, 256, 256)).astype(np.float32)
+    sp = Spectrum(flux=flux * u.Jy, wcs=wcs,
+                  uncertainty=StdDevUncertainty(0.1 * flux))
+
+    ldr = deconfigged_helper.loaders['object']
+    ldr.object = sp
+    ldr.format = '3D Spectrum'
+    importer = ldr.importer._obj
+    importer.auto_extract = False
+
+    tracemalloc.start()
+    try:
+        ldr.importer()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # allow for temporary arrays of a fraction of the cube (e.g. masks of non-finite values)
+    assert peak < 1.5 * flux.nbytes
+
+    output = importer.output
+    assert importer.output is output
+    assert output.flux.unit == u.Jy / u.pix**2
+    assert output.uncertainty.unit == u.Jy / u.pix**2
+    assert np.shares_memory(output.data, sp.data)
+    assert np.shares_memory(output.uncertainty.array, sp.uncertainty.array)
+    assert sp.flux.unit == u.Jy
+
+
+def _block_extractions(monkeypatch, spext):
+    # hold back the collapse of the cube in the background until the returned event is set
+    release = threading.Event()
+    collapse = spext._collapse_nddata
+    calls = []
+
+    def blocked_collapse(*args, **kwargs):
+        calls.append(threading.current_thread() is not threading.main_thread())
+        release.wait(60)
+        return collapse(*args, **kwargs)
+
+    monkeypatch.setattr(type(spext), '_collapse_nddata', staticmethod(blocked_collapse))
+    return release, calls
+
+
+async def _process_callbacks():
+    # let the event loop run the callbacks scheduled from the background threads
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+def test_spectrum3d_auto_extract_in_background(deconfigged_helper, spectrum1d_cube,
+                                               monkeypatch):
+    app = deconfigged_helper._app
+    spext = app.get_tray_item_from_name('spectral-extraction-3d')
+    release, calls = _block_extractions(monkeypatch, spext)
+    results = []
+
+    async def run():
+        deconfigged_helper.load(spectrum1d_cube, format='3D Spectrum', data_label='cube',
+                                ext_data_label='extracted', auto_extract_in_background=True)
+
+        # the cube is available before the extraction has completed
+        assert [d.label for d in app.data_collection] == ['cube']
+        assert spext.auto_extract_pending == ['cube']
+        thread, _ = spext._background_extractions['cube']
+
+        # triggering the extraction again supersedes the pending one
+        second_thread = spext._extract_in_background(
+            'cube', lambda ext, exception: results.append((ext, exception)))
+        assert spext.auto_extract_pending == ['cube']
+
+        release.set()
+        thread.join(60)
+        second_thread.join(60)
+        await _process_callbacks()
+
+    asyncio.run(run())
+
+    # only the collapse of the cubes ran in the background threads
+    assert calls == [True, True]
+    assert spext.auto_extract_pending == []
+    # only the result of the latest extraction is used
+    assert len(results) == 1
+    assert isinstance(results[0][0], Spectrum) and results[0][1] is None
+    assert [d.label for d in app.data_collection] == ['cube']
+
+
+def test_spectrum3d_auto_extract_in_background_order(deconfigged_helper, spectrum1d_cube,
+                                                     monkeypatch):
+    app = deconfigged_helper._app
+    spext = app.get_tray_item_from_name('spectral-extraction-3d')
+    release, calls = _block_extractions(monkeypatch, spext)
+
+    async def run():
+        deconfigged_helper.load(spectrum1d_cube, format='3D Spectrum', data_label='cube',
+                                ext_data_label='extracted', auto_extract_in_background=True)
+        thread, _ = spext._background_extractions['cube']
+        release.set()
+        thread.join(60)
+        await _process_callbacks()
+
+    asyncio.run(run())
+
+    assert calls == [True]
+    assert spext.auto_extract_pending == []
+    assert [d.label for d in app.data_collection] == ['cube', 'extracted']
+    assert app.data_collection['extracted'].meta['plugin'] == spext._plugin_name
+
+
+def test_spectrum3d_auto_extract_in_background_cancel(deconfigged_helper, spectrum1d_cube,
+                                                      monkeypatch):
+    app = deconfigged_helper._app
+    spext = app.get_tray_item_from_name('spectral-extraction-3d')
+    release, calls = _block_extractions(monkeypatch, spext)
+
+    async def run():
+        deconfigged_helper.load(spectrum1d_cube, format='3D Spectrum', data_label='cube',
+                                ext_data_label='extracted', auto_extract_in_background=True)
+        thread, _ = spext._background_extractions['cube']
+
+        # removing the cube cancels the pending extraction
+        app.data_collection.remove(app.data_collection['cube'])
+        assert spext.auto_extract_pending == []
+
+        release.set()
+        thread.join(60)
+        await _process_callbacks()
+
+    asyncio.run(run())
+    assert len(app.data_collection) == 0
+
+
+def test_spectrum3d_auto_extract_in_background_without_loop(deconfigged_helper,
+                                                            spectrum1d_cube):
+    app = deconfigged_helper._app
+    spext = app.get_tray_item_from_name('spectral-extraction-3d')
+
+    # without a running event loop to hand the result back to, the extraction is synchronous
+    deconfigged_helper.load(spectrum1d_cube, format='3D Spectrum', data_label='cube',
+                            ext_data_label='extracted', auto_extract_in_background=True)
+    assert spext.auto_extract_pending == []
+    assert [d.label for d in app.data_collection] == ['cube', 'extracted']
+
+    results = []
+    assert spext._extract_in_background(
+        'cube', lambda ext, exception: results.append((ext, exception))) is None
+    assert len(results) == 1
+    assert isinstance(results[0][0], Spectrum) and results[0][1] is None
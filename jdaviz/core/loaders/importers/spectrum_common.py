@@ -563,6 +563,18 @@ class SpectrumInputExtensionsMixin(VuetifyTemplate, HubListener):
         except Exception:
             data_unit = u.count
 
+        # convert flux and uncertainty to per-pix2 if input is not a surface brightness.
+        # This only relabels the unit, so is done when creating the spectrum (rather than
+        # with Spectrum.with_flux_unit, which deep-copies the arrays) so that memory-mapped
+        # data is not read into memory.
+        apply_pix2 = 'FLUX' in self.extension.selected or 'ERR' in self.extension.selected
+        if apply_pix2 and not is_unit_per_solid_angle(data_unit):
+            data_unit = data_unit / PIX2
+        elif is_unit_per_solid_angle(data_unit, return_unit=True) == "spaxel":
+            # We need to convert spaxel to pixel squared, since spaxel isn't fully supported
+            # by astropy
+            data_unit = data_unit * u.Unit('spaxel') / PIX2
+
         # Check if the current HDU is the same as the uncertainty HDU
         # (happens when loading uncertainty extension as primary data)
         if self.unc_extension.selected not in ('', 'None'):
@@ -594,7 +606,7 @@ class SpectrumInputExtensionsMixin(VuetifyTemplate, HubListener):
                 unc = VarianceUncertainty(unc_data).represent_as(StdDevUncertainty)
                 unc.unit = data_unit
             else:
-                unc = StdDevUncertainty(unc_data * data_unit)
+                unc = StdDevUncertainty(u.Quantity(unc_data, data_unit, copy=False))
         else:
             unc = None
 
@@ -654,7 +666,7 @@ class SpectrumInputExtensionsMixin(VuetifyTemplate, HubListener):
                 wcs = None
 
         try:
-            sc = Spectrum(flux=data * data_unit, uncertainty=unc,
+            sc = Spectrum(flux=u.Quantity(data, data_unit, copy=False), uncertainty=unc,
                           mask=mask_data, meta=metadata, wcs=wcs,
                           spectral_axis_index=spectral_axis_index)
         except ValueError:
@@ -667,17 +679,17 @@ class SpectrumInputExtensionsMixin(VuetifyTemplate, HubListener):
             except Exception:
                 # specutils.Spectrum reader would fail, so use no WCS
                 sc = Spectrum(
-                        flux=data * data_unit, uncertainty=unc,
+                        flux=u.Quantity(data, data_unit, copy=False), uncertainty=unc,
                         meta=metadata, spectral_axis_index=self.default_spectral_axis_index)
             else:
                 # raising an error here will consider this parser as non-valid
                 # so that specutils.Spectrum parser is preferred
                 raise
 
-        # convert flux and uncertainty to per-pix2 if input is not a surface brightness
+        # convert flux and uncertainty to per-pix2 if not already done above (i.e. if
+        # the spectrum was read by specutils instead)
         target_flux_unit = None
         target_wave_unit = None
-        apply_pix2 = 'FLUX' in self.extension.selected or 'ERR' in self.extension.selected
         flux = sc.flux
         if (apply_pix2 and
                 (not is_unit_per_solid_angle(flux.unit))):
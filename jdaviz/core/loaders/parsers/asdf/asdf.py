@@ -1,4 +1,5 @@
 from functools import cached_property
+import os
 import asdf
 import warnings
 
@@ -14,6 +15,8 @@ else:
 
 __all__ = ['ASDFParser']
 
+_ASDF_MAGIC = b'#ASDF'
+
 
 @loader_parser_registry('asdf')
 class ASDFParser(BaseParser):
@@ -26,6 +29,13 @@ class ASDFParser(BaseParser):
             # NOTE: temporary during deconfig process
             return f"asdf format is only supported in {', '.join(accepted_configs)}."
 
+        if isinstance(self.input, str) and os.path.isfile(self.input):
+            # check the magic bytes first: asdf would otherwise search the entire
+            # file for the end of its (missing) header line, reading it into memory
+            with open(self.input, 'rb') as f:
+                if f.read(len(_ASDF_MAGIC)) != _ASDF_MAGIC:
+                    return 'not an asdf file'
+
         _ = self.output
         return ''
 
@@ -2,6 +2,7 @@ from functools import cached_property
 from astropy.io import fits
 
 from jdaviz.core.loaders.parsers import BaseParser
+from jdaviz.core.loaders.preload import _close_hdulist
 from jdaviz.core.registries import loader_parser_registry
 
 
@@ -24,20 +25,22 @@ class FITSParser(BaseParser):
         _ = self.output
         return ''
 
+    @property
+    def _preloaded(self):
+        if not isinstance(self.input, str):
+            return None
+        return self._app._preloaded_files.get(self.input)
+
     @cached_property
     def output(self):
+        if self._preloaded is not None:
+            return self._preloaded
         return fits.open(self.input)
 
     def _cleanup(self):
         if 'output' not in self.__dict__:
             return
-        for hdu in self.output:
-            try:
-                del hdu.data
-            except Exception:  # nosec
-                pass
-        try:
-            self.output.close()
-        except Exception:  # nosec
-            pass
+        if self.output is not self._preloaded:
+            # otherwise closed by load_files, once it is loaded
+            _close_hdulist(self.output)
         self._clear_cache('output')
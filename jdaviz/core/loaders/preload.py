@@ -0,0 +1,140 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from astropy.io import fits
+
+from jdaviz.core.events import SnackbarMessage
+from jdaviz.utils import prime_data_hash
+
+__all__ = ['preload_files', 'load_files']
+
+FITS_EXTENSIONS = ('.fits', '.fit', '.fts', '.fits.gz', '.fit.gz', '.fts.gz')
+
+
+def _close_hdulist(hdulist):
+    # drop the references to the (memory-mapped) data held by the HDUs, so that the
+    # file can actually be closed, and close it
+    for hdu in hdulist:
+        try:
+            del hdu.data
+        except Exception:  # nosec
+            pass
+    try:
+        hdulist.close()
+    except Exception:  # nosec
+        pass
+
+
+def _read_file(filepath):
+    # open the HDUs of a FITS file and hash their data, both of which are otherwise
+    # done one file at a time while loading.  As in the FITS parser, the data are
+    # memory-mapped where possible, so the file is left open for the parser to use.
+    if not filepath.lower().endswith(FITS_EXTENSIONS):
+        return None
+    try:
+        hdulist = fits.open(filepath, lazy_load_hdus=False)
+    except Exception:  # nosec
+        # leave it to the loaders to report any errors
+        return None
+    try:
+        for hdu in hdulist:
+            prime_data_hash(hdu.data)
+    except Exception:  # nosec
+        _close_hdulist(hdulist)
+        return None
+    return hdulist
+
+
+def preload_files(filepaths, n_workers=None):
+    """
+    Read and hash files concurrently, ahead of loading them into an app.
+
+    FITS files are opened (with their data memory-mapped where possible, as when
+    loading them one at a time), and the data hashes used by the importers are
+    computed, in a pool of worker threads.  At most twice the number of workers
+    files are read ahead of the one being consumed.
+
+    Parameters
+    ----------
+    filepaths : list of str
+        Paths of the files.
+    n_workers : int or `None`, optional
+        Number of worker threads, see `~concurrent.futures.ThreadPoolExecutor`.
+
+    Yields
+    ------
+    hdulist : `~astropy.io.fits.HDUList` or `None`
+        The opened file (or `None` if it is not a FITS file or could not be read),
+        in the same order as ``filepaths``.  It is up to the caller to close it.
+        Files read ahead but never yielded (when the generator is closed early)
+        are closed.
+    """
+    filepaths = list(filepaths)
+    if n_workers is None:
+        # the default of ThreadPoolExecutor
+        n_workers = min(32, (os.cpu_count() or 1) + 4)
+    n_ahead = 2 * n_workers
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        futures = [pool.submit(_read_file, filepath) for filepath in filepaths[:n_ahead]]
+        try:
+            for i in range(len(filepaths)):
+                if i + n_ahead < len(filepaths):
+                    futures.append(pool.submit(_read_file, filepaths[i + n_ahead]))
+                hdulist = futures[i].result()
+                futures[i] = None
+                yield hdulist
+        finally:
+            for future in futures:
+                if future is None or future.cancel():
+                    continue
+                hdulist = future.result()
+                if hdulist is not None:
+                    _close_hdulist(hdulist)
+
+
+def load_files(helper, filepaths, formats=None, n_workers=None, **kwargs):
+    """
+    Load several files into an app, reading and hashing them concurrently.
+
+    The files are read in the background (see `preload_files`), and only their
+    registration into the app is done one at a time, in the order given, with the
+    progress reported for each file.
+
+    Parameters
+    ----------
+    helper : `~jdaviz.core.helpers.ConfigHelper`
+        Helper of the app to load the files into.
+    filepaths : list of str or path-like
+        Paths of the files.
+    formats : list of str or `None`, optional
+        Format of each file, passed to ``helper.load``.
+    n_workers : int or `None`, optional
+        Number of worker threads used to read the files.
+    **kwargs
+        Passed to ``helper.load`` for each file.
+    """
+    app = helper._app
+    filepaths = [os.fspath(filepath) for filepath in filepaths]
+    if formats is None:
+        formats = [None] * len(filepaths)
+    n_files = len(filepaths)
+
+    preloaded = preload_files(filepaths, n_workers=n_workers)
+    with helper.batch_load():
+        try:
+            for i, (filepath, format, hdulist) in enumerate(
+                    zip(filepaths, formats, preloaded)):
+                try:
+                    app.hub.broadcast(SnackbarMessage(
+                        f"Loading file {i + 1} of {n_files}: {os.path.basename(filepath)}",
+                        color='info', sender=app))
+                    if hdulist is not None:
+                        app._preloaded_files[filepath] = hdulist
+                    helper.load(filepath, format=format, **kwargs)
+                finally:
+                    app._preloaded_files.pop(filepath, None)
+                    if hdulist is not None:
+                        _close_hdulist(hdulist)
+        finally:
+            # close the files read ahead if loading stopped early
+            preloaded.close()
@@ -109,21 +109,24 @@ class FormatSelect(SelectPluginComponent):
 
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
+            timing = self.plugin._app._timing
             for parser_name, Parser in loader_parser_registry.members.items():
                 this_parser = Parser(self.plugin._app, parser_input)
                 self._parsers[parser_name] = this_parser
-                if this_parser.is_valid:
-                    try:
-                        importer_input = this_parser.output
-                    except Exception as e:
-                        self._invalid_importers[parser_name] = f'Parser exception: {e}'
+                with timing.span(parser_name, 'parser'):
+                    if this_parser.is_valid:
+                        try:
+                            importer_input = this_parser.output
+                        except Exception as e:
+                            self._invalid_importers[parser_name] = f'Parser exception: {e}'
+                            this_parser._cleanup()
+                            continue
+                    else:
+                        self._invalid_importers[parser_name] = this_parser.is_valid.message
+                        self._invalid_importers.setdefault(parser_name,
+                                                           this_parser.is_valid.message)
                         this_parser._cleanup()
                         continue
-                else:
-                    self._invalid_importers[parser_name] = this_parser.is_valid.message
-                    self._invalid_importers.setdefault(parser_name, this_parser.is_valid.message)
-                    this_parser._cleanup()
-                    continue
                 for importer_name, Importer in loader_importer_registry.members.items():
                     label = f"{parser_name} > {importer_name}"
                     if getattr(self.plugin, '_restrict_to_formats', None) is not None and \
@@ -131,10 +134,11 @@ class FormatSelect(SelectPluginComponent):
                         self._invalid_importers[label] = 'Not matching format restriction'  # noqa
                         continue
                     try:
-                        this_importer = Importer(app=self.plugin._app,
-                                                 resolver=self.plugin,
-                                                 parser=this_parser,
-                                                 input=importer_input)
+                        with timing.span(importer_name, 'importer', parser=parser_name):
+                            this_importer = Importer(app=self.plugin._app,
+                                                     resolver=self.plugin,
+                                                     parser=this_parser,
+                                                     input=importer_input)
                     except Exception as e:  # nosec
                         self._invalid_importers[label] = f'Importer exception: {e}'
                         continue
@@ -1018,7 +1022,8 @@ class BaseResolver(PluginTemplateMixin, CustomToolbarToggleMixin, FootprintDispl
         # Check if import is disabled before attempting to load
         if len(self.importer.import_disabled_msg) > 0:
             raise ValueError(self.importer.import_disabled_msg)
-        return self.importer()
+        with self._app._timing.span(f'import: {self.format.selected}', 'importer'):
+            return self.importer()
 
     @observe('target_selected')
     def _on_target_selected_changed(self, change={}):
@@ -1650,7 +1655,8 @@ def find_matching_resolver(app,
             invalid_resolvers[resolver_name] = f'not {resolver}'
             continue
         try:
-            this_resolver = Resolver.from_input(app, inp, format=format, **kwargs)
+            with app._timing.span(resolver_name, 'resolver'):
+                this_resolver = Resolver.from_input(app, inp, format=format, **kwargs)
         except Exception as e:  # nosec
             invalid_resolvers[resolver_name] = f'Resolver exception: {e}'
             if resolver_name == 'url' and 'timeout' in str(e):
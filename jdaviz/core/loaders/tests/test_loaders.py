@@ -1,3 +1,5 @@
+import mmap
+
 import numpy as np
 import pytest
 import time
@@ -13,9 +15,11 @@ from astroquery.mast import Mast, MastMissions
 from gwcs import WCS as GWCS
 from specutils import SpectralRegion, Spectrum
 
+from jdaviz.core.events import SnackbarMessage
 from jdaviz.core.registries import loader_resolver_registry
+from jdaviz.core.loaders.preload import load_files, preload_files
 from jdaviz.core.loaders.resolvers import find_matching_resolver
-from jdaviz.utils import cached_uri
+from jdaviz.utils import cached_uri, _primed_data_hashes
 
 
 def test_loaders_registry(specviz_helper):
@@ -776,6 +780,35 @@ def test_load_image_mult_sci_extension(imviz_helper):
     assert imviz_helper._app._get_assoc_data_parent('Image[ERR,2]') == 'Image[SCI,2]'
 
 
+def test_load_sparse_images_not_duplicates(imviz_helper, monkeypatch):
+    # sparse (e.g. DQ) arrays which are zero in all the blocks sampled for their hash
+    # must neither be taken for each other nor become each other's parent
+    monkeypatch.setattr('jdaviz.utils.HASH_SAMPLE_MIN_SIZE', 2**10)
+    monkeypatch.setattr('jdaviz.utils.HASH_SAMPLE_BLOCK_SIZE', 2**3)
+
+    def sparse_hdul(value):
+        sci = np.zeros((100, 100), dtype=np.float32)
+        sci[37, 51] = value
+        err = np.zeros((100, 100), dtype=np.float32)
+        err[37, 51] = value / 10
+        return fits.HDUList([fits.PrimaryHDU(),
+                             fits.ImageHDU(sci, name='SCI', ver=1),
+                             fits.ImageHDU(err, name='ERR', ver=1)])
+
+    app = imviz_helper._app
+    messages = []
+    app.hub.subscribe(imviz_helper, SnackbarMessage,
+                      handler=lambda msg: messages.append(msg.text))
+    imviz_helper.load_data(sparse_hdul(1), ext='SCI,1', data_label='first')
+    imviz_helper.load_data(sparse_hdul(2), ext='ERR,1', data_label='second')
+
+    assert [d.label for d in app.data_collection] == ['first[SCI,1]', 'second[ERR,1]']
+    data_hashes = [d.meta.get('_data_hash') for d in app.data_collection]
+    assert None not in data_hashes and data_hashes[0] != data_hashes[1]
+    assert not any('identical to existing data' in msg for msg in messages)
+    assert app._get_assoc_data_parent('second[ERR,1]') is None
+
+
 def test_loaders_extension_select(imviz_helper):
     # tests internal logic of SelectFileExtensionComponent
     hdul = _make_multi_sci_hdul()
@@ -1383,3 +1416,83 @@ def test_load_cube_no_dq_in_viewer(deconfigged_helper):
     datasets = deconfigged_helper.datasets
     assert len(datasets) == 3
     assert '3D Spectrum [DQ]' in datasets
+
+
+def test_load_files_preloaded(imviz_helper, tmp_path):
+    filepaths = []
+    for i in range(15):
+        filepath = tmp_path / f'exposure_{i:02d}.fits'
+        fits.HDUList([fits.PrimaryHDU(),
+                      fits.ImageHDU(np.full((10, 12), i, dtype=float), name='SCI')]
+                     ).writeto(filepath)
+        filepaths.append(filepath)
+    # not a FITS file, so not read ahead of time
+    np.save(tmp_path / 'exposure.npy', np.zeros((10, 12)))
+
+    preloaded = list(preload_files([str(fp) for fp in filepaths[:5]]
+                                   + [str(tmp_path / 'exposure.npy')], n_workers=3))
+    assert preloaded[-1] is None
+    assert [hdulist[1].data[0, 0] for hdulist in preloaded[:-1]] == list(range(5))
+    # the hashes used by the importers are computed while reading the files
+    assert all(id(hdu.data) in _primed_data_hashes for hdu in preloaded[0][1:])
+    # the data are memory-mapped rather than read into memory ahead of time
+    base = preloaded[0][1].data
+    while isinstance(base, np.ndarray):
+        base = base.base
+    assert isinstance(base, mmap.mmap)
+    for hdulist in preloaded[:-1]:
+        hdulist.close()
+
+    app = imviz_helper._app
+    messages = []
+    app.hub.subscribe(imviz_helper, SnackbarMessage,
+                      handler=lambda msg: messages.append(msg.text))
+    load_files(imviz_helper, filepaths, n_workers=3)
+
+    assert app.data_collection.labels == [f'exposure_{i:02d}[SCI,1]' for i in range(15)]
+    for i, data in enumerate(app.data_collection):
+        assert np.all(data.get_component(data.main_components[0]).data == i)
+    assert [msg for msg in messages if msg.startswith('Loading file')] == [
+        f'Loading file {i + 1} of 15: {fp.name}' for i, fp in enumerate(filepaths)]
+    assert app._preloaded_files == {}
+
+
+def test_load_files_closes_preloaded(imviz_helper, tmp_path, monkeypatch):
+    import jdaviz.core.loaders.preload as preload
+
+    filepaths = []
+    for i in range(10):
+        filepath = tmp_path / f'exposure_{i:02d}.fits'
+        fits.HDUList([fits.PrimaryHDU(),
+                      fits.ImageHDU(np.full((10, 12), i, dtype=float), name='SCI')]
+                     ).writeto(filepath)
+        filepaths.append(filepath)
+
+    opened = []
+    read_file = preload._read_file
+
+    def recording_read_file(filepath):
+        hdulist = read_file(filepath)
+        opened.append(hdulist)
+        return hdulist
+
+    monkeypatch.setattr(preload, '_read_file', recording_read_file)
+
+    load_files(imviz_helper, filepaths[:3], n_workers=2)
+    assert len(opened) == 3
+    assert all(hdulist._file.closed for hdulist in opened)
+
+    # loading stops at the first file that fails, which also closes the files read ahead
+    opened.clear()
+    load = imviz_helper.load
+
+    def failing_load(filepath, **kwargs):
+        if filepath.endswith('exposure_05.fits'):
+            raise ValueError('failed to load')
+        return load(filepath, **kwargs)
+
+    monkeypatch.setattr(imviz_helper, 'load', failing_load)
+    with pytest.raises(ValueError, match='failed to load'):
+        load_files(imviz_helper, filepaths, n_workers=2)
+    assert len(opened) > 6
+    assert all(hdulist._file.closed for hdulist in opened)
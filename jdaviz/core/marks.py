@@ -1,3 +1,5 @@
+import warnings
+
 import numpy as np
 
 from traitlets import Bool, observe
@@ -17,8 +19,8 @@ from jdaviz.core.unit_conversion_utils import (all_flux_unit_conversion_equivs,
                                                spectral_unit_conversion)
 
 
-__all__ = ['OffscreenLinesMarks', 'BaseSpectrumVerticalLine', 'SpectralLine',
-           'SliceIndicatorMarks', 'ShadowMixin', 'ShadowLine', 'ShadowLabelFixedY',
+__all__ = ['OffscreenLinesMarks', 'BaseSpectrumVerticalLine', 'SpectralLineHandle',
+           'SpectralLines', 'SliceIndicatorMarks', 'ShadowMixin', 'ShadowLine', 'ShadowLabelFixedY',
            'PluginMark', 'LinesAutoUnit', 'PluginLine', 'PluginScatter',
            'LineAnalysisContinuum', 'LineAnalysisContinuumCenter',
            'LineAnalysisContinuumLeft', 'LineAnalysisContinuumRight',
@@ -26,6 +28,18 @@ __all__ = ['OffscreenLinesMarks', 'BaseSpectrumVerticalLine', 'SpectralLine',
            'CatalogMark', 'TableSelectionMark', 'FootprintOverlay', 'ApertureMark',
            'DistanceMeasurement', 'DistanceLabel']
 
+
+def __getattr__(name):
+    if name == 'SpectralLine':
+        # spectral lines used to each be drawn by their own SpectralLine mark
+        warnings.warn("SpectralLine is deprecated and will be removed in version 5.2. "
+                      "All spectral lines of a viewer are now drawn by a single SpectralLines "
+                      "mark, whose lines attribute gives a SpectralLineHandle for each line.",
+                      DeprecationWarning, stacklevel=2)
+        return SpectralLineHandle
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 accent_color = "#c75d2c"
 
 # distinct from the jdaviz colors for backwards compat with MAST Portal:
@@ -65,11 +79,11 @@ class OffscreenLinesMarks(HubListener):
     def _update_counts(self, *args):
         oob_left, oob_right = 0, 0
         for m in self.viewer.figure.marks:
-            if isinstance(m, SpectralLine):
-                if m.x[0] < self.viewer.state.x_min:
-                    oob_left += 1
-                elif m.x[0] > self.viewer.state.x_max:
-                    oob_right += 1
+            if isinstance(m, SpectralLines):
+                left, right = m.count_offscreen(self.viewer.state.x_min,
+                                                self.viewer.state.x_max)
+                oob_left += left
+                oob_right += right
         self.left.text = [f'\u25c0 {oob_left}' if oob_left > 0 else '']
         self.right.text = [f'{oob_right} \u25b6' if oob_right > 0 else '']
 
@@ -317,81 +331,258 @@ class BaseSpectrumVerticalLine(Lines, PluginMark, HubListener):
         self.xunit = new_unit
 
 
-class SpectralLine(BaseSpectrumVerticalLine):
+class SpectralLineHandle:
     """
-    Subclass on bqplot Lines, mostly so that we can erase spectral lines
-    by eliminating any SpectralLines objects from a figures marks list. Also
-    lets us do wavelength redshifting here on mark creation.
+    A single spectral line drawn as part of the `SpectralLines` mark of a viewer.  This
+    provides access to (and control over) the properties of that line, whereas the
+    arrays of all lines are stored (and redshifted) together in the `SpectralLines` mark.
     """
-    def __init__(self, viewer, rest_value, redshift=0, name=None, **kwargs):
-        self._rest_value = rest_value
-        self._identify = False
+    def __init__(self, lines_mark, name, table_index):
+        self._lines_mark = lines_mark
         self.name = name
-
         # table_index is same as name_rest elsewhere
-        self.table_index = kwargs.pop("table_index", None)
+        self.table_index = table_index
 
-        # setting redshift will set self.x and enable the obs_value property,
-        # but to do that we need x_unit set first (would normally be assigned
-        # in the super init)
-        self.xunit = u.Unit(viewer.state.x_display_unit)
-        self.redshift = redshift
-
-        viewer.session.hub.subscribe(self, LineIdentifyMessage,
-                                     handler=self._process_identify_change)
+    @property
+    def _index(self):
+        return self._lines_mark._indices[self.table_index]
 
-        super().__init__(viewer=viewer, x=self.obs_value, stroke_width=1,
-                         fill='none', close_path=False, **kwargs)
+    @property
+    def viewer(self):
+        return self._lines_mark.viewer
 
     @property
     def name_rest(self):
         return self.table_index
 
+    @property
+    def xunit(self):
+        return self._lines_mark.xunit
+
     @property
     def rest_value(self):
-        return self._rest_value
+        return self._lines_mark._rest_values[self._index]
 
     @property
     def obs_value(self):
-        return self.x[0]
+        return self._lines_mark._obs_values[self._index]
 
-    def set_x_unit(self, unit=None):
-        prev_unit = self.xunit
-        super().set_x_unit(unit=unit)
-        self._rest_value = spectral_unit_conversion(self._rest_value, prev_unit, unit)
+    @property
+    def x(self):
+        return np.array([self.obs_value, self.obs_value])
 
     @property
     def redshift(self):
-        return self._redshift
+        return self._lines_mark._redshifts[self._index]
 
     @redshift.setter
     def redshift(self, redshift):
-        self._redshift = redshift
-        if str(self.xunit.physical_type) == 'length':
-            obs_value = self._rest_value*(1+redshift)
-        elif str(self.xunit.physical_type) == 'frequency':
-            obs_value = self._rest_value/(1+redshift)
-        else:
-            # catch all for anything else (wavenumber, energy, etc)
-            rest_angstrom = spectral_unit_conversion(self._rest_value, self.xunit, u.Angstrom)
-            obs_angstrom = rest_angstrom*(1+redshift)
-            obs_value = spectral_unit_conversion(obs_angstrom, u.Angstrom, self.xunit)
-        self.x = [obs_value, obs_value]
+        self._lines_mark.set_redshift(redshift, table_indices=[self.table_index])
+
+    @property
+    def colors(self):
+        return [self._lines_mark._line_colors[self._index]]
+
+    @colors.setter
+    def colors(self, colors):
+        self._lines_mark.set_colors({self.table_index: colors[0]})
 
     @property
     def identify(self):
-        return self._identify
+        return self._lines_mark.identified == self.table_index
 
     @identify.setter
     def identify(self, identify):
         if not isinstance(identify, bool):  # pragma: no cover
             raise TypeError("identify must be of type bool")
 
-        self._identify = identify
-        self.stroke_width = 3 if identify else 1
+        if identify:
+            self._lines_mark.identified = self.table_index
+        elif self.identify:
+            self._lines_mark.identified = None
+
+
+class SpectralLines(BaseSpectrumVerticalLine):
+    """
+    Subclass on bqplot Lines drawing all plotted spectral lines of a viewer as a single
+    mark, so that we can erase spectral lines by eliminating them from this mark.  The
+    rest values, redshifts and colors of the lines are stored as arrays so that
+    redshifting, unit conversion, and counting the lines out of view are vectorized.
+    The identified line is highlighted by the (thicker) ``identified_mark``.
+    """
+    def __init__(self, viewer, **kwargs):
+        self._lines = []
+        self._indices = {}
+        self._rest_values = np.array([])
+        self._redshifts = np.array([])
+        self._obs_values = np.array([])
+        self._sorted_obs_values = np.array([])
+        self._line_colors = []
+        self._identified = None
+
+        super().__init__(viewer=viewer, x=np.nan, stroke_width=1,
+                         fill='none', close_path=False, **kwargs)
+        self.identified_mark = Lines(x=[], y=[], scales=self.scales, stroke_width=3,
+                                     fill='none', close_path=False)
+
+        viewer.session.hub.subscribe(self, LineIdentifyMessage,
+                                     handler=self._process_identify_change)
+        self._update_x()
+
+    @property
+    def marks(self):
+        return [self, self.identified_mark]
+
+    @property
+    def lines(self):
+        """List of `SpectralLineHandle` objects for each of the plotted lines."""
+        return list(self._lines)
+
+    @property
+    def obs_values(self):
+        return self._obs_values
+
+    def add_lines(self, rest_values, names, table_indices, colors, redshift=0):
+        """
+        Add lines (replacing any existing lines with the same ``table_indices``),
+        with ``rest_values`` in the current x-units of the mark.
+        """
+        table_indices = list(table_indices)
+        self._remove(set(table_indices))
+        self._lines += [SpectralLineHandle(self, name, table_index)
+                        for name, table_index in zip(names, table_indices)]
+        self._rest_values = np.concatenate([self._rest_values,
+                                            np.asarray(rest_values, dtype=float)])
+        self._redshifts = np.concatenate([self._redshifts,
+                                          np.full(len(table_indices), _float(redshift))])
+        self._line_colors = self._line_colors + list(colors)
+        self._update_x()
+        return self._lines[-len(table_indices):] if len(table_indices) else []
+
+    def remove_lines(self, table_indices=None, names=None):
+        """
+        Remove the lines with any of the given ``table_indices`` or ``names``, or all
+        lines if neither are provided.
+        """
+        if table_indices is None and names is None:
+            remove = set(self._indices)
+        else:
+            names = set(names or [])
+            remove = set(table_indices or []).union(line.table_index for line in self._lines
+                                                    if line.name in names)
+        self._remove(remove)
+        self._update_x()
+
+    def _remove(self, table_indices):
+        keep = np.array([line.table_index not in table_indices for line in self._lines],
+                        dtype=bool)
+        if np.all(keep):
+            return
+        self._lines = [line for line, k in zip(self._lines, keep) if k]
+        self._rest_values = self._rest_values[keep]
+        self._redshifts = self._redshifts[keep]
+        self._line_colors = [c for c, k in zip(self._line_colors, keep) if k]
+        if self._identified in table_indices:
+            self._identified = None
+
+    def set_redshift(self, redshift, table_indices=None):
+        """
+        Set the redshift of all lines, or only those with the given ``table_indices``.
+        """
+        if table_indices is None:
+            self._redshifts[:] = _float(redshift)
+        else:
+            self._redshifts[[self._indices[ti] for ti in table_indices]] = _float(redshift)
+        self._update_x()
+
+    @property
+    def redshift(self):
+        return self._redshifts
+
+    @redshift.setter
+    def redshift(self, redshift):
+        self.set_redshift(redshift)
+
+    def set_colors(self, colors):
+        """
+        Set the colors of the lines from a dictionary of colors keyed by ``table_index``.
+        """
+        line_colors = list(self._line_colors)
+        for table_index, color in colors.items():
+            if table_index in self._indices:
+                line_colors[self._indices[table_index]] = color
+        self._line_colors = line_colors
+        self.colors = line_colors
+        self._update_identified_mark()
+
+    @property
+    def identified(self):
+        """``table_index`` of the identified line, if any."""
+        return self._identified
+
+    @identified.setter
+    def identified(self, table_index):
+        self._identified = table_index if table_index in self._indices else None
+        self._update_identified_mark()
 
     def _process_identify_change(self, msg):
-        self.identify = msg.name_rest == self.table_index
+        self.identified = msg.name_rest
+
+    def count_offscreen(self, x_min, x_max):
+        """
+        Return the number of lines to the left of ``x_min`` and to the right of ``x_max``.
+        """
+        obs = self._sorted_obs_values
+        if x_min is None or x_max is None:
+            return 0, 0
+        return (int(np.searchsorted(obs, x_min, side='left')),
+                len(obs) - int(np.searchsorted(obs, x_max, side='right')))
+
+    def _update_x(self):
+        self._indices = {line.table_index: i for i, line in enumerate(self._lines)}
+        rest, z = self._rest_values, self._redshifts
+        if not len(rest):
+            obs = np.array([])
+        elif str(self.xunit.physical_type) == 'length':
+            obs = rest * (1 + z)
+        elif str(self.xunit.physical_type) == 'frequency':
+            obs = rest / (1 + z)
+        else:
+            # catch all for anything else (wavenumber, energy, etc)
+            rest_angstrom = spectral_unit_conversion(rest, self.xunit, u.Angstrom)
+            obs = spectral_unit_conversion(rest_angstrom * (1 + z), u.Angstrom, self.xunit)
+        self._obs_values = np.asarray(obs, dtype=float)
+        self._sorted_obs_values = np.sort(self._obs_values)
+
+        with self.hold_sync():
+            if len(obs):
+                self.x = np.repeat(self._obs_values[:, np.newaxis], 2, axis=1)
+                self.y = np.tile([0, 1], (len(obs), 1))
+            else:
+                self.x = []
+                self.y = []
+            self.colors = self._line_colors
+        self._update_identified_mark()
+
+    def _update_identified_mark(self):
+        if not hasattr(self, 'identified_mark'):
+            return
+        mark = self.identified_mark
+        with mark.hold_sync():
+            if self._identified is None:
+                mark.x, mark.y = [], []
+            else:
+                ind = self._indices[self._identified]
+                mark.x = [self._obs_values[ind]] * 2
+                mark.y = [0, 1]
+                mark.colors = [self._line_colors[ind]]
+
+    def set_x_unit(self, unit=None):
+        if unit is None:
+            unit = getattr(self.viewer.state, 'x_display_unit', None)
+            if unit is None:
+                return
+        self._update_unit(u.Unit(unit))
 
     def _update_unit(self, new_unit):
         if self.xunit is None:
@@ -400,10 +591,17 @@ class SpectralLine(BaseSpectrumVerticalLine):
         if new_unit == self.xunit:
             return
 
-        self._rest_value = spectral_unit_conversion(self._rest_value, self.xunit, new_unit)
-        # re-compute self.x from current redshift (instead of converting that as well)
-        self.redshift = self._redshift
+        if len(self._rest_values):
+            self._rest_values = np.asarray(
+                spectral_unit_conversion(self._rest_values, self.xunit, new_unit), dtype=float)
         self.xunit = new_unit
+        # re-compute the observed values from the current redshifts (instead of
+        # converting those as well)
+        self._update_x()
+
+
+def _float(value):
+    return float(getattr(value, 'value', value))
 
 
 class SliceIndicatorMarks(BaseSpectrumVerticalLine, HubListener):
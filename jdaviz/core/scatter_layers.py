@@ -0,0 +1,165 @@
+import numpy as np
+
+from glue.core.exceptions import IncompatibleAttribute
+from glue.utils import ensure_numerical
+from glue_jupyter.bqplot.scatter.layer_artist import BqplotScatterLayerArtist
+
+
+__all__ = ['LevelOfDetailScatterLayerArtist']
+
+LIMIT_PROPERTIES = {'x_min', 'x_max', 'y_min', 'y_max'}
+
+
+class LevelOfDetailScatterLayerArtist(BqplotScatterLayerArtist):
+    """
+    Scatter layer artist that only sends the points within (a padded region around)
+    the current viewport to the frontend, and thins them to at most ``max_markers``
+    points when zoomed out far enough that more than that would be shown.
+
+    Layers with at most ``max_markers`` points, and layers shown with lines, vectors,
+    a density map, or a color or size mapped to an attribute, are passed through to
+    the glue-jupyter implementation unchanged.
+    """
+    # maximum number of points that are sent to the frontend at once
+    max_markers = 10000
+    # fraction of the viewport added along each side of the region sent to the frontend
+    # so that small pans do not require sending any new points (similar to the
+    # image_external_padding of the image viewers)
+    viewport_padding = 0.5
+
+    def __init__(self, view, viewer_state, *args, **kwargs):
+        # full arrays of (projected) positions of the layer, cached as accessing
+        # linked components can require a full coordinate transformation
+        self._lod_xy = None
+        # bounds of the region last sent to the frontend and whether it was thinned
+        self._lod_bounds = None
+        self._lod_thinned = False
+        super().__init__(view, viewer_state, *args, **kwargs)
+        self._viewer_state.add_global_callback(self._on_viewer_limits_changed)
+
+    @property
+    def _lod_enabled(self):
+        return not self.state.density_map and self._lod_supported
+
+    @property
+    def _lod_supported(self):
+        # whether the layer could be shown with a level of detail, if not as a density map
+        return (self.state.markers_visible
+                and not self.state.line_visible
+                and not self.state.vector_visible
+                and self.state.cmap_mode == 'Fixed'
+                and self.state.size_mode == 'Fixed'
+                and self.layer is not None
+                and self.layer.data.size > self.max_markers)
+
+    def _update_data(self):
+        self._lod_xy = None
+        self._lod_bounds = None
+        if (self.state.points_mode == 'auto' and self.state.density_map
+                and self._lod_supported):
+            # glue switches layers with more than 1e5 points to a density map in 'auto'
+            # mode, which is unnecessary where the number of markers shown is limited
+            self.state.points_mode = 'markers'
+        if not self._lod_enabled:
+            return super()._update_data()
+
+        try:
+            x = ensure_numerical(self.layer[self._viewer_state.x_att].ravel())
+            y = ensure_numerical(self.layer[self._viewer_state.y_att].ravel())
+        except (IncompatibleAttribute, IndexError):
+            # The following includes a call to self.clear()
+            self.disable_invalid_attributes(self._viewer_state.x_att,
+                                            self._viewer_state.y_att)
+            return
+        else:
+            self.enable()
+
+        # store the points in a random (but reproducible) order so that the points kept
+        # when thinning are not biased by the order of the rows in the catalog
+        order = np.random.default_rng(0).permutation(len(x))
+        self._lod_xy = (x[order].astype(np.float32), y[order].astype(np.float32))
+
+        self.line_mark_gl.x = [0.]
+        self.line_mark_gl.y = [0.]
+        self.line_mark.x = [0.]
+        self.line_mark.y = [0.]
+        self.vector_mark.x = []
+        self.vector_mark.y = []
+        self.vector_lines.x = []
+        self.vector_lines.y = []
+
+        self._update_lod()
+
+    def _on_viewer_limits_changed(self, **kwargs):
+        if self._lod_xy is not None and LIMIT_PROPERTIES.intersection(kwargs):
+            self._update_lod()
+
+    def _update_lod(self):
+        if self._lod_xy is None or self.scatter_mark is None:
+            return
+        x, y = self._lod_xy
+        vs = self._viewer_state
+
+        if None in (vs.x_min, vs.x_max, vs.y_min, vs.y_max):
+            viewport = (np.nanmin(x), np.nanmax(x), np.nanmin(y), np.nanmax(y))
+        else:
+            viewport = (*sorted((vs.x_min, vs.x_max)), *sorted((vs.y_min, vs.y_max)))
+
+        if self._lod_bounds is not None and not self._lod_thinned:
+            # everything within the previously sent region is already shown, so there is
+            # nothing to do until the viewport leaves that region
+            x0, x1, y0, y1 = self._lod_bounds
+            if (x0 <= viewport[0] and viewport[1] <= x1
+                    and y0 <= viewport[2] and viewport[3] <= y1):
+                return
+
+        dx = (viewport[1] - viewport[0]) * self.viewport_padding
+        dy = (viewport[3] - viewport[2]) * self.viewport_padding
+        bounds = (viewport[0] - dx, viewport[1] + dx, viewport[2] - dy, viewport[3] + dy)
+        inds = _indices_within(x, y, bounds)
+
+        thinned = len(inds) > self.max_markers
+        if thinned:
+            # the padding would never be re-used (the level of detail changes with any
+            # change to the limits), so only consider the viewport itself
+            bounds = viewport
+            inds = _indices_within(x, y, bounds)
+            if len(inds) > self.max_markers:
+                inds = _thin_indices(x, y, inds, bounds, self.max_markers)
+            else:
+                thinned = False
+
+        self._lod_bounds = bounds
+        self._lod_thinned = thinned
+        self.scatter_mark.x = x[inds]
+        self.scatter_mark.y = y[inds]
+
+    def remove(self):
+        self._viewer_state.remove_global_callback(self._on_viewer_limits_changed)
+        self._lod_xy = None
+        super().remove()
+
+
+def _indices_within(x, y, bounds):
+    x0, x1, y0, y1 = bounds
+    return np.flatnonzero((x >= x0) & (x <= x1) & (y >= y0) & (y <= y1))
+
+
+def _thin_indices(x, y, inds, bounds, max_markers):
+    """
+    Thin ``inds`` to at most ``max_markers`` points by keeping a single point in each
+    cell of a regular grid over ``bounds``, so that dense regions are thinned while
+    isolated points are always kept.
+    """
+    x0, x1, y0, y1 = bounds
+    n = max(int(np.sqrt(max_markers)), 1)
+    ix = np.clip(((x[inds] - x0) / max(x1 - x0, 1e-30) * n).astype(int), 0, n - 1)
+    iy = np.clip(((y[inds] - y0) / max(y1 - y0, 1e-30) * n).astype(int), 0, n - 1)
+    cells = iy * n + ix
+    # any point in a cell is as good as any other (the points are in random order), so
+    # avoid sorting and keep whichever one is assigned to the cell last
+    representative = np.empty(n * n, dtype=inds.dtype)
+    representative[cells] = inds
+    occupied = np.zeros(n * n, dtype=bool)
+    occupied[cells] = True
+    return representative[occupied]
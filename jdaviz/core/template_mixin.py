@@ -792,6 +792,9 @@ def with_spinner(spinner_traitlet='spinner', truthy=True):
     completion.  This traitlet can then be used in the UI to disable elements or
     display a spinner during operation.
 
+    The call is also recorded as a timing span when timing is enabled for the app
+    (see `~jdaviz.core.timing.TimingRecorder`).
+
     Each plugin gets a 'spinner' traitlet by default, but some plugins
     may want different controls for different sections/actions within the plugin.
 
@@ -808,8 +811,13 @@ def with_spinner(spinner_traitlet='spinner', truthy=True):
             else:
                 spinner_value = truthy
             setattr(self, spinner_traitlet, spinner_value)
+            timing = getattr(getattr(self, '_app', None), '_timing', None)
             try:
-                ret_ = meth(self, *args, **kwargs)
+                if timing is not None and timing.enabled:
+                    with timing.span(f'{self.__class__.__name__}.{meth.__name__}', 'plugin'):
+                        ret_ = meth(self, *args, **kwargs)
+                else:
+                    ret_ = meth(self, *args, **kwargs)
             finally:
                 setattr(self, spinner_traitlet, False if spinner_value is True else '')
             return ret_
@@ -2278,6 +2286,11 @@ class LayerSelect(SelectPluginComponent):
             icon (alphabetical by icon, effectively by order in which layers were first
             added and assigned an icon)
         """
+        # whether rebuilding items can be delayed and coalesced, see
+        # Application._delay_layer_select_update
+        self._coalesce_updates = False
+        self._update_pending = False
+        self._pending_removed_subsets = set()
         super().__init__(plugin,
                          items=items,
                          selected=selected,
@@ -2352,6 +2365,14 @@ class LayerSelect(SelectPluginComponent):
         elif self.viewer == msg.old_viewer_ref:
             self.viewer = msg.new_viewer_ref
 
+    def __getattr__(self, attr):
+        if attr in ('items', 'selected') and self.__dict__.get('_update_pending'):
+            # apply an update delayed until the end of the event-loop tick (or of a block
+            # delaying updates) before the items are accessed, so that they are never
+            # stale when read, e.g. by code loading data within a batch
+            self._flush_pending_update()
+        return super().__getattr__(attr)
+
     def _get_viewer(self, viewer):
         # viewer will likely be the viewer name in most cases, but viewer id in the case
         # of additional viewers in imviz.
@@ -2446,7 +2467,13 @@ class LayerSelect(SelectPluginComponent):
 
         return super()._is_valid_item(lyr, locals())
 
-    def _layer_to_dict(self, layer_label):
+    def _layer_to_dict(self, layer_label, viewer_layers=None):
+        # viewer_layers: layers with this label in each viewer, to avoid looping through
+        # all the layers of each viewer for every label when building all the items
+        if viewer_layers is None:
+            viewer_layers = [(viewer, [layer for layer in viewer.layers
+                                       if layer.layer.label == layer_label])
+                             for viewer in self.viewer_objs]
         is_subset = None
         is_sonified = None
         subset_type = None
@@ -2456,10 +2483,9 @@ class LayerSelect(SelectPluginComponent):
         colors = []
         visibilities = []
         linewidths = []
-        for viewer in self.viewer_objs:
-            for layer in viewer.layers:
-                if (layer.layer.label == layer_label
-                        and is_not_wcs_only(layer.layer)
+        for viewer, layers in viewer_layers:
+            for layer in layers:
+                if (is_not_wcs_only(layer.layer)
                         and is_not_wcs_only(layer.layer.data)):
                     if is_subset is None:
                         is_subset = ((hasattr(layer, 'state') and hasattr(layer.state, 'subset_state')) or  # noqa
@@ -2636,15 +2662,36 @@ class LayerSelect(SelectPluginComponent):
     @observe('filters', 'sort_by')
     def _update_items(self, msg={}, remove_subset=None):
         # NOTE: _on_layers_changed is passed without a msg object during init
+        if self._coalesce_updates:
+            if remove_subset is not None:
+                self._pending_removed_subsets.add(remove_subset)
+            if not self._app._delay_layer_select_update(self):
+                self._update_pending = True
+                self._flush_pending_update()
+            return
+        self._rebuild_items(remove_subset)
+
+    def _flush_pending_update(self):
+        if not self._update_pending:
+            return
+        self._update_pending = False
+        # a subset removed since the update was delayed might have been re-created since
+        existing_subsets = [sg.label for sg in self._app.data_collection.subset_groups]
+        removed_subsets = {label for label in self._pending_removed_subsets
+                           if label not in existing_subsets}
+        self._pending_removed_subsets = set()
+        self._rebuild_items(removed_subsets)
+
+    def _rebuild_items(self, remove_subset=None):
         # TODO: if the message is a SubsetUpdateMessage, only act on those that require
         # an update
-        # TODO: Handle changes to just one item without recompiling the whole thing
         manual_items = [{'label': label} for label in self.manual_options]
         # use getattr so the super() call above doesn't try to access the attr before
         # it is initialized:
 
+        viewer_objs = self.viewer_objs
         all_layers = [
-            layer for viewer in self.viewer_objs
+            layer for viewer in viewer_objs
             for layer in getattr(viewer, 'layers', [])
             if self._is_valid_item(layer.layer)
         ]
@@ -2659,7 +2706,20 @@ class LayerSelect(SelectPluginComponent):
 
         # if remove_subset provided, subset has already been removed, enforcing the removal here
         # so data menu updates accordingly
-        unique_layer_labels = list(set(layer_labels) - {remove_subset})
+        if remove_subset is None or isinstance(remove_subset, str):
+            remove_subset = {remove_subset}
+        unique_layer_labels = list(set(layer_labels) - set(remove_subset))
+
+        # layers of each viewer by label, for _layer_to_dict
+        layers_by_label = [(viewer, {}) for viewer in viewer_objs]
+        for viewer, layers in layers_by_label:
+            for layer in getattr(viewer, 'layers', []):
+                layers.setdefault(layer.layer.label, []).append(layer)
+
+        def _layer_to_dict(layer_label):
+            return self._layer_to_dict(layer_label,
+                                       [(viewer, layers.get(layer_label, []))
+                                        for viewer, layers in layers_by_label])
 
         # During rename operations, preserve the existing order to prevent parent-child
         # layers from being reordered
@@ -2672,7 +2732,7 @@ class LayerSelect(SelectPluginComponent):
 
             # Build layer_items in the same order as existing items
             layer_items = []
-            label_to_dict = {label: self._layer_to_dict(label)
+            label_to_dict = {label: _layer_to_dict(label)
                              for label in unique_layer_labels}
 
             # First, add items in the existing order
@@ -2685,7 +2745,7 @@ class LayerSelect(SelectPluginComponent):
                 if label not in existing_labels:
                     layer_items.append(label_to_dict[label])
         else:
-            layer_items = [self._layer_to_dict(layer_label) for layer_label in unique_layer_labels]
+            layer_items = [_layer_to_dict(layer_label) for layer_label in unique_layer_labels]
 
         def _sort_by_icon(items_dict):
             icon = items_dict['icon']
@@ -0,0 +1,76 @@
+import json
+
+import numpy as np
+from astropy import units as u
+from specutils import Spectrum
+
+
+def test_timing_disabled(deconfigged_helper, spectrum1d):
+    timing = deconfigged_helper.timing
+    assert not timing.enabled
+    assert 'broadcast' not in deconfigged_helper._app.hub.__dict__
+
+    deconfigged_helper.load(spectrum1d, data_label='spectrum')
+    with timing.span('anything', 'test'):
+        pass
+    assert timing.spans == []
+    assert timing.summary() == []
+
+
+def test_timing_spans(deconfigged_helper, spectrum1d, tmp_path):
+    timing = deconfigged_helper.timing
+    with timing.record():
+        assert timing.enabled
+        deconfigged_helper.load(spectrum1d, data_label='spectrum')
+        deconfigged_helper.plugins['Gaussian Smooth'].smooth()
+    assert not timing.enabled
+    assert 'broadcast' not in deconfigged_helper._app.hub.__dict__
+
+    spans = {(span['category'], span['name']) for span in timing.spans}
+    assert ('resolver', 'object') in spans
+    assert ('parser', 'object') in spans
+    assert ('importer', 'import: 1D Spectrum') in spans
+    assert ('plugin', 'GaussianSmooth.spectral_smooth') in spans
+    assert ('hub', 'DataCollectionAddMessage') in spans
+
+    summary = timing.summary()
+    assert [entry['total'] for entry in summary] == sorted(
+        [entry['total'] for entry in summary], reverse=True)
+    n_spans = sum(entry['count'] for entry in summary)
+    assert n_spans == len(timing.spans)
+
+    filename = tmp_path / 'trace.json'
+    trace = timing.to_chrome_trace(filename)
+    with open(filename) as f:
+        assert json.load(f) == trace
+    events = trace['traceEvents']
+    assert len(events) == n_spans
+    assert {event['ph'] for event in events} == {'X'}
+    assert [event['ts'] for event in events] == sorted(event['ts'] for event in events)
+    # spans of the import are nested within the span of the whole import
+    load = next(event for event in events if event['name'] == 'import: 1D Spectrum')
+    add = [event for event in events if event['name'] == 'DataCollectionAddMessage']
+    assert any(load['ts'] <= event['ts'] and event['ts'] + event['dur'] <= load['ts'] + load['dur']
+               for event in add)
+
+    timing.clear()
+    assert timing.spans == []
+
+
+def test_timing_logger(deconfigged_helper):
+    logger = deconfigged_helper.plugins['Logger']
+    logger.timing_enabled = True
+    assert deconfigged_helper.timing.enabled
+
+    deconfigged_helper.load(Spectrum(flux=np.ones(5) * u.Jy,
+                                     spectral_axis=np.arange(1, 6) * u.um))
+    logger.update_timing_summary()
+    rows = logger._obj.timing_summary
+    assert 0 < len(rows) <= 20
+    assert [(row['category'], row['name']) for row in rows] == [
+        (entry['category'], entry['name']) for entry in deconfigged_helper.timing.summary()[:20]]
+
+    logger.timing_enabled = False
+    assert not deconfigged_helper.timing.enabled
+    logger._obj.vue_clear_timing()
+    assert logger._obj.timing_summary == []
@@ -1,5 +1,6 @@
 import astropy.units as u
 from itertools import combinations
+import numpy as np
 from numpy.testing import assert_allclose
 import pytest
 from specutils import Spectrum
@@ -11,8 +12,11 @@ from jdaviz.core.unit_conversion_utils import (all_flux_unit_conversion_equivs,
                                                is_unit_per_solid_angle,
                                                combine_flux_and_angle_units,
                                                flux_unit_conversion,
+                                               spectral_unit_conversion,
                                                squared_flux_unit_conversions,
-                                               viewer_flux_conversion_equivalencies)
+                                               viewer_flux_conversion_equivalencies,
+                                               _flux_conversion_plan,
+                                               _spectral_conversion_plan)
 
 
 @pytest.mark.parametrize("unit, is_solid_angle", [
@@ -241,3 +245,56 @@ def test_viewer_flux_conversion():
     targ *= (u.erg / (u.AA * u.cm * u.cm * u.s))  # FLAM
     assert_allclose(flux_unit_conversion(values, u.Jy, targ.unit, viewer_equivs),
                     targ)
+
+
+@pytest.mark.parametrize(('orig', 'targ', 'kind'),
+                         [('um', 'Angstrom', 'scale'), ('um', 'Hz', 'equivalencies'),
+                          ('pix', 'um', 'skip'), (u.GHz, u.eV, 'equivalencies')])
+def test_spectral_conversion_plan(orig, targ, kind):
+    assert _spectral_conversion_plan(orig, targ).kind == kind
+    # plans are only worked out once per pair of units
+    assert _spectral_conversion_plan(orig, targ) is _spectral_conversion_plan(orig, targ)
+
+    values = [1, 2, 3]
+    if kind == 'skip':
+        expected = values
+    else:
+        expected = (values * u.Unit(orig)).to_value(targ, equivalencies=u.spectral())
+    assert_allclose(spectral_unit_conversion(values, orig, targ), expected)
+    assert_allclose(spectral_unit_conversion(np.array(values), orig, targ), expected)
+    assert_allclose(spectral_unit_conversion(2, orig, targ), expected[1])
+    res = spectral_unit_conversion(values, orig, targ, with_unit=True)
+    assert res.unit == u.Unit(orig if kind == 'skip' else targ)
+
+
+def test_flux_conversion_plan():
+    spec = Spectrum(flux=[1, 2, 3]*u.Jy, spectral_axis=[1, 2, 3]*u.um,
+                    meta={'_pixel_scale_factor': 0.1})
+    equivs = viewer_flux_conversion_equivalencies([10, 20, 30], spec)
+
+    assert _flux_conversion_plan('Jy', 'mJy').kind == 'scale'
+    assert _flux_conversion_plan('MJy / sr', 'Jy / sr').kind == 'scale'
+    assert _flux_conversion_plan('ct', 'Jy').kind == 'skip'
+    assert _flux_conversion_plan('Jy', 'erg / (Angstrom s cm2)').kind == 'equivalencies'
+
+    # the route for flux <> surface brightness conversions is remembered per set
+    # of equivalencies (regardless of the values they are defined for)
+    plan = _flux_conversion_plan('MJy / sr', 'erg / (Angstrom s cm2)')
+    for _ in range(2):
+        res = flux_unit_conversion([10, 20, 30], 'MJy / sr', 'erg / (Angstrom s cm2)', equivs)
+        expected = ([10, 20, 30] * u.MJy).to(u.erg / (u.AA * u.s * u.cm**2),
+                                             u.spectral_density(spec.spectral_axis)) * 0.1
+        assert_allclose(res, expected)
+    assert list(plan.direct_routes.values()) == [False]
+
+
+def test_conversion_plan_cached():
+    # repeated conversions between the same units reuse the cached conversion plan
+    values = np.arange(10.)
+    n_calls = 50
+    _flux_conversion_plan.cache_clear()
+    for _ in range(n_calls):
+        flux_unit_conversion(values, 'MJy / sr', 'Jy / sr', with_unit=False)
+    cache_info = _flux_conversion_plan.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == n_calls - 1
@@ -0,0 +1,177 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+__all__ = ['TimingRecorder']
+
+_NULL_SPAN = nullcontext()
+
+
+class _Span:
+    __slots__ = ('recorder', 'name', 'category', 'args', 'start')
+
+    def __init__(self, recorder, name, category, args):
+        self.recorder = recorder
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.recorder._spans.append((self.name, self.category, self.start,
+                                     time.perf_counter_ns() - self.start,
+                                     threading.get_ident(), self.args))
+        return False
+
+
+class TimingRecorder:
+    """
+    Opt-in recorder of timing spans within an app.
+
+    When enabled, the resolver, parser and importer stages of loading data, plugin
+    computations (methods wrapped with
+    :func:`~jdaviz.core.template_mixin.with_spinner`) and broadcasts of messages on
+    the hub of the app are recorded.  When disabled (the default), `span` returns a
+    shared no-op context manager and nothing is recorded.
+
+    Parameters
+    ----------
+    app : `~jdaviz.app.Application`
+        App to record timing for.
+    max_spans : int, optional
+        Maximum number of spans kept, with the oldest spans dropped first.
+    """
+    def __init__(self, app, max_spans=100000):
+        self._app = app
+        self._enabled = False
+        self._spans = deque(maxlen=max_spans)
+
+    @property
+    def enabled(self):
+        """Whether timing spans are currently recorded."""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled):
+        if enabled:
+            self.enable()
+        else:
+            self.disable()
+
+    def enable(self):
+        """Start recording timing spans."""
+        if self._enabled:
+            return
+        self._enabled = True
+        # broadcasts are timed by the app, see Application._update_hub_broadcast
+        self._app._update_hub_broadcast()
+
+    def disable(self):
+        """Stop recording timing spans (the spans recorded so far are kept)."""
+        if not self._enabled:
+            return
+        self._enabled = False
+        self._app._update_hub_broadcast()
+
+    @contextmanager
+    def record(self):
+        """Context manager to record timing spans within a block only."""
+        was_enabled = self._enabled
+        self.enable()
+        try:
+            yield self
+        finally:
+            if not was_enabled:
+                self.disable()
+
+    def clear(self):
+        """Remove all recorded spans."""
+        self._spans.clear()
+
+    def span(self, name, category, **args):
+        """
+        Context manager timing the code within it as a span, if enabled.
+
+        Parameters
+        ----------
+        name : str
+            Name of the span.
+        category : str
+            Category of the span (e.g. 'importer', 'plugin', 'hub').
+        **args
+            Additional information stored with the span.
+        """
+        if not self._enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args)
+
+    @property
+    def spans(self):
+        """
+        Recorded spans, in the order they ended.
+
+        Returns
+        -------
+        spans : list of dict
+            Name, category, start and duration (in seconds, with the start relative to
+            an arbitrary reference), thread and any additional information of each span.
+        """
+        return [{'name': name, 'category': category, 'start': start * 1e-9,
+                 'duration': duration * 1e-9, 'thread': thread, 'args': args}
+                for name, category, start, duration, thread, args in list(self._spans)]
+
+    def summary(self):
+        """
+        Total, mean and maximum duration of the recorded spans of each name.
+
+        Returns
+        -------
+        summary : list of dict
+            One entry per name and category of span, sorted by total duration (in
+            seconds, with nested spans included in the duration of their parents).
+        """
+        totals = {}
+        for name, category, _, duration, _, _ in list(self._spans):
+            entry = totals.setdefault((category, name), [0, 0, 0])
+            entry[0] += 1
+            entry[1] += duration
+            entry[2] = max(entry[2], duration)
+        summary = [{'name': name, 'category': category, 'count': count,
+                    'total': total * 1e-9, 'mean': total * 1e-9 / count,
+                    'max': maximum * 1e-9}
+                   for (category, name), (count, total, maximum) in totals.items()]
+        return sorted(summary, key=lambda entry: entry['total'], reverse=True)
+
+    def to_chrome_trace(self, filename=None):
+        """
+        Export the recorded spans in the Chrome trace event format.
+
+        The output can be opened with e.g. https://ui.perfetto.dev or chrome://tracing.
+
+        Parameters
+        ----------
+        filename : str or path-like, optional
+            If provided, the trace is written to this (JSON) file.
+
+        Returns
+        -------
+        trace : dict
+            Trace, with the spans as complete ('X') events in ``traceEvents``.
+        """
+        pid = os.getpid()
+        events = [{'name': name, 'cat': category, 'ph': 'X', 'ts': start / 1e3,
+                   'dur': duration / 1e3, 'pid': pid, 'tid': thread,
+                   'args': {k: str(v) for k, v in args.items()}}
+                  for name, category, start, duration, thread, args in list(self._spans)]
+        trace = {'traceEvents': sorted(events, key=lambda event: event['ts']),
+                 'displayTimeUnit': 'ms'}
+        if filename is not None:
+            with open(filename, 'w') as f:
+                json.dump(trace, f)
+        return trace
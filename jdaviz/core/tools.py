@@ -20,10 +20,10 @@ from glue_jupyter.bqplot.common.tools import (CheckableTool,
 from glue_jupyter.common.toolbar_vuetify import read_icon
 from bqplot.interacts import BrushSelector, BrushIntervalSelector
 
-from jdaviz.core.events import (LineIdentifyMessage, SpectralMarksChangedMessage,
-                                CatalogSelectClickEventMessage, FootprintSelectClickEventMessage,
-                                FootprintOverlayClickMessage, TableSelectRowClickMessage)
-from jdaviz.core.marks import SpectralLine, FootprintOverlay, RegionOverlay
+from jdaviz.core.events import (LineIdentifyMessage, CatalogSelectClickEventMessage,
+                                FootprintSelectClickEventMessage, FootprintOverlayClickMessage,
+                                TableSelectRowClickMessage)
+from jdaviz.core.marks import SpectralLines, FootprintOverlay, RegionOverlay
 from jdaviz.utils import get_top_layer_index, in_ra_comps, in_dec_comps
 
 __all__ = []
@@ -1011,42 +1011,25 @@ class SafeClickCallbackTool(CheckableTool):
 
 
 @viewer_tool
-class SelectLine(SafeClickCallbackTool, HubListener):
+class SelectLine(SafeClickCallbackTool):
     icon = os.path.join(ICON_DIR, 'line_select.svg')
     tool_id = 'jdaviz:selectline'
     action_text = 'Select/identify spectral line'
     tool_tip = 'Select/identify spectral line'
 
-    def __init__(self, viewer, **kwargs):
-        super().__init__(viewer, **kwargs)
-        self.line_marks = []
-        self.line_names = []
-
-        self.viewer.session.hub.subscribe(self, SpectralMarksChangedMessage,
-                                          handler=self._on_plotted_lines_changed)
-
-    def _before_activate(self):
-        # ensure self.line_marks is populated
-        self.viewer._broadcast_plotted_lines()
-
-    def _on_plotted_lines_changed(self, msg):
-        self.line_marks = msg.marks
-        self.line_names = msg.names_rest
-
     def on_mouse_event(self, data):
-        # yes this would be avoid a list-comprehension by putting in
-        # _on_plotted_lines_changed, but by leaving it here, we let
-        # the marks worry about unit conversions
-        lines_x = np.array([mark.obs_value for mark in self.line_marks])
-        if not len(lines_x):
+        lines_mark = self.viewer._get_spectral_lines_mark()
+        if lines_mark is None or not len(lines_mark.obs_values):
             return
-        ind = np.argmin(abs(lines_x - data['domain']['x']))
+        # the mark keeps the observed positions of all lines (in its current x-units,
+        # so we don't need to worry about unit conversions here) in a single array
+        ind = np.argmin(abs(lines_mark.obs_values - data['domain']['x']))
         # find line closest to mouse position and transmit event
-        msg = LineIdentifyMessage(self.line_names[ind], sender=self)
+        msg = LineIdentifyMessage(lines_mark.lines[ind].name_rest, sender=self)
         self.viewer.session.hub.broadcast(msg)
 
     def is_visible(self):
-        return len([m for m in self.viewer.figure.marks if isinstance(m, SpectralLine)]) > 0
+        return any(len(m.lines) for m in self.viewer.figure.marks if isinstance(m, SpectralLines))
 
 
 @viewer_tool
@@ -1,7 +1,10 @@
 from collections.abc import Iterable
+from copy import copy
+from functools import lru_cache
 import itertools
 
 from astropy import units as u
+from astropy.nddata import StdDevUncertainty
 from specutils import Spectrum
 import numpy as np
 
@@ -464,6 +467,66 @@ def unit_is_from_moment_map(unit):
         return False
 
 
+class _ConversionPlan:
+    """
+    Everything about a conversion between two units that does not depend on the values
+    being converted (or the values the equivalencies are defined for), so that it only
+    needs to be worked out once per pair of units.  See `_flux_conversion_plan` and
+    `_spectral_conversion_plan`.
+    """
+    def __init__(self, kind, original_unit, target_unit, scale=None,
+                 solid_angle_in_orig=None, solid_angle_in_targ=None):
+        # 'skip' (return values unchanged), 'scale' (multiply by scale), or
+        # 'equivalencies' (convert with the equivalencies passed at call time)
+        self.kind = kind
+        self.original_unit = original_unit
+        self.target_unit = target_unit
+        self.scale = scale
+        self.solid_angle_in_orig = solid_angle_in_orig
+        self.solid_angle_in_targ = solid_angle_in_targ
+        # whether converting directly (rather than through the solid angle) works
+        # for a given set of equivalencies
+        self.direct_routes = {}
+
+
+def _direct_scale(original_unit, target_unit):
+    # scale factor between two units if convertible without any equivalencies, else None
+    with u.set_enabled_equivalencies([]):
+        try:
+            return original_unit.to(target_unit)
+        except u.UnitConversionError:
+            return None
+
+
+@lru_cache(maxsize=1024)
+def _flux_conversion_plan(original_unit, target_unit):
+    # convert to Unit object (if not already, which is handled in when casting)
+    original_unit = u.Unit(original_unit)
+    target_unit = u.Unit(target_unit)
+
+    # if the units being converted are likely from a moment map, skip conversion
+    # (which will fail anyway) without erroring and just return input (with or
+    # without units attached, as requested)
+    if unit_is_from_moment_map(original_unit):
+        return _ConversionPlan('skip', original_unit, target_unit)
+
+    # do not attempt to convert if either unit is pixel / dimensionless,
+    # to support mixed-unit viewing.
+    if not np.all([is_physical_flux_unit(x) for x in (original_unit, target_unit)]):
+        return _ConversionPlan('skip', original_unit, target_unit)
+
+    scale = _direct_scale(original_unit, target_unit)
+    if scale is not None:
+        return _ConversionPlan('scale', original_unit, target_unit, scale=scale)
+
+    # get solid angle component of input and target (e.g sr in Jy/sr) if present
+    solid_angle_in_orig = is_unit_per_solid_angle(original_unit, return_unit=True)
+    solid_angle_in_targ = is_unit_per_solid_angle(target_unit, return_unit=True)
+    return _ConversionPlan('equivalencies', original_unit, target_unit,
+                           solid_angle_in_orig=solid_angle_in_orig,
+                           solid_angle_in_targ=solid_angle_in_targ)
+
+
 def flux_unit_conversion(values, original_unit, target_unit,
                          equivalencies=None, with_unit=True):
     """
@@ -516,30 +579,25 @@ def flux_unit_conversion(values, original_unit, target_unit,
             return values
         return values * u.Unit(original_unit)
 
-    # convert to Unit object (if not already, which is handled in when casting)
-    original_unit = u.Unit(original_unit)
-    target_unit = u.Unit(target_unit)
+    plan = _flux_conversion_plan(original_unit, target_unit)
+    original_unit, target_unit = plan.original_unit, plan.target_unit
 
-    # get solid angle component of input and target (e.g sr in Jy/sr) if present
-    solid_angle_in_orig = is_unit_per_solid_angle(
-        original_unit, return_unit=True)
-    solid_angle_in_targ = is_unit_per_solid_angle(
-        target_unit, return_unit=True)
-
-    # if the units being converted are likely from a moment map, skip conversion
-    # (which will fail anyway) without erroring and just return input (with or
-    # without units attached, as requested)
-    if unit_is_from_moment_map(original_unit):
+    if plan.kind == 'skip':
+        # units are likely from a moment map or either unit is pixel / dimensionless
+        # (to support mixed-unit viewing): do not attempt to convert
         if with_unit:
             return values * original_unit
         return values
 
-    # do not attempt to convert if either unit is pixel / dimensionless,
-    # to support mixed-unit viewing. If the units are the same, just return values
-    if not np.all([is_physical_flux_unit(x) for x in (original_unit, target_unit)]):
+    if plan.kind == 'scale':
+        # units are directly convertible, no need for any equivalencies
+        converted_values = np.multiply(values, plan.scale)
         if with_unit:
-            return values * original_unit
-        return values
+            return converted_values * target_unit
+        return converted_values
+
+    solid_angle_in_orig = plan.solid_angle_in_orig
+    solid_angle_in_targ = plan.solid_angle_in_targ
 
     with u.set_enabled_equivalencies(equivalencies):
         # first possible case we want to catch before trying to translate: both
@@ -552,11 +610,20 @@ def flux_unit_conversion(values, original_unit, target_unit,
             converted_values = converted_values / PIX2  # re-apply pix2 unit
 
         else:
-            try:
-                # if units can be converted straight away with provided
-                # equivalencies, return converted values
-                converted_values = (values * original_unit).to(target_unit)
-            except u.UnitConversionError:
+            # whether the units can be converted straight away only depends on which
+            # units the equivalencies are between (not on the values they are defined for),
+            # so remember which route works for the set of equivalencies
+            route_key = tuple((eqv[0], eqv[1]) for eqv in equivalencies or [])
+            direct = plan.direct_routes.get(route_key, True)
+            converted_values = None
+            if direct:
+                try:
+                    # if units can be converted straight away with provided
+                    # equivalencies, return converted values
+                    converted_values = (values * original_unit).to(target_unit)
+                except u.UnitConversionError:
+                    pass
+            if converted_values is None:
                 # the only other case where units with the correct equivs wouldn't
                 # convert directly is if one unit is a flux and one is a sb and
                 # they also require an additional equivalency
@@ -564,6 +631,7 @@ def flux_unit_conversion(values, original_unit, target_unit,
                     cv = (values * original_unit * (solid_angle_in_orig or 1))
                     cv = cv.to(target_unit * (solid_angle_in_targ or 1))
                     converted_values = (cv / (solid_angle_in_orig or 1)).to(target_unit)
+                    plan.direct_routes[route_key] = False
                 else:
                     # for all other cases (not including moment map units, which
                     # were excluded above before attempting to convert), raise
@@ -643,23 +711,45 @@ def spectral_unit_conversion(values, original_units, target_units, with_unit=Fal
         pixel and world coordinates (to support mixed-unit viewing).
     """
 
+    plan = _spectral_conversion_plan(original_units, target_units)
+
+    if plan.kind == 'skip':
+        if with_unit:
+            return values * plan.original_unit
+        return values
+    elif plan.kind == 'scale':
+        converted_values = np.multiply(values, plan.scale)
+    else:
+        if not np.isscalar(values):
+            values = np.asanyarray(values)
+        converted_values = plan.original_unit.to(plan.target_unit, values,
+                                                 equivalencies=_SPECTRAL_EQUIVALENCIES)
+
+    if with_unit:
+        converted_values = converted_values * plan.target_unit
+
+    return converted_values
+
+
+_SPECTRAL_EQUIVALENCIES = u.spectral() + u.pixel_scale(1*u.pix)
+
+
+@lru_cache(maxsize=1024)
+def _spectral_conversion_plan(original_units, target_units):
     orig = u.Unit(original_units)
     targ = u.Unit(target_units)
 
     # do not attempt to convert if either unit is pixel / dimensionless,
     # to support mixed-unit viewing. If the units are the same, just return values
     if not np.all([is_physical_spectral_unit(x) for x in (orig, targ)]) and orig != targ:
-        if with_unit:
-            return values * orig
-        return values
-
-    eqv = u.spectral() + u.pixel_scale(1*u.pix)
-    converted_values = (values * orig).to_value(targ, equivalencies=eqv)
+        return _ConversionPlan('skip', orig, targ)
 
-    if with_unit:
-        converted_values = converted_values * targ
+    scale = _direct_scale(orig, targ)
+    if scale is not None:
+        return _ConversionPlan('scale', orig, targ, scale=scale)
 
-    return converted_values
+    # non-linear conversion (e.g. wavelength to frequency)
+    return _ConversionPlan('equivalencies', orig, targ)
 
 
 def supported_sq_angle_units(as_strings=False):
@@ -877,6 +967,45 @@ def spectrum_ensure_flux_density_unit(spectrum):
         return NotImplementedError(f"Cannot convert from {spectrum.flux.unit} to flux density")
 
 
+def _scale_to_unit(values, original_unit, target_unit, equivalencies=None):
+    # values converted from original_unit to target_unit, or values itself (rather than
+    # a copy) if the conversion only relabels the unit
+    scale = original_unit.to(target_unit, equivalencies=equivalencies)
+    if np.isclose(scale, 1, rtol=1e-12, atol=0):
+        return values
+    return values * scale
+
+
+def _spectrum_with_flux_unit(spectrum, unit, equivalencies=None):
+    """
+    Return a copy of ``spectrum`` with the flux (and uncertainty) in ``unit``.
+
+    Unlike `specutils.Spectrum.with_flux_unit`, this does not deep-copy the spectrum:
+    the returned spectrum shares its mask, WCS, and spectral axis with ``spectrum``, and
+    also its flux and uncertainty arrays if converting only relabels the unit (e.g.
+    MJy to MJy / pix2).  Otherwise each array is converted exactly once.  The conversion
+    must be a constant scale factor (i.e. ``equivalencies`` cannot depend on the
+    spectral axis).
+    """
+    unit = u.Unit(unit)
+    new_spec = copy(spectrum)
+    new_spec.meta = dict(spectrum.meta)
+    new_spec.data = _scale_to_unit(spectrum.data, spectrum.unit, unit, equivalencies)
+    # there is no public setter for the unit, this matches Spectrum._convert_flux
+    new_spec._unit = unit
+
+    uncertainty = spectrum.uncertainty
+    new_spec.uncertainty = None
+    if uncertainty is not None:
+        if not isinstance(uncertainty, StdDevUncertainty):
+            uncertainty = uncertainty.represent_as(StdDevUncertainty)
+        unc_unit = uncertainty.unit if uncertainty.unit is not None else spectrum.unit
+        new_spec.uncertainty = StdDevUncertainty(
+            _scale_to_unit(uncertainty.array, unc_unit, unit, equivalencies),
+            unit=unit, copy=False)
+    return new_spec
+
+
 def coerce_unit(quantity):
     """
     coerce the unit on a quantity to have a single length unit (will take the first length
@@ -192,22 +192,7 @@ class BlackBody(Fittable1DModel):
         ZeroDivisionError
             Wavelength is zero (when converting to frequency).
         """
-        if not isinstance(temperature, u.Quantity):
-            in_temp = u.Quantity(temperature, u.K)
-        else:
-            in_temp = temperature
-
-        if not isinstance(x, u.Quantity):
-            # then we assume it has input_units which depends on the
-            # requested output units (either Hz or AA)
-            in_x = u.Quantity(x, self.input_units['x'])
-        else:
-            in_x = x
-
-        # Convert to units for calculations, also force double precision
-        with u.add_enabled_equivalencies(u.spectral() + u.temperature()):
-            freq = u.Quantity(in_x, u.Hz, dtype=np.float64)
-            temp = u.Quantity(in_temp, u.K)
+        freq, temp = self._frequency_and_temperature(x, temperature)
 
         # Check if input values are physically possible
         if np.any(temp < 0):
@@ -253,6 +238,51 @@ class BlackBody(Fittable1DModel):
             return y
         return y.value
 
+    def fit_deriv(self, x, temperature, scale):
+        """
+        Partial derivatives of the model with respect to ``temperature`` and ``scale``,
+        used by the fitters instead of estimating the Jacobian numerically.
+
+        As during fitting, the inputs and parameters are expected without units (see
+        `evaluate`), with the derivatives returned in ``output_units``.
+        """
+        freq, temp = self._frequency_and_temperature(x, temperature)
+        log_boltz = (const.h * freq / (const.k_B * temp)).to_value(u.dimensionless_unscaled)
+
+        # the model is linear in scale, so the derivative with respect to scale is the
+        # model evaluated with a scale of one
+        d_scale = self.evaluate(x, temperature, np.ones_like(scale))
+        d_scale = getattr(d_scale, 'value', d_scale)
+
+        # d(ln B_nu)/dT = (h nu / k T^2) exp(h nu / k T) / (exp(h nu / k T) - 1), written
+        # so that it does not overflow for large h nu / k T
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dlnb_dtemp = -log_boltz / np.expm1(-log_boltz) / temp.to_value(u.K)
+        d_temperature = scale * d_scale * dlnb_dtemp
+
+        return [d_temperature, d_scale]
+
+    def _frequency_and_temperature(self, x, temperature):
+        # inputs and parameters as double precision quantities in Hz and K
+        if not isinstance(temperature, u.Quantity):
+            in_temp = u.Quantity(temperature, u.K)
+        else:
+            in_temp = temperature
+
+        if not isinstance(x, u.Quantity):
+            # then we assume it has input_units which depends on the
+            # requested output units (either Hz or AA)
+            in_x = u.Quantity(x, self.input_units['x'])
+        else:
+            in_x = x
+
+        # Convert to units for calculations, also force double precision
+        with u.add_enabled_equivalencies(u.spectral() + u.temperature()):
+            freq = u.Quantity(in_x, u.Hz, dtype=np.float64)
+            temp = u.Quantity(in_temp, u.K)
+
+        return freq, temp
+
     @property
     def output_units(self):
         if self._output_units is None:
@@ -8,6 +8,7 @@ import ipyvue
 
 import jdaviz
 from jdaviz.app import custom_components
+from jdaviz.core.loaders.preload import load_files
 
 config = None
 data_list = []
@@ -53,9 +54,7 @@ def get_app_or_launcher():
             if not len(data_list):
                 jdaviz.loaders['file'].open_in_tray()
             else:
-                with jdaviz.batch_load():
-                    for filename, format in zip(data_list, format_list):
-                        jdaviz.load(filename, format=format)
+                load_files(viz, data_list[:len(format_list)], format_list)
         else:
             from jdaviz.core.launcher import Launcher
             launcher = Launcher(height='100vh',
@@ -65,12 +64,13 @@ def get_app_or_launcher():
     else:
         viz = getattr(jdaviz.configs, config)(verbosity=jdaviz_verbosity,
                                               history_verbosity=jdaviz_history_verbosity)
-        with jdaviz.batch_load():
-            for filename, format in zip(data_list, format_list):
-                if config == 'Mosviz':
+        if config == 'Mosviz':
+            with jdaviz.batch_load():
+                for filename, format in zip(data_list, format_list):
                     viz.load(directory=filename, format=format, **load_data_kwargs)
-                else:
-                    viz.load(filename, format=format, **load_data_kwargs)
+        else:
+            # files are read concurrently, but added to the app in order
+            load_files(viz, data_list[:len(format_list)], format_list, **load_data_kwargs)
 
     return viz._app
 
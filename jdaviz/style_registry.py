@@ -6,8 +6,6 @@ from traitlets import Any, Dict, Instance, default
 from ipywidgets import widget_serialization
 from ipyvuetify import VuetifyTemplate
 
-from jdaviz.core.style_widget import StyleWidget
-
 
 T = t.TypeVar("T")
 _style_paths: t.Dict[int, Path] = {}
@@ -88,6 +86,8 @@ class PopoutStyleWrapper(VuetifyTemplate):
 
 @_singleton
 def get_style_registry():
+    # importing jdaviz.core imports the configurations, which in turn import this module
+    from jdaviz.core.style_widget import StyleWidget
     return StyleRegistry(
         style_widgets={key: StyleWidget(path) for key, path in _style_paths.items()}
     )
@@ -598,3 +598,215 @@ def test_add_custom_loader_open_in_tray(deconfigged_helper, tmp_path):
 
     # The loader should be returned and the name should match
     assert repr(loader) == '<test API>'
+
+
+def test_live_plugin_results_scheduling(deconfigged_helper, spectrum1d_cube_largest,
+                                        monkeypatch):
+    from glue.core.message import SubsetUpdateMessage
+    from glue.core.roi import CircularROI
+    import jdaviz.app
+
+    app = deconfigged_helper._app
+    deconfigged_helper.load(spectrum1d_cube_largest)
+    subset_plg = deconfigged_helper.plugins['Subset Tools']
+    subset_plg.import_region(CircularROI(xc=5, yc=5, radius=2))
+
+    extract_plg = deconfigged_helper.plugins['3D Spectral Extraction']
+    extract_plg.aperture = 'Subset 1'
+    extract_plg.add_results.label = 'extracted'
+    extract_plg.add_results._obj.auto_update_result = True
+    extract_plg.extract()
+
+    # simulate the kernel's event loop so that queued updates only run when requested
+    class FakeIOLoop:
+        def __init__(self):
+            self.callbacks = []
+
+        def call_soon_threadsafe(self, callback):
+            callback()
+
+        def call_later(self, delay, callback):
+            self.callbacks.append(callback)
+
+        def run(self):
+            callbacks, self.callbacks = self.callbacks, []
+            for callback in callbacks:
+                callback()
+
+    ioloop = FakeIOLoop()
+    monkeypatch.setattr(jdaviz.app, 'get_ioloop', lambda: ioloop)
+
+    n_updates = []
+    update_result = app._update_live_plugin_result
+    monkeypatch.setattr(app, '_update_live_plugin_result',
+                        lambda *args: n_updates.append(args[0].label) or update_result(*args))
+
+    # drag the subset: nothing is recomputed during the drag, and only once afterwards
+    for radius in np.linspace(2, 3, 5):
+        subset_plg.import_region(CircularROI(xc=5, yc=5, radius=radius),
+                                 edit_subset='Subset 1', combination_mode='replace')
+    assert n_updates == []
+    assert len(ioloop.callbacks) >= 5
+    ioloop.run()
+    # each live result (including the automatic extraction of the subset) is updated once
+    assert sorted(n_updates) == ['Spectrum (Subset 1, sum)', 'extracted']
+    # replacing the results queues an update of anything subscribed to them, but
+    # nothing else depends on them
+    ioloop.run()
+    assert len(n_updates) == 2
+
+    # re-broadcasting an unchanged subset does not recompute the result
+    for subset in app.data_collection.subset_groups[0].subsets:
+        app.hub.broadcast(SubsetUpdateMessage(subset, attribute='subset_state'))
+    ioloop.run()
+    assert len(n_updates) == 2
+
+
+def test_live_plugin_results_data_changed_in_place(deconfigged_helper,
+                                                   spectrum1d_cube_largest, monkeypatch):
+    from glue.core.message import NumericalDataChangedMessage
+    from glue.core.roi import CircularROI
+
+    app = deconfigged_helper._app
+    deconfigged_helper.load(spectrum1d_cube_largest)
+    deconfigged_helper.plugins['Subset Tools'].import_region(CircularROI(xc=5, yc=5, radius=2))
+
+    extract_plg = deconfigged_helper.plugins['3D Spectral Extraction']
+    extract_plg.aperture = 'Subset 1'
+    extract_plg.add_results.label = 'extracted'
+    extract_plg.add_results._obj.auto_update_result = True
+    extract_plg.extract()
+    flux = app.data_collection['extracted'].get_object().flux
+
+    n_updates = []
+    update_result = app._update_live_plugin_result
+    monkeypatch.setattr(app, '_update_live_plugin_result',
+                        lambda *args: n_updates.append(args[0].label) or update_result(*args))
+
+    # the cube is the same Data object after its values are changed in place, but the
+    # results depending on it are still recomputed (from the new values)
+    cube = app.data_collection[0]
+    comp = cube.main_components[0]
+    cube.update_components({comp: cube.get_component(comp).data * 2})
+    assert app.data_collection[0] is cube
+    assert 'extracted' in n_updates
+    np.testing.assert_allclose(app.data_collection['extracted'].get_object().flux.value,
+                               flux.value * 2)
+
+    # but not again as long as the values are unchanged
+    n_updates.clear()
+    app._schedule_live_plugin_results(trigger_data_lbl=cube.label)
+    assert n_updates == []
+    app.hub.broadcast(NumericalDataChangedMessage(cube, sender=cube))
+    assert 'extracted' in n_updates
+
+
+def _count_handler_calls(hub, monkeypatch, message_class):
+    # count the invocations of the handlers subscribed to messages of message_class
+    calls = []
+    find_handlers = hub._find_handlers
+
+    def counting_find_handlers(message):
+        for subscriber, handler in find_handlers(message):
+            if isinstance(message, message_class):
+                calls.append(message)
+            yield subscriber, handler
+
+    monkeypatch.setattr(hub, '_find_handlers', counting_find_handlers)
+    return calls
+
+
+def test_batch_messages(specviz_helper, monkeypatch):
+    from glue.core.hub import HubListener
+    from jdaviz.core.events import GlobalDisplayUnitChanged, SnackbarMessage
+
+    app = specviz_helper._app
+    listener = HubListener()
+    received = []
+    for message_class in (GlobalDisplayUnitChanged, SnackbarMessage):
+        app.hub.subscribe(listener, message_class, handler=received.append)
+    n_handlers = len([handler for handler in app.hub._find_handlers(
+        GlobalDisplayUnitChanged('flux', 'Jy', sender=app))])
+    unit_calls = _count_handler_calls(app.hub, monkeypatch, GlobalDisplayUnitChanged)
+
+    with app.batch_messages():
+        with app.batch_messages():
+            for unit in ('Jy', 'mJy', 'MJy'):
+                app.hub.broadcast(GlobalDisplayUnitChanged('flux', unit, sender=app))
+            app.hub.broadcast(GlobalDisplayUnitChanged('spectral', 'um', sender=app))
+            # other messages are delivered immediately
+            app.hub.broadcast(SnackbarMessage('not coalesced', sender=app))
+        assert [type(msg) for msg in received] == [SnackbarMessage]
+        assert unit_calls == []
+    # the last message of each axis is delivered once, when the outer block exits
+    assert [(msg.axis, msg.unit) for msg in received[1:]] == [
+        ('flux', u.MJy), ('spectral', u.um)]
+    # so each handler is called once per axis rather than once per message
+    assert len(unit_calls) == 2 * n_handlers
+    assert 'broadcast' not in app.hub.__dict__
+
+
+def test_batch_messages_deleted_subset(imviz_helper, monkeypatch):
+    from glue.core.message import SubsetUpdateMessage
+    from glue.core.roi import CircularROI
+
+    app = imviz_helper._app
+    imviz_helper.load(np.random.rand(10, 10), data_label='image')
+    subset_plg = imviz_helper.plugins['Subset Tools']
+    subset_plg.import_region(CircularROI(xc=5, yc=5, radius=2))
+    update_calls = _count_handler_calls(app.hub, monkeypatch, SubsetUpdateMessage)
+
+    with app.batch_messages():
+        subset_plg.import_region(CircularROI(xc=5, yc=5, radius=3),
+                                 edit_subset='Subset 1', combination_mode='replace')
+        app.data_collection.remove_subset_group(app.data_collection.subset_groups[0])
+        # a new subset created within the batch is updated independently
+        subset_plg.import_region(CircularROI(xc=4, yc=4, radius=2))
+        new_subsets = app.data_collection.subset_groups[0].subsets
+    assert len(app.data_collection.subset_groups) == 1
+
+    # the handlers are not called with updates of the subset deleted within the batch
+    assert len(update_calls) > 0
+    assert all(any(msg.subset is subset for subset in new_subsets) for msg in update_calls)
+
+
+def test_batch_load_messages(imviz_helper):
+    from glue.core.hub import HubListener
+    from jdaviz.core.events import ViewerVisibleLayersChangedMessage
+
+    listener = HubListener()
+    received = []
+    imviz_helper._app.hub.subscribe(listener, ViewerVisibleLayersChangedMessage,
+                                    handler=received.append)
+
+    # each viewer reports its visible layers once per batch load, not once per data
+    with imviz_helper.batch_load():
+        for i in range(5):
+            imviz_helper.load(np.random.rand(8, 8), data_label=f'data_{i}')
+    assert len(received) == 1
+    assert len(imviz_helper._app.get_viewer('imviz-0').data()) == 5
+
+
+def test_live_plugin_results_inputs_pruned(deconfigged_helper, spectrum1d_cube_largest):
+    from glue.core.roi import CircularROI
+
+    app = deconfigged_helper._app
+    deconfigged_helper.load(spectrum1d_cube_largest)
+    deconfigged_helper.plugins['Subset Tools'].import_region(CircularROI(xc=5, yc=5, radius=2))
+
+    extract_plg = deconfigged_helper.plugins['3D Spectral Extraction']
+    extract_plg.aperture = 'Subset 1'
+    extract_plg.add_results.label = 'extracted'
+    extract_plg.add_results._obj.auto_update_result = True
+    extract_plg.extract()
+    extracted = app.data_collection['extracted']
+    app._update_live_plugin_result(extracted, extracted.meta['_update_live_plugin_results'])
+    assert 'extracted' in app._live_results_inputs
+
+    # removing the results (and the data they depend on) drops the stored inputs, which
+    # would otherwise keep the removed data in memory
+    cube = app.data_collection[0]
+    app.data_collection.remove(cube)
+    assert not any(inp is cube for inputs in app._live_results_inputs.values()
+                   for inp in inputs)
+    assert 'extracted' not in app._live_results_inputs
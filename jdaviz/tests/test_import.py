@@ -0,0 +1,40 @@
+import json
+import subprocess
+import sys
+
+import jdaviz
+
+# packages that are only needed once an app is created (importing any of them takes
+# seconds and thousands of modules), and so should not be imported by importing jdaviz
+HEAVY_MODULES = ('glue', 'glue_jupyter', 'glue_astronomy', 'bqplot', 'solara',
+                 'specutils', 'specreduce', 'photutils', 'regions', 'astroquery',
+                 'astropy.modeling', 'scipy', 'matplotlib')
+
+_script = """
+import json, sys
+import jdaviz
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def test_import_is_lazy():
+    out = subprocess.run([sys.executable, '-c', _script], check=True,
+                         capture_output=True, text=True).stdout
+    modules = json.loads(out.strip().splitlines()[-1])
+
+    # no configuration (nor their plugins, viewers, or loaders) should be imported
+    assert [m for m in modules if m.startswith('jdaviz')
+            and m not in ('jdaviz', 'jdaviz.version')] == []
+    assert [m for m in modules
+            if any(m == heavy or m.startswith(f'{heavy}.') for heavy in HEAVY_MODULES)] == []
+
+
+def test_lazy_top_level_api():
+    from jdaviz.configs.imviz import Imviz
+    from jdaviz.configs.deconfigged import App
+    from jdaviz.core.launcher import open
+
+    assert jdaviz.Imviz is Imviz
+    assert jdaviz.App is App
+    assert jdaviz.open is open
+    assert set(jdaviz.__all__).issubset(dir(jdaviz))
@@ -9,7 +9,9 @@ from astropy import units as u
 from astropy.coordinates import SkyCoord
 from astropy.nddata import NDData
 
+from jdaviz.core.events import LinkUpdatedMessage, TableSelectRowClickMessage
 from jdaviz.core.marks import PluginScatter, TableSelectionMark
+from jdaviz.core.tools import _get_skycoords_from_table
 
 
 class TestTableViewerTools:
@@ -266,6 +268,31 @@ class TestTableViewerTools:
 
         table_toolbar.restore_tools()
 
+    def test_select_table_row_click_toggles_nearest_row(self):
+        """Test that clicking in the image viewer toggles the nearest row (using a cached index)."""
+        sc = _get_skycoords_from_table(self.table_viewer.layers[0].layer)
+        xs, ys = self.wcs.world_to_pixel(sc)
+
+        def click(x, y):
+            self.table_viewer.hub.broadcast(TableSelectRowClickMessage(
+                x, y, self.table_viewer.reference_id, sender=self))
+
+        click(xs[2] + 0.1, ys[2] - 0.1)
+        assert self.table_viewer.widget_table.checked == [2]
+        assert len(self.table_viewer._click_index_cache) == 1
+        index = list(self.table_viewer._click_index_cache.values())[0]
+
+        # a second click re-uses the cached projection and toggles the row back off
+        click(xs[2], ys[2])
+        assert self.table_viewer.widget_table.checked == []
+        assert list(self.table_viewer._click_index_cache.values())[0] is index
+
+        # changing the linking invalidates the cache
+        self.table_viewer.hub.broadcast(LinkUpdatedMessage('wcs', False, True, sender=self))
+        assert len(self.table_viewer._click_index_cache) == 0
+        click(xs[0], ys[0])
+        assert self.table_viewer.widget_table.checked == [0]
+
     def test_toolbar_titles_match(self):
         """Test that table and image viewer toolbar titles match."""
         table_toolbar = self.table_viewer.toolbar
@@ -1,3 +1,4 @@
+import gc
 import os
 import warnings
 import numpy as np
@@ -7,6 +8,7 @@ import ipywidgets.widgets.widget as _widget_mod
 from comm import DummyComm
 
 import pytest
+import jdaviz.utils
 from astropy.io import fits
 from astropy.units.quantity import Quantity
 
@@ -15,9 +17,9 @@ from jdaviz.core.loaders import SpectrumImporter
 from jdaviz.utils import (alpha_index, download_uri_to_path,
                           get_cloud_fits, get_cloud_asdf, cached_uri, escape_brackets,
                           has_wildcard, wildcard_match, _clean_data_for_hash,
-                          create_data_hash, parallelize_calculation,
+                          create_data_hash, prime_data_hash, parallelize_calculation,
                           in_ra_comps, in_dec_comps,
-                          suppress_widget_comms)
+                          suppress_widget_comms, _decimate_profile, _ImageProfileCache)
 
 
 @pytest.mark.parametrize("test_input,expected", [(0, 'a'), (1, 'b'), (25, 'z'), (26, 'aa'),
@@ -466,6 +468,95 @@ def test_create_data_hash_none():
     assert create_data_hash(np.array([None, None, None])) is None
 
 
+def test_prime_data_hash(monkeypatch):
+    arr = np.arange(12.).reshape((3, 4))
+    data_hash = prime_data_hash(arr)
+    assert data_hash == create_data_hash(arr.copy())
+
+    def no_hashing(*args):
+        raise AssertionError('primed data should not be hashed again')
+
+    monkeypatch.setattr('jdaviz.utils._hash_cleaned_data', no_hashing)
+    assert create_data_hash(arr) == data_hash
+    with pytest.raises(AssertionError, match='primed'):
+        create_data_hash(arr.copy())
+
+    # forgotten once the array no longer exists
+    key = id(arr)
+    del arr
+    assert key not in jdaviz.utils._primed_data_hashes
+
+
+def test_create_data_hash_sampled(tmp_path, monkeypatch):
+    monkeypatch.setattr('jdaviz.utils.HASH_SAMPLE_MIN_SIZE', 2**16)
+    monkeypatch.setattr('jdaviz.utils.HASH_SAMPLE_BLOCK_SIZE', 2**8)
+    hash_cleaned_data = jdaviz.utils._hash_cleaned_data
+    n_exact = []
+
+    def count_exact(*args):
+        n_exact.append(args)
+        return hash_cleaned_data(*args)
+
+    monkeypatch.setattr('jdaviz.utils._hash_cleaned_data', count_exact)
+
+    arr = np.arange(2.**16)
+    data_hash = create_data_hash(arr)
+    assert create_data_hash(arr) == data_hash
+    assert len(n_exact) == 0
+    exact_hash = create_data_hash(arr, strategy='exact')
+    assert exact_hash != data_hash
+    assert len(n_exact) == 1
+
+    # the same data in another array share the fingerprint, confirmed in full
+    filename = tmp_path / 'arr.npy'
+    np.save(filename, arr)
+    assert create_data_hash(np.load(filename, mmap_mode='r')) == data_hash
+    assert len(n_exact) == 3
+
+    # different data outside of the sampled blocks do not
+    other = arr.copy()
+    other[500] = -1
+    other_hash = create_data_hash(other)
+    assert other_hash not in (data_hash, None)
+    assert create_data_hash(other) == other_hash
+    assert len(n_exact) == 4
+
+    assert create_data_hash(np.zeros(2**16)) is None
+    # arrays which are zero in all the sampled blocks (e.g. DQ arrays) are hashed in full
+    mostly_zero = np.zeros(2**16)
+    mostly_zero[500] = 1
+    assert create_data_hash(mostly_zero) == create_data_hash(mostly_zero, strategy='exact')
+    assert create_data_hash(mostly_zero) is not None
+
+    # the sources of data that no longer exist are dropped once new data are fingerprinted
+    def hashes_with_sources():
+        return {source.data_hash for sources in jdaviz.utils._fingerprint_sources.values()
+                for source in sources}
+    assert other_hash in hashes_with_sources()
+    n_exact.clear()  # holds references to the hashed arrays
+    del other
+    new = np.arange(2.**16) + 1
+    create_data_hash(new)
+    assert other_hash not in hashes_with_sources()
+    assert all(source.alive for sources in jdaviz.utils._fingerprint_sources.values()
+               for source in sources)
+
+    # once the data a fingerprint was returned for are gone, different data with the same
+    # fingerprint are given their exact hash rather than being mistaken for them
+    first = np.arange(2.**16) + 2
+    first_hash = create_data_hash(first)
+    del first
+    gc.collect()
+    second = np.arange(2.**16) + 2
+    second[500] = -1
+    second_hash = create_data_hash(second)
+    assert second_hash not in (first_hash, None)
+    assert second_hash == create_data_hash(second, strategy='exact')
+
+    with pytest.raises(ValueError, match='strategy must be one of'):
+        create_data_hash(arr, strategy='fast')
+
+
 def test_coord_column():
     """Test regex for in_ra_comps and in_dec_comps utilities"""
 
@@ -517,3 +608,39 @@ class TestSuppressWidgetComms:
                 raise ValueError("boom")
         assert _widget_mod.comm.create_comm() is self.sentinel
         assert not isinstance(_widget_mod.comm.create_comm(), DummyComm)
+
+
+def test_image_profile_cache():
+    arr = np.arange(20.).reshape(4, 5)
+    arr[1, 2] = np.nan
+    cache = _ImageProfileCache()
+
+    column = cache.column(arr, arr, 2)
+    np.testing.assert_array_equal(column, arr[:, 2])
+    assert column.flags['C_CONTIGUOUS']
+    np.testing.assert_array_equal(cache.row(arr, arr, 3), arr[3])
+    assert cache.column(arr, arr, 2).base is column.base
+
+    assert cache.column_range(arr, arr, 2) == (2, 17)
+    assert cache.column_range(arr, arr, 2, 1, 3) == (12, 12)
+    assert cache.row_range(arr, arr, 0, 3) == (3, 4)
+
+    # a new array invalidates the cache
+    new_arr = arr * 2
+    np.testing.assert_array_equal(cache.column(new_arr, new_arr, 0), new_arr[:, 0])
+    assert cache.row_range(new_arr, new_arr, 3) == (30, 38)
+
+
+def test_decimate_profile():
+    x = np.arange(10)
+    assert _decimate_profile(x, x, max_points=10) == (x, x)
+
+    y = np.zeros(10000)
+    y[1234] = 5
+    y[5000:5400] = np.nan
+    dec_x, dec_y = _decimate_profile(np.arange(10000), y, max_points=100)
+    assert len(dec_x) == len(dec_y) == 100
+    assert np.all(np.diff(dec_x) >= 0)
+    # narrow features and gaps spanning a full bin are preserved
+    assert np.nanmax(dec_y) == 5
+    assert np.any(np.isnan(dec_y))
@@ -3,6 +3,7 @@ import os
 import time
 import threading
 import warnings
+import weakref
 from collections import deque
 from comm import DummyComm
 from contextlib import contextmanager
@@ -50,7 +51,7 @@ __all__ = ['SnackbarQueue', 'enable_hot_reloading', 'bqplot_clear_figure',
            'get_wcs_only_layer_labels', 'get_top_layer_index',
            'get_reference_image_data', 'standardize_roman_metadata',
            'wildcard_match', 'cmap_samples', 'glue_colormaps',
-           'att_to_componentid', 'create_data_hash',
+           'att_to_componentid', 'create_data_hash', 'prime_data_hash',
            'in_ra_comps', 'in_dec_comps', 'SPECTRAL_AXIS_COMP_LABELS',
            'hst_obstype', 'suppress_widget_comms']
 
@@ -1231,7 +1232,8 @@ def _clean_data_for_hash(data):
     new_data = data
     if hasattr(data, 'flux'):
         new_data = data.flux
-    elif hasattr(data, 'data'):
+    elif hasattr(data, 'data') and not isinstance(data.data, memoryview):
+        # (the data of an array is its buffer)
         new_data = data.data
 
     unit_str = getattr(data, 'unit', None) or getattr(new_data, 'unit', None)
@@ -1239,10 +1241,15 @@ def _clean_data_for_hash(data):
 
     data_mask = getattr(data, 'mask', None)
     data_mask = data_mask if data_mask is not None else getattr(new_data, 'mask', None)
-    try:
-        mask_arr = np.ascontiguousarray(data_mask).astype('uint8') if data_mask is not None else None  # noqa
-    except TypeError:
-        mask_arr = None
+    mask_arr = None
+    if data_mask is not None:
+        try:
+            mask_arr = np.ascontiguousarray(data_mask)
+            # a boolean mask has the same bytes as uint8, without copying it
+            mask_arr = (mask_arr.view('uint8') if mask_arr.dtype == bool
+                        else mask_arr.astype('uint8'))
+        except TypeError:
+            mask_arr = None
 
     try:
         arr = np.ascontiguousarray(new_data)
@@ -1252,7 +1259,18 @@ def _clean_data_for_hash(data):
     return arr, mask_arr, unit_str
 
 
-def create_data_hash(input_data):
+DATA_HASH_STRATEGIES = ('sampled', 'exact')
+# Strategy used by create_data_hash by default.  Set to 'exact' to always hash all the
+# data (before loading any data, as hashes from different strategies do not match).
+DATA_HASH_STRATEGY = 'sampled'
+# With the 'sampled' strategy, arrays larger than this (in bytes) are fingerprinted
+# from HASH_SAMPLE_N_BLOCKS evenly spaced blocks of HASH_SAMPLE_BLOCK_SIZE bytes each.
+HASH_SAMPLE_MIN_SIZE = 2**24
+HASH_SAMPLE_N_BLOCKS = 64
+HASH_SAMPLE_BLOCK_SIZE = 2**16
+
+
+def create_data_hash(input_data, strategy=None):
     """
     Create and return a deterministic hash for the provided data.
     The function supports various input types including numpy arrays,
@@ -1260,12 +1278,26 @@ def create_data_hash(input_data):
     is `None` or of an unsupported type (e.g., a plain number), the function
     returns `None`.
 
+    With the 'sampled' strategy (the default, see ``DATA_HASH_STRATEGY``), large
+    arrays are only fingerprinted from their shape, dtype, unit and evenly spaced
+    blocks of their data, which only reads a small part of e.g. a memory-mapped
+    file.  Different data with the same fingerprint are told apart by hashing both
+    in full, which is done only when a fingerprint is shared by different arrays
+    Once the data a fingerprint was returned for no longer exist, other data with the
+    same fingerprint are given their exact hash instead, so they are never mistaken for
+    the data which were fingerprinted (e.g. by the ``_data_hash`` of an entry in the
+    data collection).  Changes to an array in place outside of the sampled blocks are
+    not detected.
+
     Parameters
     ----------
     input_data : array-like, str, `astropy.units.Quantity`, `specutils.Spectrum1D`, or None
         The data to hash. If a list or tuple, it may contain arrays or strings.
         If `astropy.units.Quantity`, the unit is included in the hash.
         If `None`, the function returns `None`.
+    strategy : {'sampled', 'exact'} or `None`, optional
+        Whether large arrays are fingerprinted ('sampled') or all the data is hashed
+        ('exact').  Defaults to ``DATA_HASH_STRATEGY``.
 
     Returns
     -------
@@ -1274,9 +1306,220 @@ def create_data_hash(input_data):
         or `None` if 'input_data' is `None` or of an unsupported type
         (e.g., a plain number).
     """
+    strategy = _validate_data_hash_strategy(strategy)
+    primed_hash = _get_primed_data_hash(input_data, strategy)
+    if primed_hash is not None:
+        return primed_hash
+    arr, mask_arr, unit_str = _clean_data_for_hash(input_data)
+    if mask_arr is None and unit_str is None:
+        # e.g. the data of a FITS HDU
+        primed_hash = _get_primed_data_hash(arr, strategy)
+        if primed_hash is not None:
+            return primed_hash
+    return _compute_data_hash(arr, mask_arr, unit_str, strategy)
+
+
+def _validate_data_hash_strategy(strategy):
+    strategy = DATA_HASH_STRATEGY if strategy is None else strategy
+    if strategy not in DATA_HASH_STRATEGIES:
+        raise ValueError(f"strategy must be one of {DATA_HASH_STRATEGIES}, not '{strategy}'")
+    return strategy
+
+
+def _compute_data_hash(arr, mask_arr, unit_str, strategy):
+    if (strategy == 'sampled' and isinstance(arr, np.ndarray)
+            and arr.nbytes > HASH_SAMPLE_MIN_SIZE and not arr.dtype.hasobject
+            and arr.dtype.names is None):
+        return _fingerprint_cleaned_data(arr, mask_arr, unit_str)
+    return _hash_cleaned_data(arr, mask_arr, unit_str)
+
+
+# hashes of arrays computed ahead of time by prime_data_hash, by id of the array
+_primed_data_hashes = {}
+
+
+def _get_primed_data_hash(obj, strategy):
+    primed = _primed_data_hashes.get(id(obj))
+    if primed is not None and primed[0]() is obj and primed[2] == strategy:
+        return primed[1]
+    return None
+
+
+def prime_data_hash(input_data, strategy=None):
+    """
+    Compute the hash of ``input_data`` (see `create_data_hash`) ahead of time.
+
+    For arrays without a mask or unit, the hash is remembered for as long as the
+    array exists, so that `create_data_hash` returns it without hashing the same array
+    (or e.g. a FITS HDU with it as data) again.  The array must therefore not be
+    modified in place afterwards.
+
+    Parameters
+    ----------
+    input_data : array-like, `astropy.units.Quantity`, `specutils.Spectrum1D`, or None
+        The data to hash.
+    strategy : {'sampled', 'exact'} or `None`, optional
+        See `create_data_hash`.
+
+    Returns
+    -------
+    str or None
+        The hash, as returned by `create_data_hash`.
+    """
+    strategy = _validate_data_hash_strategy(strategy)
+    arr, mask_arr, unit_str = _clean_data_for_hash(input_data)
+    data_hash = _compute_data_hash(arr, mask_arr, unit_str, strategy)
+    if (mask_arr is None and unit_str is None and isinstance(input_data, np.ndarray)
+            and _get_primed_data_hash(input_data, strategy) is None):
+        key = id(input_data)
+        _primed_data_hashes[key] = (weakref.ref(input_data), data_hash, strategy)
+        weakref.finalize(input_data, _primed_data_hashes.pop, key, None)
+    return data_hash
+
+
+class _WeakArrayRef:
+    """
+    Weak reference to an array, through the array owning its memory, so that it
+    stays valid for as long as any view of the same memory exists.
+    """
+    def __init__(self, arr):
+        root = self._root(arr)
+        self._ref = weakref.ref(root)
+        self._layout = (arr.shape, arr.dtype, arr.strides,
+                        arr.__array_interface__['data'][0]
+                        - root.__array_interface__['data'][0])
+
+    @staticmethod
+    def _root(arr):
+        while isinstance(arr.base, np.ndarray):
+            arr = arr.base
+        return arr
+
+    def refers_to(self, arr):
+        other = _WeakArrayRef(arr)
+        return other._ref() is self._ref() and other._layout == self._layout
+
+    def __call__(self):
+        root = self._ref()
+        if root is None:
+            return None
+        shape, dtype, strides, offset = self._layout
+        try:
+            return np.ndarray(shape, dtype, buffer=root, offset=offset, strides=strides)
+        except (TypeError, ValueError):
+            # e.g. memory that does not support the buffer protocol
+            return None
+
+
+class _FingerprintSource:
+    """Data a fingerprint was computed for, and the hash returned for it."""
+    def __init__(self, arr, mask_arr, unit_str, data_hash, exact_hash=None):
+        self.arr = _WeakArrayRef(arr)
+        self.mask_arr = _WeakArrayRef(mask_arr) if mask_arr is not None else None
+        self.unit_str = unit_str
+        self.data_hash = data_hash
+        self._exact_hash = exact_hash
+
+    @property
+    def alive(self):
+        return (self.arr._ref() is not None
+                and (self.mask_arr is None or self.mask_arr._ref() is not None))
+
+    def refers_to(self, arr, mask_arr, unit_str):
+        if (mask_arr is None) != (self.mask_arr is None) or unit_str != self.unit_str:
+            return False
+        return self.arr.refers_to(arr) and (mask_arr is None
+                                            or self.mask_arr.refers_to(mask_arr))
+
+    def exact_hash(self):
+        if self._exact_hash is None:
+            arr = self.arr()
+            mask_arr = self.mask_arr() if self.mask_arr is not None else None
+            if arr is None or (self.mask_arr is not None and mask_arr is None):
+                return None
+            self._exact_hash = _hash_cleaned_data(arr, mask_arr, self.unit_str)
+        return self._exact_hash
+
+
+# data each fingerprint returned by create_data_hash was computed for, by fingerprint
+_fingerprint_sources = {}
+# all fingerprints ever returned by create_data_hash, including those of data which no
+# longer exist (and so can no longer be compared with other data in full)
+_returned_fingerprints = set()
+_fingerprint_lock = threading.Lock()
+
+
+def _fingerprint_cleaned_data(arr, mask_arr, unit_str):
+    flat = arr.reshape(-1)
+    block_len = max(HASH_SAMPLE_BLOCK_SIZE // arr.itemsize, 1)
+    starts = np.unique(np.linspace(0, max(flat.size - block_len, 0),
+                                   HASH_SAMPLE_N_BLOCKS).astype(int))
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f'fingerprint;shape:{arr.shape};dtype:{arr.dtype.str}'.encode())
+    if unit_str is not None:
+        hasher.update(f';unit:{unit_str}'.encode())
+    valid = False
+    for start in starts:
+        block = flat[start:start + block_len]
+        hasher.update(memoryview(np.ascontiguousarray(block)).cast('B'))
+        valid = valid or bool(np.any(block))
+    if not valid:
+        # the sampled blocks do not tell sparse (e.g. DQ) arrays apart, so hash them in
+        # full (which, as for any array, gives None if they are entirely zero)
+        return _hash_cleaned_data(arr, mask_arr, unit_str)
+    if mask_arr is not None:
+        hasher.update(b';mask:')
+        flat_mask = mask_arr.reshape(-1)
+        for start in starts:
+            if start < flat_mask.size:
+                hasher.update(memoryview(
+                    np.ascontiguousarray(flat_mask[start:start + block_len])).cast('B'))
+    fingerprint = hasher.hexdigest()
+
+    with _fingerprint_lock:
+        sources = [source for source in _fingerprint_sources.get(fingerprint, [])
+                   if source.alive]
+        for source in sources:
+            if source.refers_to(arr, mask_arr, unit_str):
+                return source.data_hash
+        if fingerprint not in _returned_fingerprints:
+            # the first data with this fingerprint
+            _prune_fingerprint_sources()
+            _fingerprint_sources[fingerprint] = [
+                _FingerprintSource(arr, mask_arr, unit_str, fingerprint)]
+            _returned_fingerprints.add(fingerprint)
+            return fingerprint
+
+    # the fingerprint was already computed for other data: compare them in full with
+    # those that still exist, so that only the same data share the same hash (and use
+    # the exact hash otherwise, as the data it was first returned for may be gone)
+    exact_hash = _hash_cleaned_data(arr, mask_arr, unit_str)
+    data_hash = exact_hash
+    for source in sources:
+        if source.exact_hash() == exact_hash:
+            data_hash = source.data_hash
+            break
+    with _fingerprint_lock:
+        _prune_fingerprint_sources()
+        sources = _fingerprint_sources.setdefault(fingerprint, [])
+        sources.append(_FingerprintSource(arr, mask_arr, unit_str, data_hash, exact_hash))
+    return data_hash
+
+
+def _prune_fingerprint_sources():
+    # drop the sources of data that no longer exist, so that the fingerprints of deleted
+    # data are not kept (must be called with _fingerprint_lock held)
+    for fingerprint, sources in list(_fingerprint_sources.items()):
+        sources = [source for source in sources if source.alive]
+        if sources:
+            _fingerprint_sources[fingerprint] = sources
+        else:
+            del _fingerprint_sources[fingerprint]
+
+
+def _hash_cleaned_data(arr, mask_arr, unit_str):
     # Initialize hasher and include shape/dtype to avoid collisions
     # Use blake2b and shorter digest for speed
-    arr, mask_arr, unit_str = _clean_data_for_hash(input_data)
     try:
         valid_arr_check = np.any(arr)
     except TypeError:
@@ -1384,6 +1627,106 @@ def _hex_for_cmap(cmap):
 cmap_samples = {cmap[1].name: _hex_for_cmap(cmap[1]) for cmap in glue_colormaps.members}
 
 
+# maximum number of points sent to the frontend when plotting a line profile
+MAX_PROFILE_POINTS = 1000
+
+
+class _ImageProfileCache:
+    """
+    Cache of contiguous copies of a 2D image, used to extract row and column
+    profiles without slicing (and, for columns, striding through) the full array
+    on every request, along with the range of the finite values in each row and
+    column.  The cache is invalidated whenever a different ``owner`` object (the
+    array itself, or the object it was retrieved from) is passed.
+    """
+    def __init__(self):
+        self._owner_ref = None
+        self._rows = None
+        self._columns = None
+        self._row_ranges = None
+        self._column_ranges = None
+
+    def clear(self):
+        self.__init__()
+
+    def _update(self, owner, array):
+        if self._owner_ref is not None and self._owner_ref() is owner:
+            return
+        self.clear()
+        self._owner_ref = weakref.ref(owner)
+        self._rows = np.ascontiguousarray(array)
+
+    def _columns_array(self):
+        if self._columns is None:
+            self._columns = np.ascontiguousarray(self._rows.T)
+        return self._columns
+
+    def row(self, owner, array, index):
+        """Return row ``index`` of ``array`` (or of the cached copy of it for ``owner``)."""
+        self._update(owner, array)
+        return self._rows[index]
+
+    def column(self, owner, array, index):
+        """Return column ``index`` of ``array`` (or of the cached copy of it for ``owner``)."""
+        self._update(owner, array)
+        return self._columns_array()[index]
+
+    def row_range(self, owner, array, index, start=None, stop=None):
+        """
+        Return the minimum and maximum finite values in row ``index`` of ``array``,
+        optionally restricted to the columns from ``start`` to ``stop``.
+        """
+        self._update(owner, array)
+        if self._row_ranges is None:
+            self._row_ranges = _nanrange(self._rows, axis=1)
+        return _profile_range(self._rows[index], self._row_ranges[index], start, stop)
+
+    def column_range(self, owner, array, index, start=None, stop=None):
+        """
+        Return the minimum and maximum finite values in column ``index`` of ``array``,
+        optionally restricted to the rows from ``start`` to ``stop``.
+        """
+        self._update(owner, array)
+        if self._column_ranges is None:
+            self._column_ranges = _nanrange(self._columns_array(), axis=1)
+        return _profile_range(self._columns_array()[index], self._column_ranges[index],
+                              start, stop)
+
+
+def _nanrange(array, axis=None):
+    with warnings.catch_warnings():
+        # all-nan slices are expected and result in a nan range
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return np.stack([np.nanmin(array, axis=axis), np.nanmax(array, axis=axis)], axis=-1)
+
+
+def _profile_range(profile, full_range, start, stop):
+    if ((start is None or start <= 0)
+            and (stop is None or stop >= len(profile))):
+        return tuple(full_range)
+    return tuple(_nanrange(profile[start:stop]))
+
+
+def _decimate_profile(x, y, max_points=MAX_PROFILE_POINTS):
+    """
+    Reduce a line profile to at most ``max_points`` points for plotting by keeping
+    the minimum and maximum of consecutive bins of points, so that narrow features
+    (e.g., spikes or NaN gaps) remain visible.
+    """
+    if len(y) <= max_points:
+        return x, y
+    x, y = np.asarray(x), np.asarray(y)
+    n_bins = max(max_points // 2, 1)
+    starts = np.linspace(0, len(y), n_bins, endpoint=False).astype(int)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        # fmin/fmax ignore NaNs unless all values in a bin are NaN, in which case the
+        # gap is kept in the decimated profile
+        y_min = np.fmin.reduceat(y, starts)
+        y_max = np.fmax.reduceat(y, starts)
+    return np.repeat(x[starts], 2), np.column_stack([y_min, y_max]).ravel()
+
+
 def _get_celestial_wcs(wcs):
     """ If `wcs` has a celestial component return that, otherwise return None """
     if isinstance(wcs, gwcs) and not type(wcs) is SpectralGWCS: